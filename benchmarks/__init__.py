@@ -0,0 +1 @@
+"""Benchmarks for the Virtual AC integration."""
@@ -0,0 +1,275 @@
+"""Benchmarks for simulation ticks, coordinator fan-out and service dispatch.
+
+Run with: python -m pytest benchmarks/bench_virtual_ac.py
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN, HVACMode
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.virtual_ac.const import (
+    CONF_AMBIENT_TEMP,
+    CONF_INITIAL_TEMP,
+    CONF_NEIGHBORS,
+    CONF_THERMAL_MODEL,
+    DATA_CLOCK,
+    DATA_ENTITY_INDEX,
+    DOMAIN,
+    THERMAL_MODEL_RC,
+)
+from custom_components.virtual_ac.stats import async_get_stats
+
+from .conftest import UNIT_COUNTS, async_setup_units, climate_entity_ids
+
+# Repetitions per measurement
+ROUNDS = 20
+
+
+async def _async_start_cooling(hass: HomeAssistant, entity_ids: list[str]) -> None:
+    """Put every unit in COOL mode with a target far below the room temperature."""
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        "set_hvac_mode",
+        {ATTR_ENTITY_ID: entity_ids, "hvac_mode": HVACMode.COOL},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        "set_temperature",
+        {ATTR_ENTITY_ID: entity_ids, "temperature": 16},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("units", UNIT_COUNTS)
+async def test_update_simulation_throughput(
+    hass: HomeAssistant, units: int, record: Callable[..., None]
+) -> None:
+    """Measure how many unit updates _update_simulation handles per second."""
+    await async_setup_units(hass, units)
+    entity_ids = climate_entity_ids(units)
+    await _async_start_cooling(hass, entity_ids)
+    index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+    climates = [index.get(entity_id) for entity_id in entity_ids]
+
+    elapsed = 0.0
+    for _ in range(ROUNDS):
+        # Pretend one second passed since the last update of every unit
+        for climate in climates:
+            climate._last_update -= 1.0
+        start = time.perf_counter()
+        for climate in climates:
+            climate._update_simulation()
+        elapsed += time.perf_counter() - start
+        await hass.async_block_till_done()
+
+    record("update_simulation_throughput", units, units * ROUNDS / elapsed, "updates/s")
+
+
+@pytest.mark.parametrize("units", UNIT_COUNTS)
+async def test_coordinator_fan_out(
+    hass: HomeAssistant, units: int, record: Callable[..., None]
+) -> None:
+    """Measure the cost of one coordinator update reaching its sensors."""
+    entries = await async_setup_units(hass, units)
+    coordinators = [hass.data[DOMAIN][entry.entry_id]["coordinator"] for entry in entries]
+
+    elapsed = 0.0
+    for round_ in range(ROUNDS):
+        start = time.perf_counter()
+        for coordinator in coordinators:
+            coordinator.update(current_temperature=20.0 + round_, current_humidity=40.0 + round_)
+        await hass.async_block_till_done()
+        elapsed += time.perf_counter() - start
+
+    record("coordinator_fan_out", units, elapsed / (units * ROUNDS) * 1e6, "us/update")
+
+
+@pytest.mark.parametrize("units", UNIT_COUNTS)
+async def test_set_state_latency(
+    hass: HomeAssistant, units: int, record: Callable[..., None]
+) -> None:
+    """Measure set_state latency for one call targeting every unit."""
+    await async_setup_units(hass, units)
+    entity_ids = climate_entity_ids(units)
+
+    elapsed = 0.0
+    for round_ in range(ROUNDS):
+        start = time.perf_counter()
+        await hass.services.async_call(
+            DOMAIN,
+            "set_state",
+            {ATTR_ENTITY_ID: entity_ids, "current_temperature": 20.0 + round_},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+        elapsed += time.perf_counter() - start
+    record("set_state_latency", units, elapsed / ROUNDS * 1e3, "ms/call")
+
+    elapsed = 0.0
+    for round_ in range(ROUNDS):
+        start = time.perf_counter()
+        await hass.services.async_call(
+            DOMAIN,
+            "set_state",
+            {
+                "entities": {
+                    entity_id: {"current_temperature": 20.0 + round_ + index / units}
+                    for index, entity_id in enumerate(entity_ids)
+                }
+            },
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+        elapsed += time.perf_counter() - start
+    record("set_state_bulk_latency", units, elapsed / ROUNDS * 1e3, "ms/call")
+
+
+@pytest.mark.parametrize("units", UNIT_COUNTS)
+async def test_sync_from_entities_latency(
+    hass: HomeAssistant, units: int, record: Callable[..., None]
+) -> None:
+    """Measure sync_from_entities latency for one call targeting every unit."""
+    await async_setup_units(hass, units)
+    entity_ids = climate_entity_ids(units)
+
+    elapsed = 0.0
+    for round_ in range(ROUNDS):
+        hass.states.async_set(
+            "climate.source",
+            HVACMode.COOL,
+            {"current_temperature": 20.0 + round_, "current_humidity": 40.0 + round_},
+        )
+        hass.states.async_set(
+            "weather.source", "sunny", {"temperature": 30.0 + round_, "humidity": 60.0}
+        )
+        start = time.perf_counter()
+        await hass.services.async_call(
+            DOMAIN,
+            "sync_from_entities",
+            {
+                ATTR_ENTITY_ID: entity_ids,
+                "climate_entity": "climate.source",
+                "weather_entity": "weather.source",
+            },
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+        elapsed += time.perf_counter() - start
+    record("sync_from_entities_latency", units, elapsed / ROUNDS * 1e3, "ms/call")
+
+
+@pytest.mark.parametrize("units", UNIT_COUNTS)
+async def test_state_writes_per_simulated_minute(
+    hass: HomeAssistant, units: int, record: Callable[..., None], freezer
+) -> None:
+    """Count state writes of all entities while cooling for one simulated minute."""
+    await async_setup_units(hass, units)
+    await _async_start_cooling(hass, climate_entity_ids(units))
+
+    writes = 0
+
+    @callback
+    def _count(event: Event) -> None:
+        nonlocal writes
+        if event.data["entity_id"].split(".", 1)[1].startswith("bench_ac_"):
+            writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count)
+    for _ in range(60):
+        freezer.tick(timedelta(seconds=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    unsub()
+
+    record("state_writes_per_simulated_minute", units, writes / units, "writes/unit/min", total=writes)
+
+
+@pytest.mark.parametrize("units", UNIT_COUNTS)
+async def test_startup(
+    hass: HomeAssistant, units: int, record: Callable[..., None], freezer
+) -> None:
+    """Measure the CPU time the units use while Home Assistant is starting.
+
+    The frozen clock stops perf_counter, so CPU time is measured instead.
+    """
+    hass.set_state(CoreState.starting)
+    start = time.process_time()
+    entries = await async_setup_units(hass, units)
+    # Other integrations keep Home Assistant starting for a while
+    for _ in range(30):
+        freezer.tick(timedelta(seconds=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    elapsed = time.process_time() - start
+    ticks = sum(async_get_stats(hass, entry.entry_id).ticks for entry in entries)
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    record("startup_cpu_time", units, elapsed * 1e3, "ms", ticks_while_starting=ticks)
+
+
+# Final zone temperatures of test_building_day_accuracy, by number of steps
+_DAY_TEMPERATURES: dict[int, list[float]] = {}
+
+
+@pytest.mark.parametrize("steps", (8640, 1))
+async def test_building_day_accuracy(
+    hass: HomeAssistant, steps: int, record: Callable[..., None]
+) -> None:
+    """Step two coupled zones through one simulated day in steps of equal length.
+
+    One cools while the other is off, so their walls carry heat all day.
+    One step of 24 hours has to end where 8640 steps of 10 seconds end.
+    """
+    await async_setup_units(
+        hass,
+        2,
+        **{
+            CONF_THERMAL_MODEL: THERMAL_MODEL_RC,
+            CONF_INITIAL_TEMP: 28,
+            CONF_AMBIENT_TEMP: 32,
+            CONF_NEIGHBORS: climate_entity_ids(2),
+        },
+    )
+    cooling, idle = climate_entity_ids(2)
+    await _async_start_cooling(hass, [cooling])
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        "set_temperature",
+        {ATTR_ENTITY_ID: cooling, "temperature": 21},
+        blocking=True,
+    )
+    clock = hass.data[DOMAIN][DATA_CLOCK]
+    clock.async_set_speed(0)
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        clock.async_advance(86400 / steps)
+    await hass.async_block_till_done()
+    elapsed = time.perf_counter() - start
+
+    index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+    temperatures = [index.get(entity_id).current_temperature for entity_id in (cooling, idle)]
+    _DAY_TEMPERATURES[steps] = temperatures
+    record("building_day", 2, elapsed * 1e3, "ms", steps=steps, temperatures=temperatures)
+    if steps != 8640 and 8640 in _DAY_TEMPERATURES:
+        for value, reference in zip(temperatures, _DAY_TEMPERATURES[8640]):
+            assert value == pytest.approx(reference, abs=0.25)
@@ -0,0 +1,101 @@
+"""Fixtures for the Virtual AC benchmarks."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.virtual_ac.const import (
+    CONF_SIMULATION_MODE,
+    CONF_UPDATE_INTERVAL,
+    DOMAIN,
+    SIMULATION_MODE_REALISTIC,
+)
+
+# Numbers of configured units every scaled benchmark runs with
+UNIT_COUNTS = (1, 100, 1000)
+
+# Where the JSON report is written, relative to the repository root by default
+OUTPUT_ENV = "VIRTUAL_AC_BENCHMARK_OUTPUT"
+DEFAULT_OUTPUT = Path(__file__).parent / "results.json"
+
+_RESULTS: list[dict[str, Any]] = []
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture
+def record() -> Callable[..., None]:
+    """Return a function that adds one measurement to the JSON report."""
+
+    def _record(benchmark: str, units: int, value: float, unit: str, **extra: Any) -> None:
+        _RESULTS.append(
+            {"benchmark": benchmark, "units": units, "value": value, "unit": unit, **extra}
+        )
+
+    return _record
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Write all measurements of the session as one JSON document."""
+    if not _RESULTS:
+        return
+    output = Path(os.environ.get(OUTPUT_ENV, DEFAULT_OUTPUT))
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "results": _RESULTS,
+    }
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+async def async_setup_units(
+    hass: HomeAssistant, count: int, **options: Any
+) -> list[MockConfigEntry]:
+    """Set up count realistic-mode units and return their config entries."""
+    entries = []
+    for index in range(count):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"Bench AC {index}",
+            data={
+                CONF_NAME: f"Bench AC {index}",
+                CONF_SIMULATION_MODE: SIMULATION_MODE_REALISTIC,
+                CONF_UPDATE_INTERVAL: 10,
+                **options,
+            },
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+    # Setting up the integration sets up every entry added above
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    return entries
+
+
+def climate_entity_ids(count: int) -> list[str]:
+    """Return the climate entity IDs of the units set up by async_setup_units."""
+    return [f"climate.bench_ac_{index}" for index in range(count)]
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Run the async benchmarks and fixtures without explicit markers."""
+    config.option.asyncio_mode = "auto"
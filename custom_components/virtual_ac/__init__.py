@@ -2,19 +2,55 @@
 
 from __future__ import annotations
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant
 
-from .const import DOMAIN
+from .clock import VirtualACClock
+from .building import VirtualACBuilding
+from .const import (
+    DATA_BUILDING,
+    DATA_CLOCK,
+    DATA_ENTITY_INDEX,
+    DATA_SCENARIOS,
+    DATA_SCHEDULER,
+    DATA_STORE,
+    DOMAIN,
+)
 from .coordinator import VirtualACCoordinator
+from .entity_index import VirtualACEntityIndex
+from .scenario import VirtualACScenarios
+from .scheduler import VirtualACScheduler
 from .services import async_setup_services
+from .storage import VirtualACStore
 
 PLATFORMS: list[Platform] = [Platform.CLIMATE, Platform.SENSOR, Platform.SELECT]
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Virtual AC integration."""
+    # One scheduler ticks every realistic-mode unit of the integration
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][DATA_SCHEDULER] = VirtualACScheduler(hass)
+    # Units follow the shared simulation clock unless given their own
+    hass.data[DOMAIN][DATA_CLOCK] = VirtualACClock(hass)
+    # Services resolve their targets through the entity index
+    hass.data[DOMAIN][DATA_ENTITY_INDEX] = VirtualACEntityIndex()
+    # Units sharing walls are ticked together by the building
+    hass.data[DOMAIN][DATA_BUILDING] = VirtualACBuilding(hass)
+    # Scenario files play into units along their clock
+    hass.data[DOMAIN][DATA_SCENARIOS] = VirtualACScenarios(hass)
+    # Units resume from the simulation state saved before the last restart
+    store = VirtualACStore(hass)
+    await store.async_load()
+    hass.data[DOMAIN][DATA_STORE] = store
+
+    async def async_stop(_event: Event) -> None:
+        """Stop simulating when Home Assistant stops."""
+        await _async_shutdown(hass)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop)
+
     # Set up services once for the integration
     async_setup_services(hass)
     return True
@@ -26,7 +62,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = {}
 
     # Create coordinator for sharing state between climate and sensors
-    coordinator = VirtualACCoordinator(entry)
+    coordinator = VirtualACCoordinator(hass, entry)
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = coordinator
 
     # Forward the setup to the platforms
@@ -40,5 +76,29 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not any(
+            other.state is ConfigEntryState.LOADED
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        ):
+            await _async_shutdown(hass)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the saved simulation state of a deleted config entry."""
+    if DOMAIN in hass.data and DATA_STORE in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_STORE].async_remove(entry.entry_id)
+
+
+async def _async_shutdown(hass: HomeAssistant) -> None:
+    """Stop the scenarios, timers and alarms of all units, and save their state."""
+    data = hass.data[DOMAIN]
+    data[DATA_SCENARIOS].async_stop()
+    data[DATA_SCHEDULER].async_shutdown()
+    data[DATA_CLOCK].async_shutdown()
+    for climate_entity in data[DATA_ENTITY_INDEX].climates():
+        if climate_entity.clock is not data[DATA_CLOCK]:
+            climate_entity.clock.async_shutdown()
+    await data[DATA_STORE].async_flush()
@@ -0,0 +1,316 @@
+"""Multi-zone buildings of Virtual AC units coupled through shared walls."""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_CLOCK, DATA_ENTITY_INDEX, DATA_SCHEDULER, DOMAIN
+from .stats import VirtualACStats
+
+if TYPE_CHECKING:
+    from .climate import VirtualACClimate
+
+_LOGGER = logging.getLogger(__name__)
+
+# Largest temperature difference (°C) across a wall that counts as settled
+EXCHANGE_SETTLED = 0.01
+
+# Relative residual at which the heat exchange solve stops
+SOLVER_TOLERANCE = 1e-12
+
+# Longest step (simulated minutes) between two heat exchanges. The zones
+# advance on their own models between exchanges, so longer gaps, such as a
+# step of the clock or the catch-up after a restart, are split into steps
+# no longer than this to give the same result as ticking through them.
+EXCHANGE_STEP_MINUTES = 1.0
+
+# A wall between the zones at two indexes, with its conductance (W/K)
+Wall = tuple[int, int, float]
+
+
+def exchange_heat(
+    temperatures: Sequence[float],
+    heat_capacities: Sequence[float],
+    walls: Sequence[Wall],
+    minutes: float,
+) -> list[float]:
+    """Return the temperatures after exchanging heat through the walls for minutes.
+
+    The exchange is one implicit (backward Euler) step of the coupled
+    zones, (C + dt·K) T' = C·T, where C holds the heat capacities and K is
+    the Laplacian of the wall conductances. The step is stable for any
+    length, never overshoots and conserves the total heat of the zones.
+    The system is symmetric positive definite and as sparse as the walls,
+    so it is solved by a Jacobi-preconditioned conjugate gradient that
+    costs O(zones + walls) per iteration, warm started at T.
+    """
+    count = len(temperatures)
+    seconds = minutes * 60.0
+    diagonal = list(heat_capacities)
+    links: list[tuple[int, int, float]] = []
+    for first, second, conductance in walls:
+        weight = conductance * seconds
+        diagonal[first] += weight
+        diagonal[second] += weight
+        links.append((first, second, weight))
+
+    def product(vector: list[float]) -> list[float]:
+        """Return (C + dt·K) · vector."""
+        result = [d * v for d, v in zip(diagonal, vector)]
+        for first, second, weight in links:
+            result[first] -= weight * vector[second]
+            result[second] -= weight * vector[first]
+        return result
+
+    solution = list(temperatures)
+    rhs = [c * t for c, t in zip(heat_capacities, temperatures)]
+    residual = [b - a for b, a in zip(rhs, product(solution))]
+    tolerance = SOLVER_TOLERANCE * math.sqrt(sum(b * b for b in rhs))
+    preconditioned = [r / d for r, d in zip(residual, diagonal)]
+    direction = list(preconditioned)
+    rho = sum(r * z for r, z in zip(residual, preconditioned))
+    for _ in range(count):
+        if math.sqrt(sum(r * r for r in residual)) <= tolerance:
+            break
+        projected = product(direction)
+        alpha = rho / sum(p * q for p, q in zip(direction, projected))
+        solution = [x + alpha * p for x, p in zip(solution, direction)]
+        residual = [r - alpha * q for r, q in zip(residual, projected)]
+        preconditioned = [r / d for r, d in zip(residual, diagonal)]
+        next_rho = sum(r * z for r, z in zip(residual, preconditioned))
+        direction = [z + next_rho / rho * p for z, p in zip(preconditioned, direction)]
+        rho = next_rho
+    return solution
+
+
+class _BuildingStats(VirtualACStats):
+    """Counters of a building that also count its ticks on every zone."""
+
+    def __init__(self, building: VirtualACBuilding) -> None:
+        """Initialize the counters of the building."""
+        super().__init__()
+        self._building = building
+
+    def record_tick(self, duration: float, lateness: float) -> None:
+        """Add a building tick, and a share of it to every zone."""
+        super().record_tick(duration, lateness)
+        zones = self._building._order
+        # Zones of a building share its cost evenly
+        for zone in zones:
+            zone.stats.record_tick(duration / len(zones), lateness)
+
+
+class VirtualACBuilding:
+    """Zones that exchange heat through shared walls, simulated together.
+
+    A unit becomes a zone when its options declare neighbours, or when a
+    zone declares it. Zones leave the scheduler and the building ticks them
+    as a single unit at the shortest interval among them: every zone first
+    advances on its own thermal model, then one implicit step exchanges the
+    heat through all walls at once. A wall declared from both sides counts
+    once, with the mean of the declared conductances.
+
+    The building sleeps and parks like a unit, once no wall carries a
+    noticeable temperature difference.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty building."""
+        self.hass = hass
+        self._clock = hass.data[DOMAIN][DATA_CLOCK]
+        self._scheduler = hass.data[DOMAIN][DATA_SCHEDULER]
+        self._index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+        # Zones with the conductance (W/K) of the walls they declare, by neighbour entity ID
+        self._zones: dict[VirtualACClimate, dict[str, float]] = {}
+        self._order: list[VirtualACClimate] = []
+        self._walls: list[Wall] = []
+        self._interval = 0
+        # Simulated time of the last heat exchange, see VirtualACClock.time
+        self._last_update: float | None = None
+        # Temperature and humidity of zones last published before a sync moved them
+        self._published: dict[VirtualACClimate, tuple[float, float]] = {}
+        self.stats = _BuildingStats(self)
+
+    def __contains__(self, zone: VirtualACClimate) -> bool:
+        """Return True if the unit is a zone of the building."""
+        return zone in self._zones
+
+    @property
+    def entity_id(self) -> str:
+        """Return the name of the building in scheduler logs."""
+        return "building"
+
+    @property
+    def vectorizable(self) -> bool:
+        """Return False, the fleet engine does not couple units."""
+        return False
+
+    @property
+    def update_interval(self) -> int:
+        """Return the shortest update interval of the zones."""
+        return self._interval
+
+    def is_zone(self, unit: VirtualACClimate) -> bool:
+        """Return True if the unit shares a wall with the building."""
+        if unit.clock is not self._clock:
+            # Zones exchange heat at the same simulated time
+            return False
+        if any(unit is not self._index.get(entity_id) for entity_id in unit.walls):
+            return True
+        return any(
+            self._index.get(entity_id) is unit
+            for walls in self._zones.values()
+            for entity_id in walls
+        )
+
+    @callback
+    def async_add(self, zone: VirtualACClimate) -> bool:
+        """Simulate a unit as a zone and return True, or False if it has no walls."""
+        if zone in self or not self.is_zone(zone):
+            return False
+        self.async_sync()
+        self._zones[zone] = zone.walls
+        if self._last_update is None:
+            self._last_update = self._clock.time()
+        self._rebuild()
+        # Neighbours already running on their own join as well
+        for entity_id in zone.walls:
+            if (neighbour := self._index.get(entity_id)) is not None and neighbour not in self:
+                neighbour.async_join_building()
+        return True
+
+    @callback
+    def async_remove(self, zone: VirtualACClimate) -> None:
+        """Stop simulating a unit as a zone."""
+        if zone not in self:
+            return
+        self.async_sync()
+        del self._zones[zone]
+        self._published.pop(zone, None)
+        if not self._zones:
+            self._last_update = None
+        self._rebuild()
+
+    @callback
+    def async_wake(self) -> None:
+        """Tick the building again after an input of a zone changed."""
+        self._scheduler.async_wake(self)
+
+    @callback
+    def async_sync(self) -> None:
+        """Integrate every zone up to now before an input changes."""
+        if self._last_update is None:
+            return
+        for zone in self._order:
+            self._published.setdefault(
+                zone, (zone.current_temperature, zone.current_humidity)
+            )
+        self._advance(self._clock.time())
+
+    def async_simulation_tick(self) -> float | None:
+        """Advance all zones by one scheduler tick.
+
+        Returns the real seconds until the next observable change, or None
+        once every zone has settled and no wall carries heat.
+        """
+        published = {
+            zone: self._published.pop(zone, (zone.current_temperature, zone.current_humidity))
+            for zone in self._order
+        }
+        now = self._clock.time()
+        elapsed = self._advance(now)
+        for zone, minutes in zip(self._order, elapsed):
+            zone.async_publish_simulation(now, minutes, *published[zone])
+
+        temperatures = [zone.current_temperature for zone in self._order]
+        if any(
+            abs(temperatures[first] - temperatures[second]) > EXCHANGE_SETTLED
+            for first, second, _ in self._walls
+        ):
+            return self._interval
+        delays = [
+            delay for zone in self._order if (delay := zone.next_change_delay()) is not None
+        ]
+        return min(delays, default=None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the zones, walls and counters for diagnostics."""
+        return {
+            "zones": [zone.entity_id for zone in self._order],
+            "walls": [
+                [self._order[first].entity_id, self._order[second].entity_id, conductance]
+                for first, second, conductance in self._walls
+            ],
+            "stats": self.stats.as_dict(),
+        }
+
+    def _advance(self, now: float) -> list[float]:
+        """Advance every zone to now and return their elapsed minutes.
+
+        Each step first advances the zones on their own models and then
+        exchanges the heat through the walls over the same step. The split
+        only holds for steps short against the dynamics of the zones, so
+        steps longer than EXCHANGE_STEP_MINUTES are subdivided.
+        """
+        start = self._last_update
+        minutes = max(0.0, (now - start) / 60.0)
+        self._last_update = now
+        steps = max(1, math.ceil(minutes / EXCHANGE_STEP_MINUTES)) if self._walls else 1
+        elapsed = [0.0] * len(self._order)
+        for step in range(1, steps + 1):
+            until = now if step == steps else start + (now - start) * step / steps
+            elapsed = [
+                total + zone.async_advance_simulation(until)
+                for total, zone in zip(elapsed, self._order)
+            ]
+            if minutes > 0 and self._walls:
+                self._exchange(minutes / steps)
+        return elapsed
+
+    def _exchange(self, minutes: float) -> None:
+        """Exchange heat between the zones through the walls for minutes."""
+        temperatures = exchange_heat(
+            [zone.current_temperature for zone in self._order],
+            [zone.heat_capacity for zone in self._order],
+            self._walls,
+            minutes,
+        )
+        for zone, temperature in zip(self._order, temperatures):
+            zone.async_exchange_heat(temperature)
+
+    def _rebuild(self) -> None:
+        """Recompute the walls and the interval, and reschedule the building."""
+        self._order = list(self._zones)
+        positions = {zone: position for position, zone in enumerate(self._order)}
+        declared: dict[tuple[int, int], list[float]] = {}
+        for zone, walls in self._zones.items():
+            for entity_id, conductance in walls.items():
+                neighbour = self._index.get(entity_id)
+                if neighbour is None or neighbour is zone or neighbour not in positions:
+                    continue
+                key = tuple(sorted((positions[zone], positions[neighbour])))
+                declared.setdefault(key, []).append(conductance)
+        self._walls = [
+            (first, second, sum(values) / len(values))
+            for (first, second), values in declared.items()
+        ]
+
+        interval = min((zone.update_interval for zone in self._order), default=0)
+        if self._scheduler.is_registered(self) and interval != self._interval:
+            # The scheduler groups units by interval
+            self._scheduler.async_unregister(self)
+        self._interval = interval
+        if not self._order:
+            self._scheduler.async_unregister(self)
+        elif self._scheduler.is_registered(self):
+            self._scheduler.async_wake(self)
+        else:
+            self._scheduler.async_register(self)
+        _LOGGER.debug(
+            "Building has %d zones and %d walls", len(self._order), len(self._walls)
+        )
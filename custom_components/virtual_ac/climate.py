@@ -2,25 +2,37 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from datetime import datetime
+import math
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.components.climate import (
+    ATTR_CURRENT_HUMIDITY,
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_FAN_MODE,
+    ATTR_PRESET_MODE,
+    ATTR_SWING_MODE,
     ClimateEntity,
     ClimateEntityFeature,
+    HVACAction,
     HVACMode,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, CONF_NAME, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
+    DATA_CLOCK,
+    DATA_ENTITY_INDEX,
+    DATA_SCHEDULER,
+    DATA_BUILDING,
+    DATA_STORE,
     CONF_INITIAL_TEMP,
     CONF_INITIAL_HUMIDITY,
     CONF_TEMP_UNIT,
@@ -35,6 +47,23 @@ from .const import (
     CONF_AMBIENT_HUMIDITY,
     CONF_AMBIENT_DRIFT_RATE,
     CONF_UPDATE_INTERVAL,
+    CONF_THERMAL_MODEL,
+    CONF_AC_CAPACITY,
+    CONF_ROOM_VOLUME,
+    CONF_ENVELOPE_UA,
+    CONF_THERMAL_MASS,
+    CONF_MIN_RUN_TIME,
+    CONF_MIN_OFF_TIME,
+    CONF_STARTUP_RAMP,
+    CONF_DEFROST_INTERVAL,
+    CONF_DEFROST_DURATION,
+    CONF_DUPLICATE_ATTRIBUTES,
+    CONF_NEIGHBORS,
+    CONF_WALL_UA,
+    CONF_FOLLOW_CLIMATE_ENTITY,
+    CONF_FOLLOW_WEATHER_ENTITY,
+    CONF_FOLLOW_MIN_INTERVAL,
+    CONF_FOLLOW_DEADBAND,
     DEFAULT_INITIAL_TEMP,
     DEFAULT_INITIAL_HUMIDITY,
     DEFAULT_TEMP_UNIT,
@@ -49,8 +78,24 @@ from .const import (
     DEFAULT_AMBIENT_HUMIDITY,
     DEFAULT_AMBIENT_DRIFT_RATE,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_THERMAL_MODEL,
+    DEFAULT_AC_CAPACITY,
+    DEFAULT_ROOM_VOLUME,
+    DEFAULT_ENVELOPE_UA,
+    DEFAULT_THERMAL_MASS,
+    DEFAULT_MIN_RUN_TIME,
+    DEFAULT_MIN_OFF_TIME,
+    DEFAULT_STARTUP_RAMP,
+    DEFAULT_DEFROST_INTERVAL,
+    DEFAULT_DEFROST_DURATION,
+    DEFAULT_DUPLICATE_ATTRIBUTES,
+    DEFAULT_WALL_UA,
+    DOOR_OPEN_UA,
+    DEFAULT_FOLLOW_MIN_INTERVAL,
+    DEFAULT_FOLLOW_DEADBAND,
     SIMULATION_MODE_INSTANT,
     SIMULATION_MODE_REALISTIC,
+    THERMAL_MODEL_SIMPLE,
     PRESET_ECO,
     PRESET_COMFORT,
     PRESET_SLEEP,
@@ -62,9 +107,48 @@ from .const import (
     SWING_OFF,
     SWING_ON,
 )
+from .building import VirtualACBuilding
+from .clock import VirtualACClock
+from .energy import ENERGY_PRECISION, electrical_energy, electrical_power, energy_step_minutes
+from .follow import VirtualACFollower
+from .psychrometrics import moisture_content, relative_humidity, saturation_moisture
+from .simulation import (
+    COMPRESSOR_COOLING,
+    COMPRESSOR_DEFROSTING,
+    COMPRESSOR_HEATING,
+    COMPRESSOR_OFF,
+    COOL_COIL_TEMPERATURE,
+    DRY_COIL_TEMPERATURE,
+    SimulationParams,
+    SimulationState,
+    advance_with_load,
+    compressor_minutes,
+    compressor_state,
+    next_change_minutes,
+    room_heat_capacity,
+)
+from .stats import VirtualACStats, async_get_stats
+from .storage import VirtualACStore
+from .trace import VirtualACTrace
 
 _LOGGER = logging.getLogger(__name__)
 
+# Options written by follow mode
+_FOLLOW_OPTIONS = (
+    CONF_FOLLOW_CLIMATE_ENTITY,
+    CONF_FOLLOW_WEATHER_ENTITY,
+    CONF_FOLLOW_MIN_INTERVAL,
+    CONF_FOLLOW_DEADBAND,
+)
+
+# What the unit does while its compressor is in each state; Home Assistant
+# versions without HVACAction.DEFROSTING show a defrost as idle
+_COMPRESSOR_ACTIONS = {
+    COMPRESSOR_COOLING: HVACAction.COOLING,
+    COMPRESSOR_HEATING: HVACAction.HEATING,
+    COMPRESSOR_DEFROSTING: getattr(HVACAction, "DEFROSTING", HVACAction.IDLE),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -79,6 +163,22 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
     """Virtual Air Conditioner Climate Entity."""
 
     _attr_has_entity_name = False
+    # Attributes left out of the recorder: settings that only change with the
+    # options, copies of core attributes, and values derived from them that
+    # change on every update and would otherwise add a row each time
+    _unrecorded_attributes = frozenset(
+        {
+            "simulation_mode",
+            "cooling_rate",
+            "heating_rate",
+            "ambient_temperature",
+            "humidity",
+            "target_temperature",
+            "temperature_difference",
+            "simulated_time",
+            "clock_speed",
+        }
+    )
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the Virtual AC climate entity."""
@@ -137,14 +237,18 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
         # Initial state
         self._attr_current_temperature = self._config.get(CONF_INITIAL_TEMP, DEFAULT_INITIAL_TEMP)
         self._attr_current_humidity = self._config.get(CONF_INITIAL_HUMIDITY, DEFAULT_INITIAL_HUMIDITY)
+        # Moisture content of the air (g/kg); the relative humidity is derived from it
+        self._moisture = moisture_content(self._attr_current_temperature, self._attr_current_humidity)
         self._attr_target_temperature = self._attr_current_temperature
         self._attr_hvac_mode = HVACMode.OFF
         self._attr_available = True
 
         # Initialize coordinator with initial values
         if self._coordinator:
-            self._coordinator.update_temperature(self._attr_current_temperature)
-            self._coordinator.update_humidity(self._attr_current_humidity)
+            self._coordinator.update(
+                current_temperature=self._attr_current_temperature,
+                current_humidity=self._attr_current_humidity,
+            )
 
         # Preset modes
         self._attr_preset_modes = [PRESET_ECO, PRESET_COMFORT, PRESET_SLEEP, PRESET_AWAY]
@@ -166,46 +270,101 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
         self._ambient_temp = self._config.get(CONF_AMBIENT_TEMP, DEFAULT_AMBIENT_TEMP)
         self._ambient_humidity = self._config.get(CONF_AMBIENT_HUMIDITY, DEFAULT_AMBIENT_HUMIDITY)
         self._ambient_drift_rate = self._config.get(CONF_AMBIENT_DRIFT_RATE, DEFAULT_AMBIENT_DRIFT_RATE)
+        # Disturbances set by set_state or a scenario
+        self._heat_gain = 0.0
+        self._door_open = False
         self._update_interval = self._config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        self._thermal_model = self._config.get(CONF_THERMAL_MODEL, DEFAULT_THERMAL_MODEL)
+        self._ac_capacity = self._config.get(CONF_AC_CAPACITY, DEFAULT_AC_CAPACITY)
+        self._heat_capacity = room_heat_capacity(
+            self._config.get(CONF_ROOM_VOLUME, DEFAULT_ROOM_VOLUME),
+            self._config.get(CONF_THERMAL_MASS, DEFAULT_THERMAL_MASS),
+        )
+        self._envelope_ua = self._config.get(CONF_ENVELOPE_UA, DEFAULT_ENVELOPE_UA)
+        self._neighbors: list[str] = self._config.get(CONF_NEIGHBORS, [])
+        self._wall_ua = self._config.get(CONF_WALL_UA, DEFAULT_WALL_UA)
+        self._min_run_time = self._config.get(CONF_MIN_RUN_TIME, DEFAULT_MIN_RUN_TIME)
+        self._min_off_time = self._config.get(CONF_MIN_OFF_TIME, DEFAULT_MIN_OFF_TIME)
+        self._startup_ramp = self._config.get(CONF_STARTUP_RAMP, DEFAULT_STARTUP_RAMP)
+        self._defrost_interval = self._config.get(CONF_DEFROST_INTERVAL, DEFAULT_DEFROST_INTERVAL)
+        self._defrost_duration = self._config.get(CONF_DEFROST_DURATION, DEFAULT_DEFROST_DURATION)
+        self._compressor = COMPRESSOR_OFF
+        # Simulated minutes since the compressor last switched, and of heating
+        # since the last defrost (or into the current one)
+        self._cycle_minutes = 0.0
+        self._defrost_minutes = 0.0
+        # Compressor starts, and whether the compressor of the simple model
+        # ran at the end of the last step
+        self._cycles = 0
+        self._running = False
+        self._written_action: HVACAction | None = None
+        # Total energy used (kWh), integrated by the realistic simulation
+        self._energy = 0.0
+        self._follower: VirtualACFollower | None = None
 
         # Initialize external values in coordinator (after ambient values are loaded)
         if self._coordinator:
-            self._coordinator.update_external_temperature(self._ambient_temp)
-            self._coordinator.update_external_humidity(self._ambient_humidity)
+            self._coordinator.update(
+                external_temperature=self._ambient_temp,
+                external_humidity=self._ambient_humidity,
+            )
 
         # Simulation state
-        self._simulation_task: asyncio.Task | None = None
-        self._last_update: datetime | None = None
+        self._scheduler = hass.data[DOMAIN][DATA_SCHEDULER]
+        self._clock: VirtualACClock = hass.data[DOMAIN][DATA_CLOCK]
+        self._store: VirtualACStore = hass.data[DOMAIN][DATA_STORE]
+        self._building: VirtualACBuilding = hass.data[DOMAIN][DATA_BUILDING]
+        self._unsub_clock: CALLBACK_TYPE | None = None
+        # Simulated time of the last simulation update, see VirtualACClock.time
+        self._last_update: float | None = None
+        # Simulated time of the restored state, caught up when the simulation starts
+        self._restored_time: float | None = None
         self._last_mode_change: datetime = datetime.now()
+        self._trace = VirtualACTrace()
+        self._stats = async_get_stats(hass, entry.entry_id)
+
+        # Publish the humidity and target_temperature copies of the core attributes
+        self._duplicate_attributes = self._config.get(
+            CONF_DUPLICATE_ATTRIBUTES, DEFAULT_DUPLICATE_ATTRIBUTES
+        )
+        # Cached extra state attributes, see extra_state_attributes
+        self._static_attributes: dict[str, Any] | None = None
+        self._attributes: dict[str, Any] = {}
+        self._attributes_key: tuple[Any, ...] | None = None
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
 
-        # Store reference to climate entity for service access (after entity is added)
-        if DOMAIN in self.hass.data and self._entry.entry_id in self.hass.data[DOMAIN]:
-            self.hass.data[DOMAIN][self._entry.entry_id]["climate_entity"] = self
+        # Index the climate entity for service access (after entity is added)
+        self.async_on_remove(
+            self.hass.data[DOMAIN][DATA_ENTITY_INDEX].async_add_climate(self)
+        )
+
+        # Catch up and reschedule when the simulation clock jumps
+        self._unsub_clock = self._clock.add_listener(self._async_clock_changed)
 
         # Get coordinator if not already set (fallback)
         if self._coordinator is None and DOMAIN in self.hass.data:
             if self._entry.entry_id in self.hass.data[DOMAIN]:
                 self._coordinator = self.hass.data[DOMAIN][self._entry.entry_id].get("coordinator")
 
-        # Restore state if available
-        if (last_state := await self.async_get_last_state()) is not None:
-            if last_state.attributes.get("temperature") is not None:
-                self._attr_current_temperature = float(last_state.attributes["temperature"])
-            if last_state.attributes.get("humidity") is not None:
-                self._attr_current_humidity = float(last_state.attributes["humidity"])
-            if last_state.attributes.get("target_temp_low") is not None:
-                self._attr_target_temperature = float(last_state.attributes["target_temp_low"])
+        # Resume from the saved simulation state, or from the last state
+        # written before the simulation state was saved
+        if (snapshot := self._store.get(self.entry_id)) is not None:
+            self._restore_snapshot(snapshot)
+        elif (last_state := await self.async_get_last_state()) is not None:
+            self._restore_last_state(last_state)
+        self.async_on_remove(self._store.async_add(self))
 
         # Update coordinator with current values
         if self._coordinator:
-            self._coordinator.update_temperature(self._attr_current_temperature)
-            self._coordinator.update_humidity(self._attr_current_humidity)
-            self._coordinator.update_external_temperature(self._ambient_temp)
-            self._coordinator.update_external_humidity(self._ambient_humidity)
+            self._coordinator.update(
+                current_temperature=self._attr_current_temperature,
+                current_humidity=self._attr_current_humidity,
+                external_temperature=self._ambient_temp,
+                external_humidity=self._ambient_humidity,
+            )
 
         # Log initialization
         device_name = self._entry.data.get(CONF_NAME, "Virtual AC")
@@ -221,23 +380,132 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
             self._update_interval,
         )
 
-        # Start simulation if in realistic mode
+        # Start simulation if in realistic mode; ticks wait until Home Assistant has started
         if self._simulation_mode == SIMULATION_MODE_REALISTIC:
             self._start_simulation()
+        self._restored_time = None
+
+        # Resume following source entities saved by sync_from_entities
+        self._start_following()
 
         # Write initial state to ensure entity is available
         self.async_write_ha_state()
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return the simulation state to save, with the simulated date it belongs to."""
+        now = self._clock.time()
+        since = now if self._last_update is None else self._last_update
+        return {
+            "time": (self._clock.now() - timedelta(seconds=now - since)).isoformat(),
+            "hvac_mode": self._attr_hvac_mode,
+            "temperature": self._attr_current_temperature,
+            "moisture": self._moisture,
+            "compressor": self._compressor,
+            "cycle_minutes": self._cycle_minutes,
+            "defrost_minutes": self._defrost_minutes,
+            "cycles": self._cycles,
+            "energy": self._energy,
+            "target_temperature": self._attr_target_temperature,
+            "fan_mode": self._attr_fan_mode,
+            "swing_mode": self._attr_swing_mode,
+            "preset_mode": self._attr_preset_mode,
+            "ambient": [self._ambient_temp, self._ambient_humidity],
+            "ambient_config": self._configured_ambient(),
+            "heat_gain": self._heat_gain,
+            "door_open": self._door_open,
+            "clock": self._own_clock(),
+        }
+
+    def _own_clock(self) -> dict[str, float] | None:
+        """Return the speed and lead (seconds) of the unit's own clock, None if it has none."""
+        shared = self.hass.data[DOMAIN][DATA_CLOCK]
+        if self._clock is shared:
+            return None
+        return {
+            "speed": self._clock.speed,
+            "offset": (self._clock.now() - shared.now()).total_seconds(),
+        }
+
+    def _configured_ambient(self) -> list[float]:
+        """Return the ambient temperature and humidity set in the options."""
+        return [
+            self._config.get(CONF_AMBIENT_TEMP, DEFAULT_AMBIENT_TEMP),
+            self._config.get(CONF_AMBIENT_HUMIDITY, DEFAULT_AMBIENT_HUMIDITY),
+        ]
+
+    def _restore_snapshot(self, snapshot: dict[str, Any]) -> None:
+        """Resume from a snapshot, catching up over the time since it was taken."""
+        self._attr_hvac_mode = HVACMode(snapshot["hvac_mode"])
+        self._attr_current_temperature = snapshot["temperature"]
+        self._moisture = snapshot["moisture"]
+        self._compressor = snapshot["compressor"]
+        self._cycle_minutes = snapshot.get("cycle_minutes", 0.0)
+        self._defrost_minutes = snapshot.get("defrost_minutes", 0.0)
+        self._cycles = snapshot.get("cycles", 0)
+        self._energy = snapshot.get("energy", 0.0)
+        self._attr_target_temperature = snapshot["target_temperature"]
+        self._attr_fan_mode = snapshot["fan_mode"]
+        self._attr_swing_mode = snapshot["swing_mode"]
+        self._attr_preset_mode = snapshot["preset_mode"]
+        # Ambient values from set_state or follow mode, unless the options changed since
+        if snapshot["ambient_config"] == self._configured_ambient():
+            self._ambient_temp, self._ambient_humidity = snapshot["ambient"]
+        self._heat_gain = snapshot.get("heat_gain", 0.0)
+        self._door_open = snapshot.get("door_open", False)
+        if (own_clock := snapshot.get("clock")) is not None:
+            clock = self.hass.data[DOMAIN][DATA_CLOCK].copy(own_clock["offset"])
+            clock.async_set_speed(own_clock["speed"])
+            self._set_clock(clock)
+        self._refresh_humidity()
+        self._restore_time(dt_util.parse_datetime(snapshot["time"]))
+
+    def _restore_last_state(self, last_state: State) -> None:
+        """Resume from the last state written by the climate entity."""
+        attributes = last_state.attributes
+        if last_state.state in self._attr_hvac_modes:
+            self._attr_hvac_mode = HVACMode(last_state.state)
+        if attributes.get(ATTR_CURRENT_TEMPERATURE) is not None:
+            self._attr_current_temperature = float(attributes[ATTR_CURRENT_TEMPERATURE])
+        if attributes.get(ATTR_CURRENT_HUMIDITY) is not None:
+            self._attr_current_humidity = float(attributes[ATTR_CURRENT_HUMIDITY])
+        if attributes.get(ATTR_TEMPERATURE) is not None:
+            self._attr_target_temperature = float(attributes[ATTR_TEMPERATURE])
+        self._attr_fan_mode = attributes.get(ATTR_FAN_MODE, self._attr_fan_mode)
+        self._attr_swing_mode = attributes.get(ATTR_SWING_MODE, self._attr_swing_mode)
+        self._attr_preset_mode = attributes.get(ATTR_PRESET_MODE, self._attr_preset_mode)
+        self._moisture = moisture_content(
+            self._attr_current_temperature, self._attr_current_humidity
+        )
+        self._restore_time(last_state.last_updated)
+
+    def _restore_time(self, saved: datetime | None) -> None:
+        """Remember the simulated time of a restored state for the catch-up."""
+        if saved is None:
+            return
+        offline = (self._clock.now() - saved).total_seconds()
+        self._restored_time = self._clock.time() - max(0.0, offline)
+
     async def async_will_remove_from_hass(self) -> None:
         """When entity is removed from hass."""
         await super().async_will_remove_from_hass()
         self._stop_simulation()
+        self._stop_following()
+        if self._unsub_clock is not None:
+            self._unsub_clock()
+            self._unsub_clock = None
+        if self._clock is not self.hass.data[DOMAIN][DATA_CLOCK]:
+            self._clock.async_shutdown()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
+        self._sync_simulation()
         old_mode = self._attr_hvac_mode
         self._attr_hvac_mode = hvac_mode
         self._last_mode_change = datetime.now()
+        # The compressor stops, and the thermostat of the new mode restarts
+        # it once the minimum off time has passed
+        if self._compressor != COMPRESSOR_OFF:
+            self._compressor, self._cycle_minutes = COMPRESSOR_OFF, 0.0
 
         _LOGGER.debug(
             "HVAC mode changed: %s -> %s (simulation_mode: %s, current_temp: %.2f°C, target_temp: %.2f°C)",
@@ -252,20 +520,22 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
             # Instant mode: update immediately
             await self._apply_instant_mode(hvac_mode)
         else:
-            # Realistic mode: start simulation if not running or if task is done
-            if self._simulation_task is None or self._simulation_task.done():
-                self._start_simulation()
+            # Realistic mode: start simulation, or tick again if it was idle
+            self._start_simulation()
 
         # Update coordinator (apply_instant_mode already does this, but ensure it's done)
         if self._coordinator:
-            self._coordinator.update_temperature(self._attr_current_temperature)
-            self._coordinator.update_humidity(self._attr_current_humidity)
+            self._coordinator.update(
+                current_temperature=self._attr_current_temperature,
+                current_humidity=self._attr_current_humidity,
+            )
 
         self.async_write_ha_state()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
+            self._sync_simulation()
             old_target = self._attr_target_temperature
             self._attr_target_temperature = temperature
 
@@ -282,11 +552,15 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
                 # In instant mode, update immediately for all active modes
                 if self._attr_hvac_mode != HVACMode.OFF:
                     await self._apply_instant_mode(self._attr_hvac_mode)
+            else:
+                self._wake_simulation()
 
         # Update coordinator
         if self._coordinator:
-            self._coordinator.update_temperature(self._attr_current_temperature)
-            self._coordinator.update_humidity(self._attr_current_humidity)
+            self._coordinator.update(
+                current_temperature=self._attr_current_temperature,
+                current_humidity=self._attr_current_humidity,
+            )
 
         self.async_write_ha_state()
 
@@ -296,33 +570,73 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
         current_humidity: float | None = None,
         external_temperature: float | None = None,
         external_humidity: float | None = None,
+        heat_gain: float | None = None,
+        door_open: bool | None = None,
     ) -> None:
         """Set current temperature and/or humidity for testing."""
+        self.async_apply_current_state(
+            current_temperature=current_temperature,
+            current_humidity=current_humidity,
+            external_temperature=external_temperature,
+            external_humidity=external_humidity,
+            heat_gain=heat_gain,
+            door_open=door_open,
+        )
+
+    @callback
+    def async_apply_current_state(
+        self,
+        current_temperature: float | None = None,
+        current_humidity: float | None = None,
+        external_temperature: float | None = None,
+        external_humidity: float | None = None,
+        heat_gain: float | None = None,
+        door_open: bool | None = None,
+    ) -> None:
+        """Apply current and external conditions without yielding to the loop.
+
+        Services updating many units call this for each of them in one pass,
+        so all coordinator notifications are flushed together afterwards.
+        """
+        self._sync_simulation()
+
         if current_temperature is not None:
             self._attr_current_temperature = current_temperature
-            if self._coordinator:
-                self._coordinator.update_temperature(current_temperature)
 
         if current_humidity is not None:
-            self._attr_current_humidity = current_humidity
-            if self._coordinator:
-                self._coordinator.update_humidity(current_humidity)
+            self._moisture = moisture_content(self._attr_current_temperature, current_humidity)
+        # A new temperature alone keeps the moisture, so the relative humidity follows it
+        self._refresh_humidity()
 
         if external_temperature is not None:
             self._ambient_temp = external_temperature
-            if self._coordinator:
-                self._coordinator.update_external_temperature(external_temperature)
+            self._static_attributes = None
 
         if external_humidity is not None:
             self._ambient_humidity = external_humidity
-            if self._coordinator:
-                self._coordinator.update_external_humidity(external_humidity)
 
+        if heat_gain is not None:
+            self._heat_gain = heat_gain
+
+        if door_open is not None:
+            self._door_open = door_open
+
+        if self._coordinator:
+            self._coordinator.update(
+                current_temperature=self._attr_current_temperature,
+                current_humidity=self._attr_current_humidity,
+                external_temperature=self._ambient_temp,
+                external_humidity=self._ambient_humidity,
+            )
+
+        self._wake_simulation()
         self.async_write_ha_state()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode."""
+        self._sync_simulation()
         self._attr_preset_mode = preset_mode
+        self._static_attributes = None
 
         # Adjust target temperature based on preset
         if preset_mode == PRESET_ECO:
@@ -347,16 +661,21 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
                 self._attr_target_temperature - 3.0,
             )
 
+        self._wake_simulation()
         self.async_write_ha_state()
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set fan mode."""
+        self._sync_simulation()
         self._attr_fan_mode = fan_mode
+        self._static_attributes = None
+        self._wake_simulation()
         self.async_write_ha_state()
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Set swing mode."""
         self._attr_swing_mode = swing_mode
+        self._static_attributes = None
         self.async_write_ha_state()
 
     async def _apply_instant_mode(self, hvac_mode: HVACMode) -> None:
@@ -366,22 +685,21 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
             if self._attr_current_temperature > self._attr_target_temperature:
                 self._attr_current_temperature = self._attr_target_temperature
             # If current <= target, temperature stays the same (can't heat in COOL mode)
-            # Slight humidity decrease
-            self._attr_current_humidity = max(0, self._attr_current_humidity - 1.0)
+            # The air dries down to saturation at the coil temperature
+            self._moisture = min(self._moisture, saturation_moisture(COOL_COIL_TEMPERATURE))
         elif hvac_mode == HVACMode.HEAT:
             # HEAT mode: can only increase temperature (or stay same if already at/above target)
             if self._attr_current_temperature < self._attr_target_temperature:
                 self._attr_current_temperature = self._attr_target_temperature
             # If current >= target, temperature stays the same (can't cool in HEAT mode)
-            # Slight humidity decrease
-            self._attr_current_humidity = max(0, self._attr_current_humidity - 0.5)
+            # The moisture stays, so the relative humidity drops as the air warms
         elif hvac_mode == HVACMode.DRY:
-            # Slight cooling and significant humidity decrease
+            # Slight cooling, and the air dries down to saturation at the colder DRY coil
             self._attr_current_temperature = max(
                 self._attr_min_temp,
                 self._attr_current_temperature - 1.0,
             )
-            self._attr_current_humidity = max(0, self._attr_current_humidity - 5.0)
+            self._moisture = min(self._moisture, saturation_moisture(DRY_COIL_TEMPERATURE))
         elif hvac_mode == HVACMode.FAN_ONLY:
             # No temperature change
             pass
@@ -394,91 +712,316 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
         elif hvac_mode == HVACMode.OFF:
             # In instant mode, immediately set to ambient values
             self._attr_current_temperature = self._ambient_temp
-            self._attr_current_humidity = self._ambient_humidity
+            self._moisture = moisture_content(self._ambient_temp, self._ambient_humidity)
             _LOGGER.debug(
                 "Instant OFF mode: Set to ambient (temp: %.2f°C, humidity: %.2f%%)",
                 self._ambient_temp,
                 self._ambient_humidity,
             )
+        self._refresh_humidity()
 
         # Update coordinator
         if self._coordinator:
-            self._coordinator.update_temperature(self._attr_current_temperature)
-            self._coordinator.update_humidity(self._attr_current_humidity)
+            self._coordinator.update(
+                current_temperature=self._attr_current_temperature,
+                current_humidity=self._attr_current_humidity,
+            )
 
-    def _start_simulation(self) -> None:
-        """Start the simulation task."""
-        if self._simulation_task is None or self._simulation_task.done():
-            _LOGGER.debug(
-                "Starting simulation loop: mode=%s, update_interval=%ds, heating_rate=%.2f°C/min, cooling_rate=%.2f°C/min",
-                self._attr_hvac_mode,
-                self._update_interval,
-                self._heating_rate,
-                self._cooling_rate,
+    @property
+    def entry_id(self) -> str:
+        """Return the config entry ID of this unit."""
+        return self._entry.entry_id
+
+    @property
+    def stats(self) -> VirtualACStats:
+        """Return the performance counters of this unit's config entry."""
+        return self._stats
+
+    @property
+    def trace(self) -> VirtualACTrace:
+        """Return the latest simulation ticks of this unit."""
+        return self._trace
+
+    @property
+    def clock(self) -> VirtualACClock:
+        """Return the simulation clock this unit follows."""
+        return self._clock
+
+    @callback
+    def async_use_own_clock(self) -> VirtualACClock:
+        """Detach the unit from the shared clock and return its own clock.
+
+        The new clock starts at the same time and speed as the shared one,
+        so the simulation continues seamlessly. Zones exchange heat at the
+        same simulated time, so they keep the shared clock.
+        """
+        shared = self.hass.data[DOMAIN][DATA_CLOCK]
+        if self._clock is shared:
+            if self._building.is_zone(self):
+                raise ValueError(
+                    f"{self.entity_id} shares walls with other units and cannot have a clock of its own."
+                )
+            self._sync_simulation()
+            self._set_clock(shared.copy())
+        return self._clock
+
+    @callback
+    def async_use_shared_clock(self) -> None:
+        """Move the unit from its own clock back onto the shared clock.
+
+        The unit keeps its state. If its clock fell behind the shared one,
+        it catches up over the difference, like after a restart.
+        """
+        shared = self.hass.data[DOMAIN][DATA_CLOCK]
+        if self._clock is shared:
+            return
+        self._sync_simulation()
+        behind = (shared.now() - self._clock.now()).total_seconds()
+        self._clock.async_shutdown()
+        self._set_clock(shared)
+        if self._last_update is not None:
+            self._last_update = shared.time() - max(0.0, behind)
+        # Units declared as neighbours join the building again
+        self.async_join_building()
+        self._async_clock_changed()
+
+    def _set_clock(self, clock: VirtualACClock) -> None:
+        """Follow a simulation clock from now on."""
+        if self._unsub_clock is not None:
+            self._unsub_clock()
+        self._clock = clock
+        self._unsub_clock = clock.add_listener(self._async_clock_changed)
+
+    @callback
+    def _async_clock_changed(self) -> None:
+        """Catch up after the simulation clock jumped or changed speed."""
+        if not self._simulating:
+            return
+        self._sync_simulation()
+        if self._coordinator:
+            self._coordinator.update(
+                current_temperature=self._attr_current_temperature,
+                current_humidity=self._attr_current_humidity,
             )
-            self._simulation_task = self.hass.async_create_task(self._simulation_loop())
-            self._last_update = datetime.now()
+        self._wake_simulation()
+        # Publish the new simulated time even if nothing else moved
+        self.async_write_ha_state()
 
-    def _stop_simulation(self) -> None:
-        """Stop the simulation task."""
-        if self._simulation_task is not None and not self._simulation_task.done():
-            _LOGGER.debug("Stopping simulation loop")
-            self._simulation_task.cancel()
-            self._simulation_task = None
-
-    async def _simulation_loop(self) -> None:
-        """Background task for realistic simulation."""
-        # Ensure _last_update is set before first iteration
-        if self._last_update is None:
-            self._last_update = datetime.now()
-            _LOGGER.debug("Simulation loop initialized, starting updates")
-
-        while True:
-            try:
-                await asyncio.sleep(self._update_interval)
-                await self._update_simulation()
-            except asyncio.CancelledError:
-                _LOGGER.debug("Simulation loop cancelled")
-                break
-            except Exception as e:
-                _LOGGER.error("Error in Virtual AC simulation loop: %s", e, exc_info=True)
-                break
-
-    async def _update_simulation(self) -> None:
-        """Update temperature and humidity based on current mode."""
-        now = datetime.now()
+    @property
+    def vectorizable(self) -> bool:
+        """Return True if the fleet engine can simulate this unit."""
+        return self._thermal_model == THERMAL_MODEL_SIMPLE
 
-        # Calculate elapsed time since last update
-        if self._last_update is None:
-            elapsed_minutes = self._update_interval / 60.0  # Use update interval as initial elapsed time
+    @property
+    def update_interval(self) -> int:
+        """Return the simulation update interval in seconds."""
+        return self._update_interval
+
+    @property
+    def heat_capacity(self) -> float:
+        """Return the heat capacity (J/K) of the room."""
+        return self._heat_capacity
+
+    @property
+    def walls(self) -> dict[str, float]:
+        """Return the conductance (W/K) of the walls shared with neighbours, by entity ID."""
+        return {
+            entity_id: self._wall_ua
+            for entity_id in self._neighbors
+            if entity_id != self.entity_id
+        }
+
+    @property
+    def _simulating(self) -> bool:
+        """Return True if the scheduler or the building ticks the unit."""
+        return self._scheduler.is_registered(self) or self in self._building
+
+    def _start_simulation(self) -> None:
+        """Register the unit with the building, or else the shared simulation scheduler."""
+        if self._simulating:
+            self._wake_simulation()
+            return
+        _LOGGER.debug(
+            "Starting simulation: mode=%s, update_interval=%ds, heating_rate=%.2f°C/min, cooling_rate=%.2f°C/min",
+            self._attr_hvac_mode,
+            self._update_interval,
+            self._heating_rate,
+            self._cooling_rate,
+        )
+        # The first tick advances from the restored state over the whole gap
+        if self._restored_time is not None:
+            self._last_update, self._restored_time = self._restored_time, None
         else:
-            elapsed_minutes = (now - self._last_update).total_seconds() / 60.0
+            self._last_update = self._clock.time()
+        if not self._building.async_add(self):
+            self._scheduler.async_register(self)
 
-        self._last_update = now
+    def _stop_simulation(self) -> None:
+        """Deregister the unit from the building or the shared simulation scheduler."""
+        if self in self._building:
+            _LOGGER.debug("Stopping simulation")
+            self._building.async_remove(self)
+        elif self._scheduler.is_registered(self):
+            _LOGGER.debug("Stopping simulation")
+            self._scheduler.async_unregister(self)
+
+    @callback
+    def _wake_simulation(self) -> None:
+        """Recompute the next change after a simulation input changed."""
+        if self in self._building:
+            self._building.async_wake()
+        elif self._scheduler.is_registered(self):
+            self._scheduler.async_wake(self)
+
+    @callback
+    def async_join_building(self) -> None:
+        """Move the unit from the scheduler into the building once a neighbour declared it."""
+        if not self._scheduler.is_registered(self):
+            return
+        self._sync_simulation()
+        self._scheduler.async_unregister(self)
+        if not self._building.async_add(self):
+            self._scheduler.async_register(self)
+
+    @callback
+    def async_follow(
+        self,
+        climate_entity_id: str | None,
+        weather_entity_id: str | None,
+        min_interval: float = DEFAULT_FOLLOW_MIN_INTERVAL,
+        deadband: float = DEFAULT_FOLLOW_DEADBAND,
+    ) -> None:
+        """Follow source entities and remember them across restarts."""
+        options = {
+            key: value
+            for key, value in self._entry.options.items()
+            if key not in _FOLLOW_OPTIONS
+        }
+        if climate_entity_id:
+            options[CONF_FOLLOW_CLIMATE_ENTITY] = climate_entity_id
+        if weather_entity_id:
+            options[CONF_FOLLOW_WEATHER_ENTITY] = weather_entity_id
+        options[CONF_FOLLOW_MIN_INTERVAL] = min_interval
+        options[CONF_FOLLOW_DEADBAND] = deadband
+        self.hass.config_entries.async_update_entry(self._entry, options=options)
+        self._start_following()
+
+    @callback
+    def async_unfollow(self) -> None:
+        """Stop following source entities and forget them."""
+        self._stop_following()
+        if any(key in self._entry.options for key in _FOLLOW_OPTIONS):
+            options = {
+                key: value
+                for key, value in self._entry.options.items()
+                if key not in _FOLLOW_OPTIONS
+            }
+            self.hass.config_entries.async_update_entry(self._entry, options=options)
+
+    def _start_following(self) -> None:
+        """Follow the source entities saved in the config entry options."""
+        self._stop_following()
+        options = self._entry.options
+        climate_entity_id = options.get(CONF_FOLLOW_CLIMATE_ENTITY)
+        weather_entity_id = options.get(CONF_FOLLOW_WEATHER_ENTITY)
+        if not climate_entity_id and not weather_entity_id:
+            return
+        _LOGGER.debug(
+            "Following climate=%s, weather=%s", climate_entity_id, weather_entity_id
+        )
+        self._follower = VirtualACFollower(
+            self.hass,
+            self,
+            climate_entity_id,
+            weather_entity_id,
+            options.get(CONF_FOLLOW_MIN_INTERVAL, DEFAULT_FOLLOW_MIN_INTERVAL),
+            options.get(CONF_FOLLOW_DEADBAND, DEFAULT_FOLLOW_DEADBAND),
+        )
+        self._follower.async_start()
+
+    def _stop_following(self) -> None:
+        """Stop pushing changes of source entities."""
+        if self._follower is not None:
+            self._follower.async_stop()
+            self._follower = None
+
+    @callback
+    def async_simulation_tick(self) -> float | None:
+        """Advance the simulation by one scheduler tick.
+
+        Returns the real seconds until the next observable change, or None
+        once the unit has settled (or its clock is paused) and only an input
+        change can move it again.
+        """
+        self._update_simulation()
+        return self.next_change_delay()
+
+    def next_change_delay(self) -> float | None:
+        """Return the real seconds until the next observable change, None if settled."""
+        minutes = next_change_minutes(
+            self._attr_hvac_mode,
+            self._simulation_state(),
+            self._simulation_params(),
+            self.precision,
+        )
+        minutes = min(math.inf if minutes is None else minutes, self.next_energy_minutes())
+        return self._clock.real_delay(None if minutes == math.inf else minutes * 60.0)
 
-        # Get fan speed multiplier
-        fan_multiplier = self._get_fan_multiplier()
+    def next_energy_minutes(self) -> float:
+        """Return the simulated minutes until the published energy moves, infinity if never.
+
+        Units holding their target keep drawing power without any other
+        observable change, so they still tick for the energy sensor.
+        """
+        return energy_step_minutes(self.power)
 
+    @property
+    def power(self) -> float:
+        """Return the electrical power (W) the unit draws now."""
+        return electrical_power(
+            self._attr_hvac_mode, self._simulation_state(), self._simulation_params()
+        )
+
+    @callback
+    def _update_simulation(self) -> None:
+        """Update temperature and humidity based on current mode."""
         old_temp = self._attr_current_temperature
         old_humidity = self._attr_current_humidity
 
-        # Update based on HVAC mode
-        if self._attr_hvac_mode == HVACMode.COOL:
-            await self._simulate_cooling(elapsed_minutes, fan_multiplier)
-        elif self._attr_hvac_mode == HVACMode.HEAT:
-            await self._simulate_heating(elapsed_minutes, fan_multiplier)
-        elif self._attr_hvac_mode == HVACMode.DRY:
-            await self._simulate_dry(elapsed_minutes, fan_multiplier)
-        elif self._attr_hvac_mode == HVACMode.FAN_ONLY:
-            # No temperature change, slight humidity drift
-            pass
-        elif self._attr_hvac_mode == HVACMode.AUTO:
-            await self._simulate_auto(elapsed_minutes, fan_multiplier)
-        elif self._attr_hvac_mode == HVACMode.OFF:
-            await self._simulate_off(elapsed_minutes)
+        now = self._clock.time()
+        elapsed_minutes = self._advance_simulation(now)
+        self.async_publish_simulation(now, elapsed_minutes, old_temp, old_humidity)
+
+    @callback
+    def async_publish_simulation(
+        self, now: float, elapsed_minutes: float, old_temp: float, old_humidity: float
+    ) -> None:
+        """Record a tick and write the state if the temperature or humidity moved."""
+        fan_multiplier = self._get_fan_multiplier()
+        self._trace.record(
+            now,
+            self._attr_hvac_mode,
+            self._attr_current_temperature,
+            self._attr_current_humidity,
+            elapsed_minutes,
+            fan_multiplier,
+        )
 
-        # Log update summary if values changed
-        if abs(self._attr_current_temperature - old_temp) > 0.001 or abs(self._attr_current_humidity - old_humidity) > 0.1:
+        if (
+            self._attr_current_temperature == old_temp
+            and self._attr_current_humidity == old_humidity
+            and self.hvac_action == self._written_action
+        ):
+            # Nothing moved, so there is no new state to write
+            self._stats.writes_suppressed += 1
+            self._publish_meters()
+            return
+
+        # Log update summary if values changed; the check is cheaper than building the arguments
+        if _LOGGER.isEnabledFor(logging.DEBUG) and (
+            abs(self._attr_current_temperature - old_temp) > 0.001
+            or abs(self._attr_current_humidity - old_humidity) > 0.1
+        ):
             _LOGGER.debug(
                 "Update cycle [%s]: temp %.2f->%.2f°C (target: %.2f°C), humidity %.1f->%.1f%%, elapsed: %.2f min, fan_mult: %.1f",
                 self._attr_hvac_mode,
@@ -491,20 +1034,187 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
                 fan_multiplier,
             )
 
-        # Ensure values stay within bounds
-        self._attr_current_temperature = max(
-            self._attr_min_temp,
-            min(self._attr_max_temp, self._attr_current_temperature),
+        # Update coordinator
+        if self._coordinator:
+            self._coordinator.update(
+                current_temperature=self._attr_current_temperature,
+                current_humidity=self._attr_current_humidity,
+            )
+
+        self.async_write_ha_state()
+
+    @callback
+    def _advance_simulation(self, now: float) -> float:
+        """Jump the simulated state to now and return the elapsed minutes."""
+        if self._last_update is None:
+            self._last_update = now
+            return 0.0
+
+        elapsed_minutes = max(0.0, (now - self._last_update) / 60.0)
+        self._last_update = now
+
+        params = self._simulation_params()
+        start = self._simulation_state()
+        state, load = advance_with_load(self._attr_hvac_mode, start, params, elapsed_minutes)
+        self._energy += electrical_energy(self._attr_hvac_mode, params, load, elapsed_minutes)
+        self._cycles += load.starts
+        self._count_simple_start(start, state, params)
+        self._attr_current_temperature = state.temperature
+        self._moisture = state.moisture
+        self._attr_current_humidity = state.humidity
+        self._compressor = state.compressor
+        self._cycle_minutes = state.cycle_minutes
+        self._defrost_minutes = state.defrost_minutes
+        return elapsed_minutes
+
+    def _count_simple_start(
+        self, start: SimulationState, end: SimulationState, params: SimulationParams
+    ) -> None:
+        """Count a start of the simple model's compressor over a step.
+
+        The simple model keeps no compressor state: its compressor runs while
+        it carries a load. Only an input change can start it, so it is
+        running from the start of a step or not at all, and may stop on the
+        way. The RC model counts its starts in the step itself.
+        """
+        if self._thermal_model != THERMAL_MODEL_SIMPLE:
+            return
+        if self._simple_running(start, params) and not self._running:
+            self._cycles += 1
+        self._running = self._simple_running(end, params)
+
+    def _simple_running(self, state: SimulationState, params: SimulationParams) -> bool:
+        """Return True if the simple model's compressor heats or cools at state."""
+        # DRY has no thermostat cycle, as in the RC model
+        return self._attr_hvac_mode != HVACMode.DRY and compressor_state(
+            self._attr_hvac_mode, state, params
+        ) != COMPRESSOR_OFF
+
+    @callback
+    def async_advance_simulation(self, now: float) -> float:
+        """Advance the unit on its own thermal model and return the elapsed minutes."""
+        return self._advance_simulation(now)
+
+    @callback
+    def async_exchange_heat(self, temperature: float) -> None:
+        """Store the temperature after the building exchanged heat with the neighbours."""
+        self._attr_current_temperature = temperature
+        self._refresh_humidity()
+
+    @callback
+    def _sync_simulation(self) -> None:
+        """Integrate up to now before the simulation inputs change."""
+        if self in self._building:
+            self._building.async_sync()
+        elif self._scheduler.is_registered(self):
+            self._advance_simulation(self._clock.time())
+
+    def simulation_inputs(
+        self,
+    ) -> tuple[HVACMode, SimulationState, SimulationParams, float | None, float]:
+        """Return everything the fleet engine needs to advance this unit."""
+        return (
+            self._attr_hvac_mode,
+            self._simulation_state(),
+            self._simulation_params(),
+            self._last_update,
+            self.precision,
         )
-        self._attr_current_humidity = max(0, min(100, self._attr_current_humidity))
 
-        # Update coordinator
+    @callback
+    def async_apply_simulation(
+        self, temperature: float, moisture: float, humidity: float, now: float, publish: bool
+    ) -> None:
+        """Store a state computed by the fleet engine."""
+        elapsed_minutes = 0.0 if self._last_update is None else (now - self._last_update) / 60.0
+        self._trace.record(
+            now,
+            self._attr_hvac_mode,
+            temperature,
+            humidity,
+            elapsed_minutes,
+            self._get_fan_multiplier(),
+        )
+        if elapsed_minutes > 0:
+            params = self._simulation_params()
+            start = self._simulation_state()
+            end = SimulationState(temperature, moisture)
+            load = compressor_minutes(self._attr_hvac_mode, start, end, params, elapsed_minutes)
+            self._energy += electrical_energy(self._attr_hvac_mode, params, load, elapsed_minutes)
+            self._count_simple_start(start, end, params)
+        self._last_update = now
+        self._attr_current_temperature = temperature
+        self._moisture = moisture
+        self._attr_current_humidity = humidity
+        # Like the per-unit engine, share every step with the sensors, which
+        # drop the updates they would not show
         if self._coordinator:
-            self._coordinator.update_temperature(self._attr_current_temperature)
-            self._coordinator.update_humidity(self._attr_current_humidity)
+            self._coordinator.update(
+                current_temperature=temperature,
+                current_humidity=humidity,
+            )
+        if not publish:
+            self._stats.writes_suppressed += 1
+            self._publish_meters()
+            return
 
         self.async_write_ha_state()
 
+    def _simulation_state(self) -> SimulationState:
+        """Return the simulated indoor conditions."""
+        return SimulationState(
+            self._attr_current_temperature,
+            self._moisture,
+            self._compressor,
+            self._cycle_minutes,
+            self._defrost_minutes,
+        )
+
+    def _refresh_humidity(self) -> None:
+        """Derive the relative humidity from the moisture at the current temperature."""
+        # Air cannot hold more moisture than saturated air; the rest condenses
+        self._moisture = max(
+            0.0, min(saturation_moisture(self._attr_current_temperature), self._moisture)
+        )
+        self._attr_current_humidity = min(
+            100.0, relative_humidity(self._attr_current_temperature, self._moisture)
+        )
+
+    def _simulation_params(self) -> SimulationParams:
+        """Return the inputs for the simulation engine.
+
+        An open door adds to the heat loss of the envelope, and the simple
+        model drifts towards ambient faster in proportion.
+        """
+        envelope_ua = self._envelope_ua
+        drift_rate = self._ambient_drift_rate
+        if self._door_open:
+            envelope_ua += DOOR_OPEN_UA
+            if self._envelope_ua > 0:
+                drift_rate *= envelope_ua / self._envelope_ua
+        return SimulationParams(
+            target_temperature=self._attr_target_temperature,
+            cooling_rate=self._cooling_rate,
+            heating_rate=self._heating_rate,
+            dry_humidity_rate=self._dry_humidity_rate,
+            ambient_temperature=self._ambient_temp,
+            ambient_humidity=self._ambient_humidity,
+            ambient_drift_rate=drift_rate,
+            fan_multiplier=self._get_fan_multiplier(),
+            min_temp=self._attr_min_temp,
+            max_temp=self._attr_max_temp,
+            thermal_model=self._thermal_model,
+            ac_capacity=self._ac_capacity,
+            heat_capacity=self._heat_capacity,
+            envelope_ua=envelope_ua,
+            heat_gain=self._heat_gain,
+            min_run_time=self._min_run_time,
+            min_off_time=self._min_off_time,
+            startup_ramp=self._startup_ramp,
+            defrost_interval=self._defrost_interval,
+            defrost_duration=self._defrost_duration,
+        )
+
     def _get_fan_multiplier(self) -> float:
         """Get fan speed multiplier for change rate."""
         if self._attr_fan_mode == FAN_LOW:
@@ -516,192 +1226,86 @@ class VirtualACClimate(ClimateEntity, RestoreEntity):
         else:  # AUTO
             return 1.0
 
-    async def _simulate_cooling(self, elapsed_minutes: float, fan_multiplier: float) -> None:
-        """Simulate cooling mode."""
-        if self._attr_current_temperature > self._attr_target_temperature:
-            change = self._cooling_rate * elapsed_minutes * fan_multiplier
-            new_temp = max(
-                self._attr_target_temperature,
-                self._attr_current_temperature - change,
-            )
-            _LOGGER.debug(
-                "Cooling: %.2f -> %.2f°C (target: %.2f°C, change: %.4f°C, rate: %.2f°C/min, elapsed: %.2f min, fan: %.1f)",
-                self._attr_current_temperature,
-                new_temp,
-                self._attr_target_temperature,
-                change,
-                self._cooling_rate,
-                elapsed_minutes,
-                fan_multiplier,
-            )
-            self._attr_current_temperature = new_temp
-            # Slight humidity decrease due to condensation
-            self._attr_current_humidity = max(0, self._attr_current_humidity - 0.5 * elapsed_minutes)
-        else:
-            _LOGGER.debug(
-                "Cooling: Already at/below target (%.2f°C <= %.2f°C), no change",
-                self._attr_current_temperature,
-                self._attr_target_temperature,
-            )
-
-    async def _simulate_heating(self, elapsed_minutes: float, fan_multiplier: float) -> None:
-        """Simulate heating mode."""
-        if self._attr_current_temperature < self._attr_target_temperature:
-            change = self._heating_rate * elapsed_minutes * fan_multiplier
-            new_temp = min(
-                self._attr_target_temperature,
-                self._attr_current_temperature + change,
-            )
-            _LOGGER.debug(
-                "Heating: %.2f -> %.2f°C (target: %.2f°C, change: %.4f°C, rate: %.2f°C/min, elapsed: %.2f min, fan: %.1f)",
-                self._attr_current_temperature,
-                new_temp,
-                self._attr_target_temperature,
-                change,
-                self._heating_rate,
-                elapsed_minutes,
-                fan_multiplier,
-            )
-            self._attr_current_temperature = new_temp
-            # Slight humidity decrease
-            self._attr_current_humidity = max(0, self._attr_current_humidity - 0.3 * elapsed_minutes)
-        else:
-            _LOGGER.debug(
-                "Heating: Already at/above target (%.2f°C >= %.2f°C), no change",
-                self._attr_current_temperature,
-                self._attr_target_temperature,
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, count the write and save the new simulation state."""
+        self._stats.writes += 1
+        self._store.async_schedule_save()
+        self._written_action = self.hvac_action
+        self._publish_meters()
+        super().async_write_ha_state()
+
+    def _publish_meters(self) -> None:
+        """Share the power, total energy and compressor starts with the sensors."""
+        if self._coordinator:
+            self._coordinator.update(
+                power=round(self.power, 1),
+                energy=round(self._energy, ENERGY_PRECISION),
+                compressor_cycles=self._cycles,
             )
 
-    async def _simulate_dry(self, elapsed_minutes: float, fan_multiplier: float) -> None:
-        """Simulate dry mode."""
-        # Slight cooling (less than COOL mode)
-        if self._attr_current_temperature > self._attr_min_temp:
-            change = self._cooling_rate * 0.3 * elapsed_minutes * fan_multiplier
-            self._attr_current_temperature = max(
-                self._attr_min_temp,
-                self._attr_current_temperature - change,
-            )
-        # Significant humidity decrease
-        self._attr_current_humidity = max(
-            0,
-            self._attr_current_humidity - self._dry_humidity_rate * elapsed_minutes,
+    @property
+    def hvac_action(self) -> HVACAction:
+        """Return what the unit is doing now."""
+        if self._attr_hvac_mode == HVACMode.OFF:
+            return HVACAction.OFF
+        if self._attr_hvac_mode == HVACMode.DRY:
+            return HVACAction.DRYING
+        compressor = compressor_state(
+            self._attr_hvac_mode, self._simulation_state(), self._simulation_params()
         )
-
-    async def _simulate_auto(self, elapsed_minutes: float, fan_multiplier: float) -> None:
-        """Simulate auto mode."""
-        temp_diff = self._attr_current_temperature - self._attr_target_temperature
-        tolerance = 0.5  # Temperature tolerance
-
-        if temp_diff > tolerance:
-            # Need to cool
-            _LOGGER.debug("Auto mode: Cooling needed (diff: +%.2f°C)", temp_diff)
-            await self._simulate_cooling(elapsed_minutes, fan_multiplier)
-        elif temp_diff < -tolerance:
-            # Need to heat
-            _LOGGER.debug("Auto mode: Heating needed (diff: %.2f°C)", temp_diff)
-            await self._simulate_heating(elapsed_minutes, fan_multiplier)
-        else:
-            # Otherwise, maintain current temperature
-            _LOGGER.debug("Auto mode: Within tolerance (diff: %.2f°C), maintaining", temp_diff)
-
-    async def _simulate_off(self, elapsed_minutes: float) -> None:
-        """Simulate off mode - drift toward ambient temperature and humidity."""
-        # Temperature drift toward ambient
-        if self._attr_current_temperature < self._ambient_temp:
-            # Drift up toward ambient
-            change = self._ambient_drift_rate * elapsed_minutes
-            new_temp = min(
-                self._ambient_temp,
-                self._attr_current_temperature + change,
-            )
-            _LOGGER.debug(
-                "OFF mode: Temperature drifting up %.2f -> %.2f°C (ambient: %.2f°C, change: %.4f°C, rate: %.2f°C/min)",
-                self._attr_current_temperature,
-                new_temp,
-                self._ambient_temp,
-                change,
-                self._ambient_drift_rate,
-            )
-            self._attr_current_temperature = new_temp
-        elif self._attr_current_temperature > self._ambient_temp:
-            # Drift down toward ambient
-            change = self._ambient_drift_rate * elapsed_minutes
-            new_temp = max(
-                self._ambient_temp,
-                self._attr_current_temperature - change,
-            )
-            _LOGGER.debug(
-                "OFF mode: Temperature drifting down %.2f -> %.2f°C (ambient: %.2f°C, change: %.4f°C, rate: %.2f°C/min)",
-                self._attr_current_temperature,
-                new_temp,
-                self._ambient_temp,
-                change,
-                self._ambient_drift_rate,
-            )
-            self._attr_current_temperature = new_temp
-        else:
-            _LOGGER.debug(
-                "OFF mode: At ambient temperature (%.2f°C), no temperature drift",
-                self._attr_current_temperature,
-            )
-
-        # Humidity drift toward ambient
-        # Use a humidity drift rate (percentage per minute) - similar to dry mode but slower
-        humidity_drift_rate = self._dry_humidity_rate * 0.3  # 30% of dry rate for natural drift
-        if self._attr_current_humidity < self._ambient_humidity:
-            # Drift up toward ambient
-            change = humidity_drift_rate * elapsed_minutes
-            new_humidity = min(
-                100.0,  # Cap at 100%
-                self._ambient_humidity,
-                self._attr_current_humidity + change,
-            )
-            _LOGGER.debug(
-                "OFF mode: Humidity drifting up %.2f -> %.2f%% (ambient: %.2f%%, change: %.4f%%, rate: %.2f%%/min)",
-                self._attr_current_humidity,
-                new_humidity,
-                self._ambient_humidity,
-                change,
-                humidity_drift_rate,
-            )
-            self._attr_current_humidity = new_humidity
-        elif self._attr_current_humidity > self._ambient_humidity:
-            # Drift down toward ambient
-            change = humidity_drift_rate * elapsed_minutes
-            new_humidity = max(
-                0.0,  # Cap at 0%
-                self._ambient_humidity,
-                self._attr_current_humidity - change,
-            )
-            _LOGGER.debug(
-                "OFF mode: Humidity drifting down %.2f -> %.2f%% (ambient: %.2f%%, change: %.4f%%, rate: %.2f%%/min)",
-                self._attr_current_humidity,
-                new_humidity,
-                self._ambient_humidity,
-                change,
-                humidity_drift_rate,
-            )
-            self._attr_current_humidity = new_humidity
-        else:
-            _LOGGER.debug(
-                "OFF mode: At ambient humidity (%.2f%%), no humidity drift",
-                self._attr_current_humidity,
-            )
+        if compressor in _COMPRESSOR_ACTIONS:
+            return _COMPRESSOR_ACTIONS[compressor]
+        return HVACAction.FAN if self._attr_hvac_mode == HVACMode.FAN_ONLY else HVACAction.IDLE
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "humidity": self._attr_current_humidity,
-            "simulation_mode": self._simulation_mode,
-            "fan_mode": self._attr_fan_mode,
-            "swing_mode": self._attr_swing_mode,
-            "preset_mode": self._attr_preset_mode,
-            "cooling_rate": self._cooling_rate,
-            "heating_rate": self._heating_rate,
-            "ambient_temperature": self._ambient_temp,
-            "target_temperature": self._attr_target_temperature,
-            "temperature_difference": round(
-                self._attr_current_temperature - self._attr_target_temperature, 2
-            ),
-        }
+        """Return extra state attributes.
+
+        The attributes are cached between state writes. Static values are
+        rebuilt when the modes or the ambient temperature change (options
+        only change on reload); the rest is rebuilt when the conditions
+        they are derived from change. humidity and target_temperature copy
+        current_humidity and temperature, and are left out when the
+        duplicate attributes option is off.
+        """
+        if self._static_attributes is None:
+            self._static_attributes = {
+                "simulation_mode": self._simulation_mode,
+                "fan_mode": self._attr_fan_mode,
+                "swing_mode": self._attr_swing_mode,
+                "preset_mode": self._attr_preset_mode,
+                "cooling_rate": self._cooling_rate,
+                "heating_rate": self._heating_rate,
+                "ambient_temperature": self._ambient_temp,
+            }
+            self._attributes_key = None
+
+        simulated = None if self._clock.is_real_time else (self._clock.now(), self._clock.speed)
+        key = (
+            self._attr_current_temperature,
+            self._attr_current_humidity,
+            self._attr_target_temperature,
+            simulated,
+        )
+        if key == self._attributes_key:
+            return self._attributes
+
+        if self._duplicate_attributes:
+            attributes = {
+                "humidity": self._attr_current_humidity,
+                **self._static_attributes,
+                "target_temperature": self._attr_target_temperature,
+            }
+        else:
+            attributes = dict(self._static_attributes)
+        attributes["temperature_difference"] = round(
+            self._attr_current_temperature - self._attr_target_temperature, 2
+        )
+        if simulated is not None:
+            simulated_time, speed = simulated
+            attributes["simulated_time"] = simulated_time.isoformat()
+            attributes["clock_speed"] = speed
+        self._attributes = attributes
+        self._attributes_key = key
+        return attributes
@@ -0,0 +1,196 @@
+"""Simulation clock for Virtual AC units."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+# Seconds the simulated time may differ from real time while the clock
+# still counts as real time, absorbing the rounding of each rebase
+REAL_TIME_TOLERANCE = 1e-3
+
+
+class VirtualACClock:
+    """Simulated time that runs at a multiple of real time.
+
+    The clock is derived from the monotonic event loop clock, so the
+    simulation is not affected by wall-clock jumps; only the simulated date
+    follows them. It can be sped up, paused (speed 0) and
+    stepped forward, which lets long scenarios run in seconds. Stepping is
+    deterministic because the simulation engine computes the state at any
+    later time exactly.
+
+    Every unit follows the clock shared by the integration unless it was
+    given a clock of its own. Listeners are called after the clock jumped
+    or changed speed, so units can catch up and reschedule.
+
+    Alarms call an action once the clock reaches a simulated time. A single
+    event loop timer waits for the earliest one. A jump stops at every alarm
+    on its way, so each action runs at its own simulated time.
+    """
+
+    def __init__(self, hass: HomeAssistant, speed: float = 1.0) -> None:
+        """Initialize the clock at the current time."""
+        self.hass = hass
+        self._speed = speed
+        self._real_base = hass.loop.time()
+        self._time_base = self._real_base
+        self._listeners: list[Callable[[], None]] = []
+        # Heap of [simulated time, sequence, action]; cancelled alarms have no action
+        self._alarms: list[list] = []
+        self._sequence = itertools.count()
+        self._alarm_timer: asyncio.TimerHandle | None = None
+
+    @property
+    def speed(self) -> float:
+        """Return how many simulated seconds pass per real second."""
+        return self._speed
+
+    @property
+    def is_real_time(self) -> bool:
+        """Return True if the clock runs at real speed without having gained or lost time."""
+        return (
+            self._speed == 1.0
+            and abs(self.time() - self.hass.loop.time()) <= REAL_TIME_TOLERANCE
+        )
+
+    def time(self) -> float:
+        """Return the simulated monotonic time in seconds."""
+        return self._time_base + (self.hass.loop.time() - self._real_base) * self._speed
+
+    def now(self) -> datetime:
+        """Return the simulated date and time.
+
+        The date is read from the wall clock each time, shifted by how far the
+        simulated time ran ahead of real time. A wall clock corrected after
+        boot (for example by NTP) therefore also corrects the simulated dates
+        saved with the units, which the catch-up after a restart relies on.
+        """
+        return dt_util.utcnow() + timedelta(seconds=self.time() - self.hass.loop.time())
+
+    def copy(self, seconds: float = 0.0) -> VirtualACClock:
+        """Return an independent clock at the same speed, seconds ahead of this one."""
+        clock = VirtualACClock(self.hass, self._speed)
+        clock._real_base, clock._time_base = self._real_base, self._time_base + seconds
+        return clock
+
+    def seconds_until(self, when: datetime) -> float:
+        """Return the simulated seconds until a simulated date and time."""
+        seconds = (dt_util.as_utc(when) - self.now()).total_seconds()
+        if seconds < 0:
+            raise ValueError(f"Cannot step the simulation clock back to {when}")
+        return seconds
+
+    def real_delay(self, seconds: float | None) -> float | None:
+        """Convert a simulated delay to real seconds, None if it never passes."""
+        if seconds is None or self._speed <= 0:
+            return None
+        return seconds / self._speed
+
+    @callback
+    def async_set_speed(self, speed: float) -> None:
+        """Change the speed from now on."""
+        self._rebase()
+        self._speed = speed
+        self._notify_listeners()
+        self._schedule_alarm()
+
+    @callback
+    def async_advance(self, seconds: float) -> None:
+        """Jump forward by seconds of simulated time."""
+        self.async_jump_to(self.time() + max(0.0, seconds))
+
+    @callback
+    def async_jump_to(self, time: float) -> None:
+        """Jump forward to a simulated time, running the alarms on the way."""
+        jumped = time > self.time()
+        while self._alarms and self._alarms[0][0] <= time:
+            when, _, action = heapq.heappop(self._alarms)
+            if action is None:
+                continue
+            self._move_to(when)
+            action()
+        if jumped:
+            self._move_to(time)
+            self._notify_listeners()
+        self._schedule_alarm()
+
+    def add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Add a listener for jumps and speed changes and return a function to remove it."""
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def async_call_at(self, when: float, action: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call action once the simulated time reaches when, and return a function to cancel."""
+        alarm = [when, next(self._sequence), action]
+        heapq.heappush(self._alarms, alarm)
+        if self._alarms[0] is alarm:
+            self._schedule_alarm()
+
+        @callback
+        def cancel_alarm() -> None:
+            """Cancel the alarm if it did not go off yet."""
+            alarm[2] = None
+            if self._alarms and self._alarms[0] is alarm:
+                # Wait for the next alarm instead, or stop the timer
+                self._schedule_alarm()
+
+        return cancel_alarm
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel all alarms and the timer waiting for them."""
+        self._alarms.clear()
+        self._schedule_alarm()
+
+    def _schedule_alarm(self) -> None:
+        """Start the event loop timer for the earliest alarm."""
+        if self._alarm_timer is not None:
+            self._alarm_timer.cancel()
+            self._alarm_timer = None
+        while self._alarms and self._alarms[0][2] is None:
+            heapq.heappop(self._alarms)
+        if not self._alarms:
+            return
+        # Alarms already due ring right away, even on a paused clock
+        seconds = self._alarms[0][0] - self.time()
+        delay = 0.0 if seconds <= 0 else self.real_delay(seconds)
+        if delay is None:
+            return
+        self._alarm_timer = self.hass.loop.call_later(delay, self._async_ring)
+
+    @callback
+    def _async_ring(self) -> None:
+        """Run the alarms that are due."""
+        self._alarm_timer = None
+        self.async_advance(0)
+
+    def _move_to(self, time: float) -> None:
+        """Move the simulated time forward to time, if it is not past it already."""
+        self._rebase()
+        self._time_base = max(self._time_base, time)
+
+    def _rebase(self) -> None:
+        """Restart the linear mapping from real to simulated time at now."""
+        real = self.hass.loop.time()
+        self._time_base += (real - self._real_base) * self._speed
+        self._real_base = real
+
+    def _notify_listeners(self) -> None:
+        """Notify all listeners that the clock changed."""
+        for listener in list(self._listeners):
+            listener()
@@ -9,6 +9,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.const import CONF_NAME
+from homeassistant.helpers import selector
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +29,21 @@ from .const import (
     CONF_AMBIENT_HUMIDITY,
     CONF_AMBIENT_DRIFT_RATE,
     CONF_UPDATE_INTERVAL,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_HUMIDITY_DEADBAND,
+    CONF_DUPLICATE_ATTRIBUTES,
+    CONF_THERMAL_MODEL,
+    CONF_AC_CAPACITY,
+    CONF_ROOM_VOLUME,
+    CONF_ENVELOPE_UA,
+    CONF_THERMAL_MASS,
+    CONF_MIN_RUN_TIME,
+    CONF_MIN_OFF_TIME,
+    CONF_STARTUP_RAMP,
+    CONF_DEFROST_INTERVAL,
+    CONF_DEFROST_DURATION,
+    CONF_NEIGHBORS,
+    CONF_WALL_UA,
     DEFAULT_INITIAL_TEMP,
     DEFAULT_INITIAL_HUMIDITY,
     DEFAULT_TEMP_UNIT,
@@ -42,8 +58,24 @@ from .const import (
     DEFAULT_AMBIENT_HUMIDITY,
     DEFAULT_AMBIENT_DRIFT_RATE,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_HUMIDITY_DEADBAND,
+    DEFAULT_DUPLICATE_ATTRIBUTES,
+    DEFAULT_THERMAL_MODEL,
+    DEFAULT_AC_CAPACITY,
+    DEFAULT_ROOM_VOLUME,
+    DEFAULT_ENVELOPE_UA,
+    DEFAULT_THERMAL_MASS,
+    DEFAULT_MIN_RUN_TIME,
+    DEFAULT_MIN_OFF_TIME,
+    DEFAULT_STARTUP_RAMP,
+    DEFAULT_DEFROST_INTERVAL,
+    DEFAULT_DEFROST_DURATION,
+    DEFAULT_WALL_UA,
     SIMULATION_MODE_INSTANT,
     SIMULATION_MODE_REALISTIC,
+    THERMAL_MODEL_SIMPLE,
+    THERMAL_MODEL_RC,
 )
 
 
@@ -71,6 +103,21 @@ STEP_ADVANCED_DATA_SCHEMA = vol.Schema(
         vol.Optional(CONF_DRY_HUMIDITY_RATE, default=DEFAULT_DRY_HUMIDITY_RATE): vol.Coerce(float),
         vol.Optional(CONF_AMBIENT_DRIFT_RATE, default=DEFAULT_AMBIENT_DRIFT_RATE): vol.Coerce(float),
         vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.Coerce(int),
+        vol.Optional(CONF_TEMPERATURE_DEADBAND, default=DEFAULT_TEMPERATURE_DEADBAND): vol.Coerce(float),
+        vol.Optional(CONF_HUMIDITY_DEADBAND, default=DEFAULT_HUMIDITY_DEADBAND): vol.Coerce(float),
+        vol.Optional(CONF_DUPLICATE_ATTRIBUTES, default=DEFAULT_DUPLICATE_ATTRIBUTES): bool,
+        vol.Optional(CONF_THERMAL_MODEL, default=DEFAULT_THERMAL_MODEL): vol.In(
+            [THERMAL_MODEL_SIMPLE, THERMAL_MODEL_RC]
+        ),
+        vol.Optional(CONF_AC_CAPACITY, default=DEFAULT_AC_CAPACITY): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_ROOM_VOLUME, default=DEFAULT_ROOM_VOLUME): vol.All(vol.Coerce(float), vol.Range(min=1)),
+        vol.Optional(CONF_ENVELOPE_UA, default=DEFAULT_ENVELOPE_UA): vol.All(vol.Coerce(float), vol.Range(min=1)),
+        vol.Optional(CONF_THERMAL_MASS, default=DEFAULT_THERMAL_MASS): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_MIN_RUN_TIME, default=DEFAULT_MIN_RUN_TIME): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_MIN_OFF_TIME, default=DEFAULT_MIN_OFF_TIME): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_STARTUP_RAMP, default=DEFAULT_STARTUP_RAMP): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_DEFROST_INTERVAL, default=DEFAULT_DEFROST_INTERVAL): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_DEFROST_DURATION, default=DEFAULT_DEFROST_DURATION): vol.All(vol.Coerce(float), vol.Range(min=0)),
     }
 )
 
@@ -160,7 +207,10 @@ class VirtualACOptionsFlowHandler(config_entries.OptionsFlow):
                 # Update config entry with new options
                 # Options are stored separately from data
                 _LOGGER.debug("Saving options: %s", user_input)
-                return self.async_create_entry(title="", data=user_input)
+                # Keep options set outside this form, such as follow mode
+                config_entry = getattr(self, '_config_entry', None)
+                existing_options = dict(config_entry.options) if config_entry else {}
+                return self.async_create_entry(title="", data={**existing_options, **user_input})
 
             # Get config entry from stored reference
             config_entry = getattr(self, '_config_entry', None)
@@ -213,6 +263,70 @@ class VirtualACOptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_UPDATE_INTERVAL,
                         default=current_config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
                     ): vol.Coerce(int),
+                    vol.Optional(
+                        CONF_TEMPERATURE_DEADBAND,
+                        default=current_config.get(CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND),
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_HUMIDITY_DEADBAND,
+                        default=current_config.get(CONF_HUMIDITY_DEADBAND, DEFAULT_HUMIDITY_DEADBAND),
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_DUPLICATE_ATTRIBUTES,
+                        default=current_config.get(CONF_DUPLICATE_ATTRIBUTES, DEFAULT_DUPLICATE_ATTRIBUTES),
+                    ): bool,
+                    vol.Optional(
+                        CONF_THERMAL_MODEL,
+                        default=current_config.get(CONF_THERMAL_MODEL, DEFAULT_THERMAL_MODEL),
+                    ): vol.In([THERMAL_MODEL_SIMPLE, THERMAL_MODEL_RC]),
+                    vol.Optional(
+                        CONF_AC_CAPACITY,
+                        default=current_config.get(CONF_AC_CAPACITY, DEFAULT_AC_CAPACITY),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_ROOM_VOLUME,
+                        default=current_config.get(CONF_ROOM_VOLUME, DEFAULT_ROOM_VOLUME),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_ENVELOPE_UA,
+                        default=current_config.get(CONF_ENVELOPE_UA, DEFAULT_ENVELOPE_UA),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_THERMAL_MASS,
+                        default=current_config.get(CONF_THERMAL_MASS, DEFAULT_THERMAL_MASS),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_MIN_RUN_TIME,
+                        default=current_config.get(CONF_MIN_RUN_TIME, DEFAULT_MIN_RUN_TIME),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_MIN_OFF_TIME,
+                        default=current_config.get(CONF_MIN_OFF_TIME, DEFAULT_MIN_OFF_TIME),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_STARTUP_RAMP,
+                        default=current_config.get(CONF_STARTUP_RAMP, DEFAULT_STARTUP_RAMP),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_DEFROST_INTERVAL,
+                        default=current_config.get(CONF_DEFROST_INTERVAL, DEFAULT_DEFROST_INTERVAL),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_DEFROST_DURATION,
+                        default=current_config.get(CONF_DEFROST_DURATION, DEFAULT_DEFROST_DURATION),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_NEIGHBORS,
+                        default=current_config.get(CONF_NEIGHBORS, []),
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(
+                            domain="climate", integration=DOMAIN, multiple=True
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_WALL_UA,
+                        default=current_config.get(CONF_WALL_UA, DEFAULT_WALL_UA),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
                 }
             )
 
@@ -2,6 +2,17 @@
 
 DOMAIN = "virtual_ac"
 
+# Keys in hass.data[DOMAIN] that are shared by all config entries
+DATA_SCHEDULER = "scheduler"
+DATA_ENTITY_INDEX = "entity_index"
+DATA_CLOCK = "clock"
+DATA_STORE = "store"
+DATA_BUILDING = "building"
+DATA_SCENARIOS = "scenarios"
+
+# Keys in hass.data[DOMAIN][entry_id]
+DATA_STATS = "stats"
+
 # Configuration keys
 CONF_INITIAL_TEMP = "initial_temp"
 CONF_INITIAL_HUMIDITY = "initial_humidity"
@@ -17,6 +28,31 @@ CONF_AMBIENT_TEMP = "ambient_temp"
 CONF_AMBIENT_HUMIDITY = "ambient_humidity"
 CONF_AMBIENT_DRIFT_RATE = "ambient_drift_rate"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_HUMIDITY_DEADBAND = "humidity_deadband"
+CONF_DUPLICATE_ATTRIBUTES = "duplicate_attributes"
+CONF_THERMAL_MODEL = "thermal_model"
+CONF_AC_CAPACITY = "ac_capacity"
+CONF_ROOM_VOLUME = "room_volume"
+CONF_ENVELOPE_UA = "envelope_ua"
+CONF_THERMAL_MASS = "thermal_mass"
+
+# Compressor cycle (rc thermal model)
+CONF_MIN_RUN_TIME = "min_run_time"
+CONF_MIN_OFF_TIME = "min_off_time"
+CONF_STARTUP_RAMP = "startup_ramp"
+CONF_DEFROST_INTERVAL = "defrost_interval"
+CONF_DEFROST_DURATION = "defrost_duration"
+
+# Multi-zone buildings
+CONF_NEIGHBORS = "neighbors"
+CONF_WALL_UA = "wall_ua"
+
+# Follow mode, stored in the config entry options by the sync_from_entities service
+CONF_FOLLOW_CLIMATE_ENTITY = "follow_climate_entity"
+CONF_FOLLOW_WEATHER_ENTITY = "follow_weather_entity"
+CONF_FOLLOW_MIN_INTERVAL = "follow_min_interval"
+CONF_FOLLOW_DEADBAND = "follow_deadband"
 
 # Default values
 DEFAULT_INITIAL_TEMP = 22.0
@@ -33,11 +69,38 @@ DEFAULT_AMBIENT_TEMP = 20.0
 DEFAULT_AMBIENT_HUMIDITY = 60.0
 DEFAULT_AMBIENT_DRIFT_RATE = 0.1  # °C per minute when OFF
 DEFAULT_UPDATE_INTERVAL = 10  # seconds
+DEFAULT_TEMPERATURE_DEADBAND = 0.05  # °C change needed to publish a sensor update
+DEFAULT_HUMIDITY_DEADBAND = 0.5  # % change needed to publish a sensor update
+DEFAULT_DUPLICATE_ATTRIBUTES = True  # also publish humidity and target_temperature attributes
+DEFAULT_THERMAL_MODEL = "simple"
+DEFAULT_AC_CAPACITY = 2500.0  # W of heat moved at medium fan speed
+DEFAULT_ROOM_VOLUME = 40.0  # m³
+DEFAULT_ENVELOPE_UA = 60.0  # W/K lost through walls, windows and roof
+DEFAULT_THERMAL_MASS = 400.0  # kJ/K of furniture and walls on top of the air
+DEFAULT_MIN_RUN_TIME = 3.0  # minutes the compressor runs at least once started
+DEFAULT_MIN_OFF_TIME = 3.0  # minutes the compressor stays off at least once stopped
+DEFAULT_STARTUP_RAMP = 1.0  # minutes at reduced capacity after starting
+DEFAULT_DEFROST_INTERVAL = 60.0  # minutes of heating between defrosts in cold weather
+DEFAULT_DEFROST_DURATION = 5.0  # minutes per defrost
+DEFAULT_WALL_UA = 20.0  # W/K through one wall shared with a neighbour
+DEFAULT_FOLLOW_MIN_INTERVAL = 0.0  # seconds between pushes from followed entities
+DEFAULT_FOLLOW_DEADBAND = 0.0  # change needed to push a followed value
+
+# Extra heat loss through an open exterior door (W/K), on top of the envelope
+DOOR_OPEN_UA = 120.0
+
+# Seconds a sensor value must stay unchanged before it is written even
+# though it is within the deadband of the last written value
+SENSOR_SETTLE_TIME = 60.0
 
 # Simulation modes
 SIMULATION_MODE_INSTANT = "instant"
 SIMULATION_MODE_REALISTIC = "realistic"
 
+# Thermal models
+THERMAL_MODEL_SIMPLE = "simple"
+THERMAL_MODEL_RC = "rc"
+
 # Preset modes
 PRESET_ECO = "eco"
 PRESET_COMFORT = "comfort"
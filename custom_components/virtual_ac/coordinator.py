@@ -2,66 +2,166 @@
 
 from __future__ import annotations
 
+from asyncio import Handle
+from collections.abc import Callable, Iterable
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .stats import async_get_stats
+
+# Fields shared through the coordinator
+FIELD_CURRENT_TEMPERATURE = "current_temperature"
+FIELD_CURRENT_HUMIDITY = "current_humidity"
+FIELD_EXTERNAL_TEMPERATURE = "external_temperature"
+FIELD_EXTERNAL_HUMIDITY = "external_humidity"
+FIELD_POWER = "power"
+FIELD_ENERGY = "energy"
+FIELD_COMPRESSOR_CYCLES = "compressor_cycles"
 
 
 class VirtualACCoordinator:
-    """Coordinator to share state between climate and sensors."""
+    """Coordinator to share state between climate and sensors.
+
+    Updates only mark fields as dirty. Listeners are notified once per event
+    loop iteration, and only if at least one value actually changed, so a
+    burst of updates from one simulation tick or service call results in a
+    single notification. Listeners can subscribe to a subset of fields and
+    are only called when one of those fields changed.
+    """
 
-    def __init__(self, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize coordinator."""
+        self.hass = hass
         self.entry = entry
-        self._current_temperature: float | None = None
-        self._current_humidity: float | None = None
-        self._external_temperature: float | None = None
-        self._external_humidity: float | None = None
-        self._listeners: list[callable] = []
+        self._values: dict[str, float | None] = {
+            FIELD_CURRENT_TEMPERATURE: None,
+            FIELD_CURRENT_HUMIDITY: None,
+            FIELD_EXTERNAL_TEMPERATURE: None,
+            FIELD_EXTERNAL_HUMIDITY: None,
+            FIELD_POWER: None,
+            FIELD_ENERGY: None,
+            FIELD_COMPRESSOR_CYCLES: None,
+        }
+        self._dirty: set[str] = set()
+        self._flush_handle: Handle | None = None
+        self._listeners: list[tuple[Callable[[], None], frozenset[str] | None]] = []
+        self._stats = async_get_stats(hass, entry.entry_id)
 
     @property
     def current_temperature(self) -> float | None:
         """Get current temperature."""
-        return self._current_temperature
+        return self._values[FIELD_CURRENT_TEMPERATURE]
 
     @property
     def current_humidity(self) -> float | None:
         """Get current humidity."""
-        return self._current_humidity
+        return self._values[FIELD_CURRENT_HUMIDITY]
 
     @property
     def external_temperature(self) -> float | None:
         """Get external temperature."""
-        return self._external_temperature
+        return self._values[FIELD_EXTERNAL_TEMPERATURE]
 
     @property
     def external_humidity(self) -> float | None:
         """Get external humidity."""
-        return self._external_humidity
+        return self._values[FIELD_EXTERNAL_HUMIDITY]
+
+    @property
+    def power(self) -> float | None:
+        """Get electrical power (W)."""
+        return self._values[FIELD_POWER]
+
+    @property
+    def energy(self) -> float | None:
+        """Get total energy used (kWh)."""
+        return self._values[FIELD_ENERGY]
+
+    @property
+    def compressor_cycles(self) -> float | None:
+        """Get number of compressor starts."""
+        return self._values[FIELD_COMPRESSOR_CYCLES]
+
+    @callback
+    def update(
+        self,
+        *,
+        current_temperature: float | None = None,
+        current_humidity: float | None = None,
+        external_temperature: float | None = None,
+        external_humidity: float | None = None,
+        power: float | None = None,
+        energy: float | None = None,
+        compressor_cycles: int | None = None,
+    ) -> None:
+        """Update any combination of values and schedule one notification."""
+        for field, value in (
+            (FIELD_CURRENT_TEMPERATURE, current_temperature),
+            (FIELD_CURRENT_HUMIDITY, current_humidity),
+            (FIELD_EXTERNAL_TEMPERATURE, external_temperature),
+            (FIELD_EXTERNAL_HUMIDITY, external_humidity),
+            (FIELD_POWER, power),
+            (FIELD_ENERGY, energy),
+            (FIELD_COMPRESSOR_CYCLES, compressor_cycles),
+        ):
+            if value is not None and self._values[field] != value:
+                self._values[field] = value
+                self._dirty.add(field)
+
+        if self._dirty and self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_soon(self._flush)
 
     def update_temperature(self, temperature: float) -> None:
         """Update temperature and notify listeners."""
-        self._current_temperature = temperature
-        self._notify_listeners()
+        self.update(current_temperature=temperature)
 
     def update_humidity(self, humidity: float) -> None:
         """Update humidity and notify listeners."""
-        self._current_humidity = humidity
-        self._notify_listeners()
+        self.update(current_humidity=humidity)
 
     def update_external_temperature(self, temperature: float) -> None:
         """Update external temperature and notify listeners."""
-        self._external_temperature = temperature
-        self._notify_listeners()
+        self.update(external_temperature=temperature)
 
     def update_external_humidity(self, humidity: float) -> None:
         """Update external humidity and notify listeners."""
-        self._external_humidity = humidity
-        self._notify_listeners()
+        self.update(external_humidity=humidity)
+
+    def add_listener(
+        self,
+        listener: Callable[[], None],
+        fields: Iterable[str] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Add a listener for updates and return a function to remove it.
+
+        If fields is given, the listener is only called when one of those
+        fields changed; otherwise it is called for every change.
+        """
+        subscription = (listener, frozenset(fields) if fields is not None else None)
+        self._listeners.append(subscription)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            if subscription in self._listeners:
+                self._listeners.remove(subscription)
+
+        return remove_listener
 
-    def add_listener(self, listener: callable) -> None:
-        """Add a listener for updates."""
-        self._listeners.append(listener)
+    @callback
+    def _flush(self) -> None:
+        """Notify listeners once for all changes since the last flush."""
+        self._flush_handle = None
+        if not self._dirty:
+            return
+        dirty = frozenset(self._dirty)
+        self._dirty.clear()
+        self._stats.notifications += 1
+        self._notify_listeners(dirty)
 
-    def _notify_listeners(self) -> None:
-        """Notify all listeners of updates."""
-        for listener in self._listeners:
-            listener()
+    def _notify_listeners(self, dirty: frozenset[str]) -> None:
+        """Notify the listeners interested in the changed fields."""
+        for listener, fields in list(self._listeners):
+            if fields is None or not fields.isdisjoint(dirty):
+                listener()
@@ -0,0 +1,31 @@
+"""Diagnostics support for Virtual AC."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_BUILDING, DATA_ENTITY_INDEX, DATA_SCENARIOS, DOMAIN
+from .stats import async_get_stats
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    climate = hass.data[DOMAIN][DATA_ENTITY_INDEX].get(entry.entry_id)
+    building = hass.data[DOMAIN][DATA_BUILDING]
+    scenarios = hass.data[DOMAIN][DATA_SCENARIOS]
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "stats": async_get_stats(hass, entry.entry_id).as_dict(),
+        "trace": [] if climate is None else climate.trace.as_list(climate.clock),
+        "building": building.as_dict() if climate in building else None,
+        "scenarios": [] if climate is None else scenarios.as_list(climate.entity_id),
+    }
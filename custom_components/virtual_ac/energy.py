@@ -0,0 +1,101 @@
+"""Electrical power and energy use of Virtual AC units.
+
+The electrical power is the heat the compressor moves divided by its
+coefficient of performance (COP), plus the indoor fan, or a small standby
+draw when the unit is OFF. The COP only depends on the outdoor (ambient)
+temperature, which stays constant between two simulation updates, so the
+energy of a step follows exactly from the compressor load the simulation
+engine integrates over it.
+"""
+
+from __future__ import annotations
+
+import math
+
+from homeassistant.components.climate import HVACMode
+
+from .simulation import SimulationLoad, SimulationParams, SimulationState, compressor_load
+
+# Cooling COP at the rated outdoor temperature (°C); it rises as the outdoors get cooler
+COOLING_COP = 3.2
+COOLING_RATED_OUTDOOR = 35.0
+COOLING_COP_SLOPE = 0.1  # per °C
+COOLING_COP_RANGE = (1.5, 6.0)
+
+# Heating COP at the rated outdoor temperature (°C); it drops as the outdoors get colder
+HEATING_COP = 3.5
+HEATING_RATED_OUTDOOR = 7.0
+HEATING_COP_SLOPE = 0.08  # per °C
+HEATING_COP_RANGE = (1.2, 5.0)
+
+# Indoor fan power at medium speed (W); it grows with the cube of the fan speed
+FAN_POWER = 30.0
+
+# Power drawn when OFF (W)
+STANDBY_POWER = 1.0
+
+# Decimals of the published energy (kWh)
+ENERGY_PRECISION = 2
+
+
+def cooling_cop(outdoor_temperature: float) -> float:
+    """Return the coefficient of performance when cooling."""
+    low, high = COOLING_COP_RANGE
+    cop = COOLING_COP + COOLING_COP_SLOPE * (COOLING_RATED_OUTDOOR - outdoor_temperature)
+    return max(low, min(high, cop))
+
+
+def heating_cop(outdoor_temperature: float) -> float:
+    """Return the coefficient of performance when heating."""
+    low, high = HEATING_COP_RANGE
+    cop = HEATING_COP + HEATING_COP_SLOPE * (outdoor_temperature - HEATING_RATED_OUTDOOR)
+    return max(low, min(high, cop))
+
+
+def _base_power(hvac_mode: HVACMode, params: SimulationParams) -> float:
+    """Return the power (W) drawn besides the compressor."""
+    if hvac_mode == HVACMode.OFF:
+        return STANDBY_POWER
+    return FAN_POWER * params.fan_multiplier**3
+
+
+def _compressor_power(params: SimulationParams) -> tuple[float, float]:
+    """Return the power (W) of the compressor at full capacity when cooling and heating."""
+    capacity = params.ac_capacity * params.fan_multiplier
+    outdoor = params.ambient_temperature
+    return capacity / cooling_cop(outdoor), capacity / heating_cop(outdoor)
+
+
+def electrical_power(
+    hvac_mode: HVACMode, state: SimulationState, params: SimulationParams
+) -> float:
+    """Return the electrical power (W) the unit draws in a state."""
+    cooling, heating = compressor_load(hvac_mode, state, params)
+    cooling_power, heating_power = _compressor_power(params)
+    return _base_power(hvac_mode, params) + cooling * cooling_power + heating * heating_power
+
+
+def electrical_energy(
+    hvac_mode: HVACMode,
+    params: SimulationParams,
+    load: SimulationLoad,
+    elapsed_minutes: float,
+) -> float:
+    """Return the energy (kWh) used over a step, see simulation.advance_with_load."""
+    cooling_power, heating_power = _compressor_power(params)
+    watt_minutes = (
+        _base_power(hvac_mode, params) * elapsed_minutes
+        + cooling_power * load.cooling
+        + heating_power * load.heating
+    )
+    return watt_minutes / 60_000.0
+
+
+def energy_step_minutes(power: float) -> float:
+    """Return the minutes until the published energy moves by one step at power (W).
+
+    Returns infinity when the unit draws no power.
+    """
+    if power <= 0:
+        return math.inf
+    return 10**-ENERGY_PRECISION * 60_000.0 / power
@@ -0,0 +1,62 @@
+"""Index of Virtual AC entities for fast service target resolution."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+if TYPE_CHECKING:
+    from .climate import VirtualACClimate
+
+
+class VirtualACEntityIndex:
+    """Map any Virtual AC entity ID or config entry ID to its climate entity.
+
+    Entities add themselves when they are added to hass and are removed again
+    through async_on_remove. Home Assistant removes and re-adds an entity when
+    its entity ID is renamed, so renames are picked up by the same hooks.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._entry_ids: dict[str, str] = {}
+        self._climates: dict[str, VirtualACClimate] = {}
+
+    @callback
+    def async_add_entity(self, entity_id: str, entry_id: str) -> CALLBACK_TYPE:
+        """Index an entity of a config entry and return a function to remove it."""
+        self._entry_ids[entity_id] = entry_id
+
+        @callback
+        def remove_entity() -> None:
+            """Remove the entity from the index."""
+            if self._entry_ids.get(entity_id) == entry_id:
+                del self._entry_ids[entity_id]
+
+        return remove_entity
+
+    @callback
+    def async_add_climate(self, climate: VirtualACClimate) -> CALLBACK_TYPE:
+        """Index the climate entity of a config entry and return a function to remove it."""
+        entry_id = climate.entry_id
+        self._climates[entry_id] = climate
+        remove_entity = self.async_add_entity(climate.entity_id, entry_id)
+
+        @callback
+        def remove_climate() -> None:
+            """Remove the climate entity from the index."""
+            remove_entity()
+            if self._climates.get(entry_id) is climate:
+                del self._climates[entry_id]
+
+        return remove_climate
+
+    def get(self, entity_or_entry_id: str) -> VirtualACClimate | None:
+        """Return the climate entity for an entity ID or config entry ID."""
+        entry_id = self._entry_ids.get(entity_or_entry_id, entity_or_entry_id)
+        return self._climates.get(entry_id)
+
+    def climates(self) -> list[VirtualACClimate]:
+        """Return every indexed climate entity."""
+        return list(self._climates.values())
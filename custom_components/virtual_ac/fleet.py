@@ -0,0 +1,446 @@
+"""Vectorized fleet simulation engine for large numbers of Virtual AC units.
+
+The engine keeps the state and simulation inputs of every registered unit in
+contiguous NumPy arrays and advances a whole batch of units in one vectorized
+step. It mirrors simulation.advance and simulation.next_change_minutes
+operation for operation, so a unit ends up in the same state, up to
+floating-point rounding, whichever engine ticked it.
+
+NumPy is optional: when it is not installed the scheduler keeps using the
+per-unit engine.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.core import callback
+
+from .psychrometrics import (
+    moisture_content,
+    relative_humidity,
+    relative_humidity_slopes,
+    saturation_moisture,
+)
+from .simulation import (
+    AUTO_TOLERANCE,
+    COMPRESSOR_COOLING,
+    COMPRESSOR_HEATING,
+    COMPRESSOR_OFF,
+    COOL_COIL_TEMPERATURE,
+    COOL_HUMIDITY_RATE,
+    DRY_COIL_TEMPERATURE,
+    DRY_COOLING_FACTOR,
+    HUMIDITY_STEP,
+    MOISTURE_RATE_FACTOR,
+    OFF_HUMIDITY_DRIFT_FACTOR,
+    free_running_temperature,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+if TYPE_CHECKING:
+    from .climate import VirtualACClimate
+
+# Batches smaller than this are cheaper to tick one unit at a time
+FLEET_MIN_UNITS = 32
+
+_MODE_CODES = {
+    HVACMode.OFF: 0,
+    HVACMode.COOL: 1,
+    HVACMode.HEAT: 2,
+    HVACMode.DRY: 3,
+    HVACMode.FAN_ONLY: 4,
+    HVACMode.AUTO: 5,
+}
+_OFF, _COOL, _HEAT, _DRY, _FAN_ONLY, _AUTO = range(6)
+
+# Rows of the fleet array
+_FIELDS = (
+    "mode",
+    "temperature",
+    "moisture",
+    "last_update",
+    "target_temperature",
+    "cooling_rate",
+    "heating_rate",
+    "dry_humidity_rate",
+    "ambient_temperature",
+    "ambient_humidity",
+    "ambient_drift_rate",
+    "drift_temperature",
+    "holding_load",
+    "fan_multiplier",
+    "min_temp",
+    "max_temp",
+    "temperature_step",
+)
+(
+    _MODE,
+    _TEMPERATURE,
+    _MOISTURE,
+    _LAST_UPDATE,
+    _TARGET,
+    _COOLING_RATE,
+    _HEATING_RATE,
+    _DRY_RATE,
+    _AMBIENT_TEMPERATURE,
+    _AMBIENT_HUMIDITY,
+    _DRIFT_RATE,
+    _DRIFT_TEMPERATURE,
+    _HOLDING_LOAD,
+    _FAN,
+    _MIN_TEMP,
+    _MAX_TEMP,
+    _TEMPERATURE_STEP,
+) = range(len(_FIELDS))
+
+_INITIAL_CAPACITY = 64
+
+
+def fleet_available() -> bool:
+    """Return True if the vectorized engine can be used."""
+    return np is not None
+
+
+def _active_minutes(distance, rate, minutes):
+    """Vectorized simulation._active_minutes."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ramp = np.minimum(minutes, distance / rate)
+    return np.where(distance <= 0, 0.0, np.where(rate <= 0, minutes, ramp))
+
+
+def _approach(value, limit, rate, minutes):
+    """Vectorized simulation._approach."""
+    return np.where(
+        value < limit,
+        np.minimum(limit, value + rate * minutes),
+        np.where(value > limit, np.maximum(limit, value - rate * minutes), value),
+    )
+
+
+def _ramp_minutes(value, limit, rate, step):
+    """Vectorized simulation._ramp_minutes, with inf for no change."""
+    distance = np.abs(limit - value)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        minutes = np.minimum(step, distance) / rate
+    return np.where((distance == 0) | (rate <= 0), np.inf, minutes)
+
+
+def _exchange(moisture, limit, rate, minutes):
+    """Vectorized simulation._exchange."""
+    return limit + (moisture - limit) * np.exp(-rate * minutes)
+
+
+def _coil(drying, data, moisture):
+    """Vectorized simulation._coil, for the DRY coil where drying is set."""
+    limit = np.where(
+        drying,
+        saturation_moisture(DRY_COIL_TEMPERATURE),
+        saturation_moisture(COOL_COIL_TEMPERATURE),
+    )
+    rate = np.where(drying, data[_DRY_RATE], COOL_HUMIDITY_RATE)
+    rate = np.where(moisture <= limit, 0.0, rate * MOISTURE_RATE_FACTOR * data[_FAN])
+    return limit, rate
+
+
+def _outdoor(data):
+    """Vectorized simulation._outdoor."""
+    humidity = np.maximum(0.0, np.minimum(100.0, data[_AMBIENT_HUMIDITY]))
+    return (
+        moisture_content(data[_AMBIENT_TEMPERATURE], humidity),
+        data[_DRY_RATE] * OFF_HUMIDITY_DRIFT_FACTOR * MOISTURE_RATE_FACTOR,
+    )
+
+
+def _clamp_moisture(temperature, moisture):
+    """Keep moisture between dry and saturated air at temperature."""
+    return np.maximum(0.0, np.minimum(saturation_moisture(temperature), moisture))
+
+
+def humidity_arrays(temperature, moisture):
+    """Return the relative humidity shown for every unit."""
+    return np.minimum(100.0, relative_humidity(temperature, moisture))
+
+
+def _humidity_minutes(temperature, moisture, temperature_rate, moisture_limit, moisture_rate):
+    """Vectorized simulation._humidity_minutes, with inf for no change."""
+    moisture_slope = moisture_rate * (moisture_limit - moisture)
+    remaining = relative_humidity(temperature, moisture_limit) - relative_humidity(
+        temperature, moisture
+    )
+    moisture_slope = np.where(np.abs(remaining) < HUMIDITY_STEP, 0.0, moisture_slope)
+    by_temperature, by_moisture = relative_humidity_slopes(temperature, moisture)
+    rate = np.abs(by_temperature * temperature_rate + by_moisture * moisture_slope)
+    with np.errstate(divide="ignore"):
+        return np.where(rate == 0, np.inf, HUMIDITY_STEP / rate)
+
+
+def advance_arrays(data, minutes):
+    """Return temperature and moisture after minutes for every column of data."""
+    mode = data[_MODE]
+    target = data[_TARGET]
+    fan = data[_FAN]
+    min_temp = data[_MIN_TEMP]
+    max_temp = data[_MAX_TEMP]
+    minutes = np.maximum(minutes, 0.0)
+
+    temperature = np.maximum(min_temp, np.minimum(max_temp, data[_TEMPERATURE]))
+    moisture = _clamp_moisture(temperature, data[_MOISTURE])
+    new_temperature = temperature.copy()
+    new_moisture = moisture.copy()
+    coil_limit, coil_rate = _coil(mode == _DRY, data, moisture)
+
+    # COOL, and AUTO above the tolerance band
+    temp_diff = temperature - target
+    auto = mode == _AUTO
+    cooling = (mode == _COOL) | (auto & (temp_diff > AUTO_TOLERANCE))
+    limit = np.where(auto, target + AUTO_TOLERANCE, target)
+    rate = data[_COOLING_RATE] * fan
+    active = _active_minutes(temperature - limit, rate, minutes)
+    apply = cooling & (active != 0)
+    new_temperature = np.where(apply, np.maximum(limit, temperature - rate * minutes), new_temperature)
+    new_moisture = np.where(
+        apply, _exchange(moisture, coil_limit, coil_rate, active), new_moisture
+    )
+
+    # HEAT, and AUTO below the tolerance band
+    heating = (mode == _HEAT) | (auto & (temp_diff < -AUTO_TOLERANCE))
+    limit = np.where(auto, target - AUTO_TOLERANCE, target)
+    rate = data[_HEATING_RATE] * fan
+    active = _active_minutes(limit - temperature, rate, minutes)
+    apply = heating & (active != 0)
+    new_temperature = np.where(apply, np.minimum(limit, temperature + rate * minutes), new_temperature)
+
+    # DRY
+    drying = mode == _DRY
+    rate = data[_COOLING_RATE] * DRY_COOLING_FACTOR * fan
+    new_temperature = np.where(
+        drying & (temperature > min_temp),
+        np.maximum(min_temp, temperature - rate * minutes),
+        new_temperature,
+    )
+    new_moisture = np.where(
+        drying, _exchange(moisture, coil_limit, coil_rate, minutes), new_moisture
+    )
+
+    # OFF
+    off = mode == _OFF
+    new_temperature = np.where(
+        off,
+        _approach(temperature, data[_DRIFT_TEMPERATURE], data[_DRIFT_RATE], minutes),
+        new_temperature,
+    )
+    outdoor_moisture, outdoor_rate = _outdoor(data)
+    new_moisture = np.where(
+        off, _exchange(moisture, outdoor_moisture, outdoor_rate, minutes), new_moisture
+    )
+
+    new_temperature = np.maximum(min_temp, np.minimum(max_temp, new_temperature))
+    return new_temperature, _clamp_moisture(new_temperature, new_moisture)
+
+
+def compressor_arrays(data, temperature):
+    """Return what the compressor does at temperature, as COMPRESSOR_* states.
+
+    Mirrors simulation.compressor_state for the simple model: the
+    compressor runs while it ramps towards the target, and while holding
+    it as long as the envelope lets heat flow the way the mode can act.
+    """
+    mode = data[_MODE]
+    temp_diff = temperature - data[_TARGET]
+    tolerance = np.where(mode == _AUTO, AUTO_TOLERANCE, 0.0)
+    can_cool = (mode == _COOL) | (mode == _AUTO)
+    can_heat = (mode == _HEAT) | (mode == _AUTO)
+    cool_ramp = can_cool & (temp_diff > tolerance)
+    heat_ramp = can_heat & (temp_diff < -tolerance)
+    holding = ~cool_ramp & ~heat_ramp
+    load = data[_HOLDING_LOAD] * (data[_DRIFT_TEMPERATURE] - temperature)
+    cooling = cool_ramp | (holding & can_cool & (load > 0)) | (mode == _DRY)
+    heating = heat_ramp | (holding & can_heat & (load < 0))
+    return np.where(
+        cooling, COMPRESSOR_COOLING, np.where(heating, COMPRESSOR_HEATING, COMPRESSOR_OFF)
+    )
+
+
+def next_change_arrays(data, temperature, moisture):
+    """Return minutes until the next observable change, inf when settled."""
+    mode = data[_MODE]
+    target = data[_TARGET]
+    fan = data[_FAN]
+    min_temp = data[_MIN_TEMP]
+    max_temp = data[_MAX_TEMP]
+    step = data[_TEMPERATURE_STEP]
+    result = np.full(temperature.shape, np.inf)
+    temperature_rate = np.zeros(temperature.shape)
+    moisture_limit = moisture
+    moisture_rate = np.zeros(temperature.shape)
+    coil_limit, coil_rate = _coil(mode == _DRY, data, moisture)
+
+    temp_diff = temperature - target
+    auto = mode == _AUTO
+
+    # COOL, and AUTO above the tolerance band
+    limit = np.where(auto, target + AUTO_TOLERANCE, target)
+    cooling = ((mode == _COOL) | (auto & (temp_diff > AUTO_TOLERANCE))) & (temperature > limit)
+    rate = data[_COOLING_RATE] * fan
+    result = np.where(cooling, _ramp_minutes(temperature, limit, rate, step), result)
+    temperature_rate = np.where(cooling, -rate, temperature_rate)
+    moisture_limit = np.where(cooling, coil_limit, moisture_limit)
+    moisture_rate = np.where(cooling, coil_rate, moisture_rate)
+
+    # HEAT, and AUTO below the tolerance band
+    limit = np.where(auto, target - AUTO_TOLERANCE, target)
+    heating = ((mode == _HEAT) | (auto & (temp_diff < -AUTO_TOLERANCE))) & (temperature < limit)
+    rate = data[_HEATING_RATE] * fan
+    result = np.where(heating, _ramp_minutes(temperature, limit, rate, step), result)
+    temperature_rate = np.where(heating, rate, temperature_rate)
+
+    # DRY
+    drying = mode == _DRY
+    above_min = drying & (temperature > min_temp)
+    rate = data[_COOLING_RATE] * DRY_COOLING_FACTOR * fan
+    result = np.where(above_min, _ramp_minutes(temperature, min_temp, rate, step), result)
+    temperature_rate = np.where(above_min, -rate, temperature_rate)
+    moisture_limit = np.where(drying, coil_limit, moisture_limit)
+    moisture_rate = np.where(drying, coil_rate, moisture_rate)
+
+    # OFF
+    off = mode == _OFF
+    ambient_temperature = np.maximum(min_temp, np.minimum(max_temp, data[_DRIFT_TEMPERATURE]))
+    result = np.where(
+        off, _ramp_minutes(temperature, ambient_temperature, data[_DRIFT_RATE], step), result
+    )
+    drift = np.where(
+        temperature != ambient_temperature,
+        np.copysign(data[_DRIFT_RATE], ambient_temperature - temperature),
+        0.0,
+    )
+    temperature_rate = np.where(off, drift, temperature_rate)
+    outdoor_moisture, outdoor_rate = _outdoor(data)
+    moisture_limit = np.where(off, outdoor_moisture, moisture_limit)
+    moisture_rate = np.where(off, outdoor_rate, moisture_rate)
+
+    return np.minimum(
+        result,
+        _humidity_minutes(temperature, moisture, temperature_rate, moisture_limit, moisture_rate),
+    )
+
+
+class VirtualACFleet:
+    """Array-backed store of all units managed by the scheduler."""
+
+    def __init__(self) -> None:
+        """Initialize an empty fleet."""
+        self._data = np.zeros((len(_FIELDS), _INITIAL_CAPACITY))
+        self._slots: dict[VirtualACClimate, int] = {}
+        self._free: list[int] = list(range(_INITIAL_CAPACITY - 1, -1, -1))
+
+    def __len__(self) -> int:
+        """Return the number of units in the fleet."""
+        return len(self._slots)
+
+    def __contains__(self, unit: VirtualACClimate) -> bool:
+        """Return True if the unit has a slot in the fleet."""
+        return unit in self._slots
+
+    def add(self, unit: VirtualACClimate) -> None:
+        """Give a unit a slot; its inputs are copied in by load."""
+        if unit not in self._slots:
+            if not self._free:
+                self._grow()
+            self._slots[unit] = self._free.pop()
+
+    def remove(self, unit: VirtualACClimate) -> None:
+        """Release the slot of a unit."""
+        if (slot := self._slots.pop(unit, None)) is not None:
+            self._free.append(slot)
+
+    def load(self, unit: VirtualACClimate) -> None:
+        """Copy the state and simulation inputs of a unit into its slot."""
+        if (slot := self._slots.get(unit)) is None:
+            return
+        hvac_mode, state, params, last_update, temperature_step = unit.simulation_inputs()
+        column = self._data[:, slot]
+        column[_MODE] = _MODE_CODES.get(hvac_mode, _FAN_ONLY)
+        column[_TEMPERATURE] = state.temperature
+        column[_MOISTURE] = state.moisture
+        column[_LAST_UPDATE] = np.nan if last_update is None else last_update
+        column[_TARGET] = params.target_temperature
+        column[_COOLING_RATE] = params.cooling_rate
+        column[_HEATING_RATE] = params.heating_rate
+        column[_DRY_RATE] = params.dry_humidity_rate
+        column[_AMBIENT_TEMPERATURE] = params.ambient_temperature
+        column[_AMBIENT_HUMIDITY] = params.ambient_humidity
+        column[_DRIFT_RATE] = params.ambient_drift_rate
+        column[_DRIFT_TEMPERATURE] = free_running_temperature(params)
+        # Load per degree the room is held away from the drift temperature
+        capacity = params.ac_capacity * params.fan_multiplier
+        column[_HOLDING_LOAD] = params.envelope_ua / capacity if capacity > 0 else 0.0
+        column[_FAN] = params.fan_multiplier
+        column[_MIN_TEMP] = params.min_temp
+        column[_MAX_TEMP] = params.max_temp
+        column[_TEMPERATURE_STEP] = temperature_step
+
+    @callback
+    def async_tick(self, units: list[VirtualACClimate]) -> list[float | None]:
+        """Advance units to now in one step and return their next delays.
+
+        Only units whose displayed temperature or humidity, or whose
+        compressor, changed write state. Delays are in real seconds, None for settled units and paused clocks.
+        """
+        slots = np.fromiter((self._slots[unit] for unit in units), dtype=np.intp, count=len(units))
+        # Units may follow different simulation clocks
+        now = np.fromiter((unit.clock.time() for unit in units), dtype=float, count=len(units))
+        data = self._data[:, slots]
+
+        last_update = data[_LAST_UPDATE]
+        minutes = np.where(np.isnan(last_update), 0.0, (now - last_update) / 60.0)
+        temperature, moisture = advance_arrays(data, minutes)
+        delays = next_change_arrays(data, temperature, moisture) * 60.0
+
+        step = data[_TEMPERATURE_STEP]
+        humidity = humidity_arrays(temperature, moisture)
+        old_humidity = humidity_arrays(data[_TEMPERATURE], data[_MOISTURE])
+        changed = (np.rint(temperature / step) != np.rint(data[_TEMPERATURE] / step)) | (
+            np.rint(humidity / HUMIDITY_STEP) != np.rint(old_humidity / HUMIDITY_STEP)
+        ) | (compressor_arrays(data, temperature) != compressor_arrays(data, data[_TEMPERATURE]))
+
+        self._data[_TEMPERATURE, slots] = temperature
+        self._data[_MOISTURE, slots] = moisture
+        self._data[_LAST_UPDATE, slots] = now
+
+        for unit, unit_temperature, unit_moisture, unit_humidity, unit_now, publish in zip(
+            units,
+            temperature.tolist(),
+            moisture.tolist(),
+            humidity.tolist(),
+            now.tolist(),
+            changed.tolist(),
+        ):
+            unit.async_apply_simulation(
+                unit_temperature, unit_moisture, unit_humidity, unit_now, publish
+            )
+
+        # Units keep ticking while they draw power, for their energy sensor
+        energy = np.fromiter(
+            (unit.next_energy_minutes() for unit in units), dtype=float, count=len(units)
+        )
+        delays = np.minimum(delays, energy * 60.0)
+
+        return [
+            unit.clock.real_delay(None if delay == np.inf else delay)
+            for unit, delay in zip(units, delays.tolist())
+        ]
+
+    def _grow(self) -> None:
+        """Double the capacity of the fleet arrays."""
+        capacity = self._data.shape[1]
+        data = np.zeros((len(_FIELDS), capacity * 2))
+        data[:, :capacity] = self._data
+        self._data = data
+        self._free.extend(range(capacity * 2 - 1, capacity - 1, -1))
@@ -0,0 +1,158 @@
+"""Follow mode: keep a Virtual AC unit in sync with real source entities."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+
+if TYPE_CHECKING:
+    from .climate import VirtualACClimate
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _parse_float(value: object, entity_id: str) -> float | None:
+    """Return value as a float, or None if it cannot be parsed."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        _LOGGER.warning("Could not parse value from %s: %s", entity_id, value)
+        return None
+
+
+def read_climate_source(state: State) -> dict[str, float]:
+    """Return the current temperature and humidity of a climate entity."""
+    humidity = state.attributes.get("current_humidity")
+    if humidity is None:
+        # Try alternative attribute names
+        humidity = state.attributes.get("humidity")
+    values = {
+        "current_temperature": _parse_float(
+            state.attributes.get("current_temperature"), state.entity_id
+        ),
+        "current_humidity": _parse_float(humidity, state.entity_id),
+    }
+    return {field: value for field, value in values.items() if value is not None}
+
+
+def read_weather_source(state: State) -> dict[str, float]:
+    """Return the outdoor temperature and humidity of a weather entity."""
+    temperature = state.attributes.get("temperature")
+    if temperature is None:
+        # Try alternative attribute names
+        temperature = state.state
+    values = {
+        "external_temperature": _parse_float(temperature, state.entity_id),
+        "external_humidity": _parse_float(state.attributes.get("humidity"), state.entity_id),
+    }
+    return {field: value for field, value in values.items() if value is not None}
+
+
+class VirtualACFollower:
+    """Push changes of source entities into a unit as they happen.
+
+    Only values that moved by more than the deadband since they were last
+    pushed are applied. With a minimum interval, changes arriving faster are
+    collected and pushed together once the interval has passed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        unit: VirtualACClimate,
+        climate_entity_id: str | None,
+        weather_entity_id: str | None,
+        min_interval: float = 0.0,
+        deadband: float = 0.0,
+    ) -> None:
+        """Initialize the follower."""
+        self.hass = hass
+        self._unit = unit
+        self._climate_entity_id = climate_entity_id
+        self._weather_entity_id = weather_entity_id
+        self._min_interval = min_interval
+        self._deadband = deadband
+        self._pushed: dict[str, float] = {}
+        self._pending: dict[str, float] = {}
+        self._last_push: float | None = None
+        self._unsub_track: CALLBACK_TYPE | None = None
+        self._unsub_push: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Subscribe to the sources and push their current values."""
+        entity_ids = [
+            entity_id
+            for entity_id in (self._climate_entity_id, self._weather_entity_id)
+            if entity_id
+        ]
+        self._unsub_track = async_track_state_change_event(
+            self.hass, entity_ids, self._async_source_changed
+        )
+        for entity_id in entity_ids:
+            if (state := self.hass.states.get(entity_id)) is not None:
+                self._collect(entity_id, state)
+        self._async_push()
+
+    @callback
+    def async_stop(self) -> None:
+        """Unsubscribe from the sources and drop pending values."""
+        if self._unsub_track is not None:
+            self._unsub_track()
+            self._unsub_track = None
+        if self._unsub_push is not None:
+            self._unsub_push()
+            self._unsub_push = None
+        self._pending.clear()
+
+    def _collect(self, entity_id: str, state: State) -> None:
+        """Add the values of a source that moved beyond the deadband."""
+        if entity_id == self._climate_entity_id:
+            values = read_climate_source(state)
+        else:
+            values = read_weather_source(state)
+        for field, value in values.items():
+            pushed = self._pushed.get(field)
+            if pushed is None or abs(value - pushed) > self._deadband:
+                self._pending[field] = value
+            else:
+                # Back within the deadband of the applied value
+                self._pending.pop(field, None)
+
+    @callback
+    def _async_source_changed(self, event: Event) -> None:
+        """Handle a state change of a source entity."""
+        if (state := event.data.get("new_state")) is None:
+            return
+        self._collect(event.data["entity_id"], state)
+        if not self._pending or self._unsub_push is not None:
+            return
+        if self._last_push is not None:
+            wait = self._last_push + self._min_interval - self.hass.loop.time()
+            if wait > 0:
+                self._unsub_push = async_call_later(self.hass, wait, self._async_push_later)
+                return
+        self._async_push()
+
+    @callback
+    def _async_push_later(self, _now: datetime) -> None:
+        """Push the values collected while rate limited."""
+        self._unsub_push = None
+        self._async_push()
+
+    @callback
+    def _async_push(self) -> None:
+        """Apply the pending values to the unit."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self._pushed.update(pending)
+        self._last_push = self.hass.loop.time()
+        _LOGGER.debug("Following sources for %s: %s", self._unit.entity_id, pending)
+        self._unit.async_apply_current_state(**pending)
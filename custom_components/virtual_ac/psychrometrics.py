@@ -0,0 +1,67 @@
+"""Psychrometric helpers for the Virtual AC simulation.
+
+The simulation tracks the moisture content of the room air (mixing ratio in
+grams of water per kilogram of dry air) instead of its relative humidity, so
+cooling raises and heating lowers the relative humidity like in a real room.
+Relative humidity is derived from the saturation vapor pressure using the
+Magnus approximation, which costs a single exponential and is accurate to
+within about 0.4% between -40 and 50 °C.
+
+The helpers only use arithmetic operators, so they work unchanged on floats
+and on NumPy arrays.
+"""
+
+from __future__ import annotations
+
+import math
+
+# Magnus coefficients over liquid water (Alduchov and Eskridge, 1996)
+MAGNUS_A = 6.1094  # hPa
+MAGNUS_B = 17.625
+MAGNUS_C = 243.04  # °C
+
+# Standard air pressure at sea level (hPa)
+AIR_PRESSURE = 1013.25
+
+# Ratio of the molar masses of water vapor and dry air (g/kg)
+MOLAR_MASS_RATIO = 621.97
+
+
+def saturation_vapor_pressure(temperature):
+    """Return the saturation vapor pressure (hPa) at temperature (°C)."""
+    return MAGNUS_A * math.e ** (MAGNUS_B * temperature / (MAGNUS_C + temperature))
+
+
+def saturation_moisture(temperature):
+    """Return the moisture content (g/kg) of saturated air at temperature."""
+    pressure = saturation_vapor_pressure(temperature)
+    return MOLAR_MASS_RATIO * pressure / (AIR_PRESSURE - pressure)
+
+
+def moisture_content(temperature, relative_humidity):
+    """Return the moisture content (g/kg) of air at temperature and relative humidity (%)."""
+    pressure = saturation_vapor_pressure(temperature) * relative_humidity / 100.0
+    return MOLAR_MASS_RATIO * pressure / (AIR_PRESSURE - pressure)
+
+
+def relative_humidity(temperature, moisture):
+    """Return the relative humidity (%) of air at temperature with moisture content."""
+    pressure = AIR_PRESSURE * moisture / (MOLAR_MASS_RATIO + moisture)
+    return 100.0 * pressure / saturation_vapor_pressure(temperature)
+
+
+def relative_humidity_slopes(temperature, moisture):
+    """Return how fast relative humidity changes with temperature and with moisture.
+
+    The slopes are in % per °C and % per g/kg at the given conditions.
+    """
+    humidity = relative_humidity(temperature, moisture)
+    by_temperature = -humidity * MAGNUS_B * MAGNUS_C / (MAGNUS_C + temperature) ** 2
+    by_moisture = (
+        100.0
+        * AIR_PRESSURE
+        * MOLAR_MASS_RATIO
+        / (MOLAR_MASS_RATIO + moisture) ** 2
+        / saturation_vapor_pressure(temperature)
+    )
+    return by_temperature, by_moisture
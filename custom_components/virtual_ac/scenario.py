@@ -0,0 +1,328 @@
+"""Scenario player: stream outdoor conditions and disturbances into Virtual AC units."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import logging
+import math
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_ENTITY_INDEX, DOMAIN
+
+if TYPE_CHECKING:
+    from .climate import VirtualACClimate
+    from .clock import VirtualACClock
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rows read from a scenario file at a time
+READ_AHEAD = 500
+
+# Columns holding the time of a row: simulated minutes since the scenario
+# started, or a date and time counted from the first row
+COLUMN_MINUTES = "minutes"
+COLUMN_TIME = "time"
+# Column naming the unit a row applies to, which must be a unit of the
+# scenario; rows without one apply to every unit of the scenario
+COLUMN_ENTITY_ID = "entity_id"
+
+# Columns applied to units, named like the set_state fields
+COLUMN_EXTERNAL_TEMPERATURE = "external_temperature"
+COLUMN_EXTERNAL_HUMIDITY = "external_humidity"
+COLUMN_HEAT_GAIN = "heat_gain"
+COLUMN_DOOR_OPEN = "door_open"
+VALUE_COLUMNS = (
+    COLUMN_EXTERNAL_TEMPERATURE,
+    COLUMN_EXTERNAL_HUMIDITY,
+    COLUMN_HEAT_GAIN,
+    COLUMN_DOOR_OPEN,
+)
+
+_TRUE_VALUES = {"1", "true", "on", "open", "yes"}
+_FALSE_VALUES = {"0", "false", "off", "closed", "no"}
+
+
+@dataclass(slots=True)
+class ScenarioRow:
+    """Values a scenario applies at one point in time."""
+
+    # Simulated minutes since the scenario started
+    minutes: float
+    # Unit the values apply to, None for every unit of the scenario
+    entity_id: str | None
+    values: dict[str, float | bool]
+
+
+def _parse_value(column: str, value: Any) -> float | bool | None:
+    """Return the value of a column, None if it is empty."""
+    if value is None or value == "":
+        return None
+    if column != COLUMN_DOOR_OPEN:
+        return float(value)
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid {COLUMN_DOOR_OPEN} value: {value}")
+
+
+def _parse_minutes(record: dict[str, Any], start: datetime | None) -> tuple[float, datetime | None]:
+    """Return the minutes of a row since the start, and the date and time of the first row."""
+    if record.get(COLUMN_MINUTES) not in (None, ""):
+        return float(record[COLUMN_MINUTES]), start
+    if record.get(COLUMN_TIME) in (None, ""):
+        raise ValueError(f"Scenario rows need a {COLUMN_MINUTES} or {COLUMN_TIME} column")
+    when = dt_util.parse_datetime(str(record[COLUMN_TIME]))
+    if when is None:
+        raise ValueError(f"Invalid {COLUMN_TIME} value: {record[COLUMN_TIME]}")
+    when = dt_util.as_utc(when)
+    if start is None:
+        start = when
+    return (when - start).total_seconds() / 60.0, start
+
+
+def parse_scenario(records: Iterable[dict[str, Any]]) -> Iterator[ScenarioRow]:
+    """Yield a scenario row for every record, checking that they are in time order."""
+    start: datetime | None = None
+    last = 0.0
+    for number, record in enumerate(records, 1):
+        try:
+            minutes, start = _parse_minutes(record, start)
+            values = {
+                column: value
+                for column in VALUE_COLUMNS
+                if (value := _parse_value(column, record.get(column))) is not None
+            }
+        except (TypeError, ValueError) as err:
+            raise ValueError(f"Row {number}: {err}") from err
+        if minutes < last:
+            raise ValueError(f"Row {number} is earlier than the row before it")
+        last = minutes
+        yield ScenarioRow(minutes, record.get(COLUMN_ENTITY_ID) or None, values)
+
+
+def read_scenario(path: str) -> Iterator[ScenarioRow]:
+    """Yield the rows of a scenario file one at a time.
+
+    CSV files (.csv) have a header row naming the columns. Other files are
+    read as JSON Lines, one object per line, since a single JSON document
+    cannot be read incrementally. Only the current line is held in memory,
+    and the file is closed once the rows are exhausted or the generator is.
+    """
+    with open(path, encoding="utf-8", newline="") as file:
+        if Path(path).suffix.lower() == ".csv":
+            records: Iterable[dict[str, Any]] = csv.DictReader(file)
+        else:
+            records = (json.loads(line) for line in file if line.strip())
+        yield from parse_scenario(records)
+
+
+class VirtualACScenario:
+    """A scenario file played into units along their simulation clock.
+
+    Rows are read in batches of READ_AHEAD in the executor, the next batch
+    while the current one plays, so a scenario holds at most a few hundred
+    rows whatever its length and the number of its units. Each row goes off
+    as a clock alarm at its simulated time: the scenario runs at the speed
+    of the clock, and a jump of the clock stops at every row on its way.
+    Rows due at the same time are applied to each unit in a single update.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, clock: VirtualACClock, path: str, entity_ids: list[str]
+    ) -> None:
+        """Initialize a scenario starting now."""
+        self.hass = hass
+        self.clock = clock
+        self.path = path
+        self.entity_ids = entity_ids
+        self._units = frozenset(entity_ids)
+        self._index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+        self._start = clock.time()
+        self._rows = read_scenario(path)
+        self._buffer: deque[ScenarioRow] = deque()
+        self._exhausted = False
+        self._stopped = False
+        self._reading: asyncio.Task[None] | None = None
+        self._cancel_alarm: CALLBACK_TYPE | None = None
+        self.rows_played = 0
+
+    @property
+    def active(self) -> bool:
+        """Return True until the scenario was stopped or played its last row."""
+        return not self._stopped and not (self._exhausted and not self._buffer)
+
+    @property
+    def horizon(self) -> float:
+        """Return the simulated time of the last row read, infinity once all rows are."""
+        if self._exhausted or self._stopped:
+            return math.inf
+        if not self._buffer:
+            return self._start
+        return self._due(self._buffer[-1])
+
+    async def async_start(self) -> None:
+        """Read the first rows and wait for the first one to be due."""
+        await self.async_fill()
+        _LOGGER.debug("Playing scenario %s into %s", self.path, self.entity_ids)
+        self._schedule()
+
+    async def async_fill(self) -> None:
+        """Read the next batch of rows once fewer than half a batch are left."""
+        if (
+            self._reading is None
+            and self.active
+            and not self._exhausted
+            and len(self._buffer) < READ_AHEAD // 2
+        ):
+            self._reading = self.hass.async_create_task(self._async_read_batch())
+        if self._reading is not None:
+            await self._reading
+
+    async def async_read_ahead(self) -> None:
+        """Read the next batch of rows, stopping the scenario if the file is invalid."""
+        try:
+            await self.async_fill()
+        except (OSError, ValueError) as err:
+            _LOGGER.error("Stopping scenario %s: %s", self.path, err)
+            self.async_stop()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop playing and close the file."""
+        self._stopped = True
+        self._buffer.clear()
+        if self._cancel_alarm is not None:
+            self._cancel_alarm()
+            self._cancel_alarm = None
+        if self._reading is None:
+            # A batch being read closes the file when it completes
+            self._rows.close()
+
+    async def _async_read_batch(self) -> None:
+        """Read up to READ_AHEAD rows in the executor."""
+        try:
+            rows = await self.hass.async_add_executor_job(list, islice(self._rows, READ_AHEAD))
+        finally:
+            self._reading = None
+        if self._stopped:
+            self._rows.close()
+            return
+        for row in rows:
+            if row.entity_id is not None and row.entity_id not in self._units:
+                raise ValueError(f"{row.entity_id} is not a unit of the scenario")
+        self._buffer.extend(rows)
+        if len(rows) < READ_AHEAD:
+            self._exhausted = True
+        self._schedule()
+
+    def _due(self, row: ScenarioRow) -> float:
+        """Return the simulated time a row is due at."""
+        return self._start + row.minutes * 60.0
+
+    def _schedule(self) -> None:
+        """Wait for the next row to be due."""
+        if self._stopped or self._cancel_alarm is not None or not self._buffer:
+            return
+        self._cancel_alarm = self.clock.async_call_at(
+            self._due(self._buffer[0]), self._async_play
+        )
+
+    @callback
+    def _async_play(self) -> None:
+        """Apply the rows that are due and read ahead when running low."""
+        self._cancel_alarm = None
+        now = self.clock.time()
+        updates: dict[VirtualACClimate, dict[str, float | bool]] = {}
+        while self._buffer and self._due(self._buffer[0]) <= now:
+            row = self._buffer.popleft()
+            for entity_id in [row.entity_id] if row.entity_id else self.entity_ids:
+                if (unit := self._index.get(entity_id)) is not None:
+                    updates.setdefault(unit, {}).update(row.values)
+            self.rows_played += 1
+        for unit, values in updates.items():
+            unit.async_apply_current_state(**values)
+        self._schedule()
+        if not self._exhausted and self._reading is None and len(self._buffer) < READ_AHEAD // 2:
+            self.hass.async_create_task(self.async_read_ahead())
+        elif not self.active:
+            _LOGGER.debug("Scenario %s finished after %d rows", self.path, self.rows_played)
+
+
+class VirtualACScenarios:
+    """The scenarios playing into Virtual AC units."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize without scenarios."""
+        self.hass = hass
+        self._scenarios: list[VirtualACScenario] = []
+
+    async def async_play(
+        self, path: str, clock: VirtualACClock, units: list[VirtualACClimate]
+    ) -> VirtualACScenario:
+        """Start playing a scenario file into units along a clock."""
+        scenario = VirtualACScenario(self.hass, clock, path, [unit.entity_id for unit in units])
+        try:
+            await scenario.async_start()
+        except OSError as err:
+            scenario.async_stop()
+            raise ValueError(f"Cannot read scenario {path}: {err}") from err
+        except ValueError as err:
+            scenario.async_stop()
+            raise ValueError(f"Invalid scenario {path}: {err}") from err
+        self._prune()
+        self._scenarios.append(scenario)
+        return scenario
+
+    @callback
+    def async_stop(self, entity_ids: set[str] | None = None) -> None:
+        """Stop the scenarios playing into any of the units, or all of them."""
+        for scenario in self._scenarios:
+            if entity_ids is None or entity_ids.intersection(scenario.entity_ids):
+                scenario.async_stop()
+        self._prune()
+
+    async def async_advance(self, clock: VirtualACClock, seconds: float) -> None:
+        """Jump a clock forward, reading ahead the scenarios playing along it.
+
+        The jump is split where a scenario runs out of rows read, so each
+        scenario holds no more than a batch of rows however long the jump.
+        """
+        target = clock.time() + seconds
+        while True:
+            self._prune()
+            scenarios = [scenario for scenario in self._scenarios if scenario.clock is clock]
+            for scenario in scenarios:
+                await scenario.async_read_ahead()
+            horizon = min((scenario.horizon for scenario in scenarios), default=math.inf)
+            if horizon >= target:
+                clock.async_jump_to(target)
+                return
+            clock.async_jump_to(horizon)
+
+    def as_list(self, entity_id: str) -> list[dict[str, Any]]:
+        """Return the scenarios playing into a unit for diagnostics."""
+        self._prune()
+        return [
+            {"path": scenario.path, "rows_played": scenario.rows_played}
+            for scenario in self._scenarios
+            if entity_id in scenario.entity_ids
+        ]
+
+    def _prune(self) -> None:
+        """Forget the scenarios that stopped or finished."""
+        self._scenarios = [scenario for scenario in self._scenarios if scenario.active]
@@ -0,0 +1,313 @@
+"""Shared simulation scheduler for Virtual AC units."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import count
+from typing import Protocol
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_at
+from homeassistant.helpers.start import async_at_started
+
+from .fleet import FLEET_MIN_UNITS, VirtualACFleet, fleet_available
+from .stats import VirtualACStats
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class TickStats:
+    """How late scheduler ticks fired compared to their deadlines (seconds)."""
+
+    ticks: int = 0
+    last_lateness: float = 0.0
+    max_lateness: float = 0.0
+    total_lateness: float = 0.0
+
+    @property
+    def mean_lateness(self) -> float:
+        """Return the average lateness of all ticks."""
+        return self.total_lateness / self.ticks if self.ticks else 0.0
+
+    def record(self, lateness: float) -> None:
+        """Add the lateness of one tick."""
+        self.ticks += 1
+        self.last_lateness = lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+        self.total_lateness += lateness
+
+
+class SimulationUnit(Protocol):
+    """What the scheduler ticks: a climate entity or a building of them."""
+
+    entity_id: str
+    stats: VirtualACStats
+
+    @property
+    def update_interval(self) -> int:
+        """Return the simulation update interval in seconds."""
+
+    @property
+    def vectorizable(self) -> bool:
+        """Return True if the fleet engine can simulate this unit."""
+
+    def async_simulation_tick(self) -> float | None:
+        """Advance by one tick and return the real seconds until the next change."""
+
+
+class VirtualACScheduler:
+    """Drive every realistic-mode unit from a single timer.
+
+    Units are grouped by their update interval. Each group has one deadline
+    and all units in a group are advanced together in the same callback, so
+    the event loop wakes once per group tick instead of once per unit.
+
+    After each tick a unit reports when its next observable change happens.
+    Units that will not change within their interval sleep until that moment,
+    and units that have settled are parked until one of their inputs changes.
+
+    When NumPy is available, large batches of units using the simple thermal
+    model are advanced by the vectorized fleet engine instead of one unit at
+    a time.
+
+    Deadlines are absolute times on the monotonic event loop clock. A group
+    ticks at deadline + interval after each tick, no matter how long the
+    tick took, so processing time does not accumulate as drift. If the loop
+    lagged by more than an interval, the missed ticks are skipped: the
+    engine catches up in one step and the group keeps its original phase.
+
+    Units registered while Home Assistant is starting do not tick until it
+    has started, so a large fleet does not compete with the other
+    integrations for the event loop. Each group then starts at a random
+    phase within its interval, so groups of different intervals do not
+    tick in lockstep. The first tick of a unit covers the whole wait in one
+    step of the closed-form engine.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._units: set[SimulationUnit] = set()
+        self._groups: dict[int, set[SimulationUnit]] = {}
+        self._deadlines: dict[int, float] = {}
+        self._sleepers: list[tuple[float, int, SimulationUnit]] = []
+        self._wake_times: dict[SimulationUnit, float] = {}
+        self._sequence = count()
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._fleet = VirtualACFleet() if fleet_available() else None
+        self.stats = TickStats()
+        self._started = False
+        self._unsub_started: CALLBACK_TYPE | None = async_at_started(
+            hass, self._async_ha_started
+        )
+
+    def is_registered(self, unit: SimulationUnit) -> bool:
+        """Return True if the unit is managed by the scheduler."""
+        return unit in self._units
+
+    @callback
+    def async_register(self, unit: SimulationUnit) -> None:
+        """Start ticking a unit with its group."""
+        if not self._started and self._unsub_started is None:
+            # Shut down while Home Assistant was starting
+            self._unsub_started = async_at_started(self.hass, self._async_ha_started)
+        self._units.add(unit)
+        if self._fleet is not None and unit.vectorizable:
+            self._fleet.add(unit)
+        self.async_wake(unit)
+
+    @callback
+    def async_unregister(self, unit: SimulationUnit) -> None:
+        """Stop ticking a unit."""
+        self._units.discard(unit)
+        if self._fleet is not None:
+            self._fleet.remove(unit)
+        self._wake_times.pop(unit, None)
+        self._remove_from_group(unit)
+        self._async_schedule()
+
+    @callback
+    def async_wake(self, unit: SimulationUnit) -> None:
+        """Tick a sleeping or parked unit again with its group.
+
+        Called when an input of the unit changes, since that invalidates the
+        time of its next change.
+        """
+        if unit not in self._units:
+            return
+        if self._fleet is not None:
+            self._fleet.load(unit)
+        self._wake_times.pop(unit, None)
+        self._add_to_group(unit, self.hass.loop.time() + unit.update_interval)
+        self._async_schedule()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the timer and forget all units."""
+        if self._unsub_started is not None:
+            self._unsub_started()
+            self._unsub_started = None
+        self._units.clear()
+        self._groups.clear()
+        self._deadlines.clear()
+        self._sleepers.clear()
+        self._wake_times.clear()
+        if self._fleet is not None:
+            self._fleet = VirtualACFleet()
+        self._async_cancel_timer()
+
+    @callback
+    def _async_ha_started(self, _hass: HomeAssistant) -> None:
+        """Start ticking the units registered while Home Assistant was starting."""
+        self._unsub_started = None
+        self._started = True
+        now = self.hass.loop.time()
+        for interval in self._deadlines:
+            self._deadlines[interval] = now + random.uniform(0, interval)
+        self._async_schedule()
+
+    def _add_to_group(self, unit: SimulationUnit, deadline: float) -> None:
+        """Add a unit to the group of its update interval.
+
+        The deadline is only used if the group has none yet.
+        """
+        interval = unit.update_interval
+        group = self._groups.setdefault(interval, set())
+        if not group:
+            self._deadlines[interval] = deadline
+        group.add(unit)
+
+    def _remove_from_group(self, unit: SimulationUnit) -> None:
+        """Remove a unit from the group of its update interval."""
+        interval = unit.update_interval
+        group = self._groups.get(interval)
+        if group is None:
+            return
+        group.discard(unit)
+        if not group:
+            del self._groups[interval]
+            del self._deadlines[interval]
+
+    def _place(
+        self,
+        unit: SimulationUnit,
+        delay: float | None,
+        now: float,
+        next_deadlines: dict[int, float],
+    ) -> None:
+        """Decide how a unit waits for its next change after a tick."""
+        if unit not in self._units:
+            return
+        interval = unit.update_interval
+        if delay is not None and delay <= interval:
+            self._add_to_group(unit, next_deadlines.get(interval, now + interval))
+            return
+        self._remove_from_group(unit)
+        if delay is None:
+            # Settled: parked until async_wake
+            return
+        wake_time = now + delay
+        self._wake_times[unit] = wake_time
+        heapq.heappush(self._sleepers, (wake_time, next(self._sequence), unit))
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        """Cancel the pending timer, if any."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Arm the timer for the earliest group deadline or wake time."""
+        self._async_cancel_timer()
+        if not self._started:
+            return
+        # Drop sleepers that were woken or unregistered in the meantime
+        while self._sleepers and self._wake_times.get(self._sleepers[0][2]) != self._sleepers[0][0]:
+            heapq.heappop(self._sleepers)
+        deadlines = list(self._deadlines.values())
+        if self._sleepers:
+            deadlines.append(self._sleepers[0][0])
+        if not deadlines:
+            return
+        self._unsub_timer = async_call_at(self.hass, self._async_tick, min(deadlines))
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Advance every group and sleeper whose time has come."""
+        self._unsub_timer = None
+        now = self.hass.loop.time()
+
+        due: list[SimulationUnit] = []
+        lateness: dict[SimulationUnit, float] = {}
+        next_deadlines: dict[int, float] = {}
+        earliest = now
+        for interval, deadline in list(self._deadlines.items()):
+            if deadline <= now:
+                group = self._groups.pop(interval)
+                due.extend(group)
+                lateness.update(dict.fromkeys(group, now - deadline))
+                del self._deadlines[interval]
+                next_deadlines[interval] = self._next_deadline(interval, deadline, now)
+                earliest = min(earliest, deadline)
+        while self._sleepers and self._sleepers[0][0] <= now:
+            wake_time, _, unit = heapq.heappop(self._sleepers)
+            if self._wake_times.get(unit) == wake_time:
+                del self._wake_times[unit]
+                due.append(unit)
+                lateness[unit] = now - wake_time
+                earliest = min(earliest, wake_time)
+        if due:
+            self.stats.record(now - earliest)
+
+        if self._fleet is not None:
+            batch = [unit for unit in due if unit in self._fleet]
+            if len(batch) >= FLEET_MIN_UNITS:
+                started = time.perf_counter()
+                try:
+                    delays = self._fleet.async_tick(batch)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error in Virtual AC fleet simulation tick")
+                    delays = [None] * len(batch)
+                # Units of a batch share its cost evenly
+                duration = (time.perf_counter() - started) / len(batch)
+                for unit, delay in zip(batch, delays):
+                    unit.stats.record_tick(duration, lateness[unit])
+                    self._place(unit, delay, now, next_deadlines)
+                due = [unit for unit in due if unit not in self._fleet]
+
+        for unit in due:
+            started = time.perf_counter()
+            try:
+                delay = unit.async_simulation_tick()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in Virtual AC simulation tick for %s", unit.entity_id)
+                delay = None
+            unit.stats.record_tick(time.perf_counter() - started, lateness[unit])
+            if self._fleet is not None:
+                self._fleet.load(unit)
+            self._place(unit, delay, now, next_deadlines)
+
+        self._async_schedule()
+
+    @staticmethod
+    def _next_deadline(interval: int, deadline: float, now: float) -> float:
+        """Return the first deadline of a group after now, keeping its phase."""
+        next_deadline = deadline + interval
+        if next_deadline > now:
+            return next_deadline
+        missed = int((now - deadline) // interval)
+        _LOGGER.debug(
+            "Simulation ticks of the %ss group are %.1fs late, skipping %d missed ticks",
+            interval,
+            now - deadline,
+            missed,
+        )
+        return deadline + (missed + 1) * interval
@@ -12,6 +12,7 @@ from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import (
     DOMAIN,
+    DATA_ENTITY_INDEX,
     FAN_AUTO,
     FAN_HIGH,
     FAN_LOW,
@@ -65,6 +66,13 @@ class VirtualACBaseSelect(SelectEntity):
         """When entity is added to hass."""
         await super().async_added_to_hass()
 
+        # Let services resolve this select to its climate entity
+        self.async_on_remove(
+            self.hass.data[DOMAIN][DATA_ENTITY_INDEX].async_add_entity(
+                self.entity_id, self._entry.entry_id
+            )
+        )
+
         # Listen for climate entity state changes
         @callback
         def _state_change_listener(event: Event) -> None:
@@ -2,20 +2,49 @@
 
 from __future__ import annotations
 
+from asyncio import TimerHandle
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME, PERCENTAGE, UnitOfTemperature
+from homeassistant.const import (
+    CONF_NAME,
+    PERCENTAGE,
+    UnitOfEnergy,
+    UnitOfPower,
+    UnitOfTemperature,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import VirtualACCoordinator
+from .const import (
+    DOMAIN,
+    DATA_ENTITY_INDEX,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_HUMIDITY_DEADBAND,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_HUMIDITY_DEADBAND,
+    SENSOR_SETTLE_TIME,
+)
+from .coordinator import (
+    FIELD_COMPRESSOR_CYCLES,
+    FIELD_CURRENT_HUMIDITY,
+    FIELD_CURRENT_TEMPERATURE,
+    FIELD_ENERGY,
+    FIELD_EXTERNAL_HUMIDITY,
+    FIELD_EXTERNAL_TEMPERATURE,
+    FIELD_POWER,
+    VirtualACCoordinator,
+)
+from .energy import ENERGY_PRECISION
+from .stats import async_get_stats
+
+# Marker for a sensor that has not written any state yet
+_UNPUBLISHED = object()
 
 
 async def async_setup_entry(
@@ -31,7 +60,7 @@ async def async_setup_entry(
 
     if coordinator is None:
         # Fallback: create coordinator if it doesn't exist
-        coordinator = VirtualACCoordinator(entry)
+        coordinator = VirtualACCoordinator(hass, entry)
         if DOMAIN not in hass.data:
             hass.data[DOMAIN] = {}
         if entry.entry_id not in hass.data[DOMAIN]:
@@ -45,15 +74,30 @@ async def async_setup_entry(
         VirtualACIndoorHumiditySensor(coordinator, entry, device_name),
         VirtualACOutdoorTemperatureSensor(coordinator, entry, device_name),
         VirtualACOutdoorHumiditySensor(coordinator, entry, device_name),
+        VirtualACPowerSensor(coordinator, entry, device_name),
+        VirtualACEnergySensor(coordinator, entry, device_name),
+        VirtualACCompressorCyclesSensor(coordinator, entry, device_name),
     ]
 
     async_add_entities(entities)
 
 
 class VirtualACBaseSensor(SensorEntity):
-    """Base class for Virtual AC sensors."""
+    """Base class for Virtual AC sensors.
+
+    State is only written when the value, rounded to the display precision,
+    moved by at least the deadband since the last published value. A value
+    held back by the deadband is still written once it stayed unchanged for
+    SENSOR_SETTLE_TIME, so a settled unit does not leave its sensors behind.
+    """
 
     _attr_has_entity_name = True
+    # The coordinator pushes every simulation step
+    _attr_should_poll = False
+    _deadband_key: str | None = None
+    _deadband_default: float = 0.0
+    # Coordinator field this sensor displays
+    _coordinator_field: str | None = None
 
     def __init__(
         self,
@@ -65,6 +109,14 @@ class VirtualACBaseSensor(SensorEntity):
         self.coordinator = coordinator
         self._entry = entry
         self._device_name = device_name
+        self._last_published: object = _UNPUBLISHED
+        # When the held back value last changed, and the timer writing it
+        self._changed_at = 0.0
+        self._settle_timer: TimerHandle | None = None
+        self._stats = async_get_stats(coordinator.hass, entry.entry_id)
+
+        config = {**(entry.data or {}), **(entry.options or {})}
+        self._deadband = config.get(self._deadband_key, self._deadband_default)
 
         # Device info
         self._attr_device_info = DeviceInfo(
@@ -75,17 +127,93 @@ class VirtualACBaseSensor(SensorEntity):
             sw_version="1.0.0",
         )
 
-        # Add listener for updates
-        coordinator.add_listener(self._handle_coordinator_update)
-
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle coordinator update."""
+        value = self._rounded(self.native_value)
+        if self._should_publish(value):
+            self._publish(value)
+            return
+        self._stats.writes_suppressed += 1
+        if value == self._last_published:
+            return
+        self._changed_at = self.hass.loop.time()
+        if self._settle_timer is None:
+            self._settle_timer = self.hass.loop.call_later(
+                SENSOR_SETTLE_TIME, self._async_write_settled
+            )
+
+    @callback
+    def _async_write_settled(self) -> None:
+        """Write the held back value once it stopped changing."""
+        remaining = self._changed_at + SENSOR_SETTLE_TIME - self.hass.loop.time()
+        if remaining > 0:
+            self._settle_timer = self.hass.loop.call_later(
+                remaining, self._async_write_settled
+            )
+            return
+        self._settle_timer = None
+        value = self._rounded(self.native_value)
+        if value != self._last_published:
+            self._publish(value)
+
+    @callback
+    def _publish(self, value: float | None) -> None:
+        """Write the state for a value."""
+        self._cancel_settle_timer()
+        self._last_published = value
         self.async_write_ha_state()
 
+    @callback
+    def _cancel_settle_timer(self) -> None:
+        """Stop waiting for a held back value to settle."""
+        if self._settle_timer is not None:
+            self._settle_timer.cancel()
+            self._settle_timer = None
+
+    def _rounded(self, value: float | None) -> float | None:
+        """Return the value rounded to the display precision, if any."""
+        precision = self.suggested_display_precision
+        if value is None or precision is None:
+            return value
+        return round(value, precision)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and count the write."""
+        self._stats.writes += 1
+        super().async_write_ha_state()
+
+    def _should_publish(self, value: float | None) -> bool:
+        """Return True if the rounded value differs enough from the last published one."""
+        last = self._last_published
+        if last is _UNPUBLISHED:
+            return True
+        if value is None or last is None:
+            return value is not last
+        if value == last:
+            return False
+        return abs(value - last) >= self._deadband
+
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+
+        # Let services resolve this sensor to its climate entity
+        self.async_on_remove(
+            self.hass.data[DOMAIN][DATA_ENTITY_INDEX].async_add_entity(
+                self.entity_id, self._entry.entry_id
+            )
+        )
+
+        # Only wake up for the field this sensor displays
+        fields = [self._coordinator_field] if self._coordinator_field else None
+        self.async_on_remove(
+            self.coordinator.add_listener(self._handle_coordinator_update, fields)
+        )
+
+        self.async_on_remove(self._cancel_settle_timer)
+
         # Initial update
         self._handle_coordinator_update()
 
@@ -96,6 +224,10 @@ class VirtualACIndoorTemperatureSensor(VirtualACBaseSensor):
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_suggested_display_precision = 1
+    _deadband_key = CONF_TEMPERATURE_DEADBAND
+    _deadband_default = DEFAULT_TEMPERATURE_DEADBAND
+    _coordinator_field = FIELD_CURRENT_TEMPERATURE
 
     def __init__(
         self,
@@ -126,6 +258,9 @@ class VirtualACIndoorHumiditySensor(VirtualACBaseSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_suggested_display_precision = 1
+    _deadband_key = CONF_HUMIDITY_DEADBAND
+    _deadband_default = DEFAULT_HUMIDITY_DEADBAND
+    _coordinator_field = FIELD_CURRENT_HUMIDITY
 
     def __init__(
         self,
@@ -158,6 +293,10 @@ class VirtualACOutdoorTemperatureSensor(VirtualACBaseSensor):
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_suggested_display_precision = 1
+    _deadband_key = CONF_TEMPERATURE_DEADBAND
+    _deadband_default = DEFAULT_TEMPERATURE_DEADBAND
+    _coordinator_field = FIELD_EXTERNAL_TEMPERATURE
 
     def __init__(
         self,
@@ -188,6 +327,9 @@ class VirtualACOutdoorHumiditySensor(VirtualACBaseSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_suggested_display_precision = 1
+    _deadband_key = CONF_HUMIDITY_DEADBAND
+    _deadband_default = DEFAULT_HUMIDITY_DEADBAND
+    _coordinator_field = FIELD_EXTERNAL_HUMIDITY
 
     def __init__(
         self,
@@ -212,3 +354,92 @@ class VirtualACOutdoorHumiditySensor(VirtualACBaseSensor):
         if humidity is not None:
             return round(humidity, 1)
         return None
+
+
+class VirtualACPowerSensor(VirtualACBaseSensor):
+    """Electrical power sensor for Virtual AC."""
+
+    _attr_device_class = SensorDeviceClass.POWER
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfPower.WATT
+    _coordinator_field = FIELD_POWER
+
+    def __init__(
+        self,
+        coordinator: VirtualACCoordinator,
+        entry: ConfigEntry,
+        device_name: str,
+    ) -> None:
+        """Initialize the power sensor."""
+        super().__init__(coordinator, entry, device_name)
+        self._attr_unique_id = f"{entry.entry_id}_power"
+        self.entity_id = f"sensor.{device_name.lower().replace(' ', '_')}_power"
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return "Power"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the current electrical power."""
+        return self.coordinator.power
+
+
+class VirtualACEnergySensor(VirtualACBaseSensor):
+    """Total energy sensor for Virtual AC, usable in the Energy dashboard."""
+
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_suggested_display_precision = ENERGY_PRECISION
+    _coordinator_field = FIELD_ENERGY
+
+    def __init__(
+        self,
+        coordinator: VirtualACCoordinator,
+        entry: ConfigEntry,
+        device_name: str,
+    ) -> None:
+        """Initialize the energy sensor."""
+        super().__init__(coordinator, entry, device_name)
+        self._attr_unique_id = f"{entry.entry_id}_energy"
+        self.entity_id = f"sensor.{device_name.lower().replace(' ', '_')}_energy"
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return "Energy"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the total energy used."""
+        return self.coordinator.energy
+
+
+class VirtualACCompressorCyclesSensor(VirtualACBaseSensor):
+    """Compressor start counter for Virtual AC."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _coordinator_field = FIELD_COMPRESSOR_CYCLES
+
+    def __init__(
+        self,
+        coordinator: VirtualACCoordinator,
+        entry: ConfigEntry,
+        device_name: str,
+    ) -> None:
+        """Initialize the compressor cycles sensor."""
+        super().__init__(coordinator, entry, device_name)
+        self._attr_unique_id = f"{entry.entry_id}_compressor_cycles"
+        self.entity_id = f"sensor.{device_name.lower().replace(' ', '_')}_compressor_cycles"
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return "Compressor Cycles"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the number of compressor starts."""
+        return self.coordinator.compressor_cycles
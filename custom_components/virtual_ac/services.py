@@ -3,13 +3,36 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .const import (
+    DATA_CLOCK,
+    DATA_ENTITY_INDEX,
+    DATA_SCENARIOS,
+    DEFAULT_FOLLOW_DEADBAND,
+    DEFAULT_FOLLOW_MIN_INTERVAL,
+    DOMAIN,
+)
+from .follow import read_climate_source, read_weather_source
 
-from .const import DOMAIN
+if TYPE_CHECKING:
+    from .climate import VirtualACClimate
+    from .clock import VirtualACClock
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,204 +40,218 @@ ATTR_CURRENT_TEMPERATURE = "current_temperature"
 ATTR_CURRENT_HUMIDITY = "current_humidity"
 ATTR_EXTERNAL_TEMPERATURE = "external_temperature"
 ATTR_EXTERNAL_HUMIDITY = "external_humidity"
+ATTR_HEAT_GAIN = "heat_gain"
+ATTR_DOOR_OPEN = "door_open"
 ATTR_CLIMATE_ENTITY = "climate_entity"
 ATTR_WEATHER_ENTITY = "weather_entity"
+ATTR_ENTITIES = "entities"
+ATTR_FOLLOW = "follow"
+ATTR_MIN_INTERVAL = "min_interval"
+ATTR_DEADBAND = "deadband"
+ATTR_SPEED = "speed"
+ATTR_SHARED = "shared"
+ATTR_DURATION = "duration"
+ATTR_UNTIL = "until"
+ATTR_FILE = "file"
 
 SERVICE_SET_STATE = "set_state"
 SERVICE_SYNC_FROM_ENTITIES = "sync_from_entities"
+SERVICE_SET_CLOCK_SPEED = "set_clock_speed"
+SERVICE_STEP_CLOCK = "step_clock"
+SERVICE_GET_TRACE = "get_trace"
+SERVICE_PLAY_SCENARIO = "play_scenario"
+SERVICE_STOP_SCENARIO = "stop_scenario"
+
+STATE_VALUES_SCHEMA = {
+    vol.Optional(ATTR_CURRENT_TEMPERATURE): vol.Coerce(float),
+    vol.Optional(ATTR_CURRENT_HUMIDITY): vol.Coerce(float),
+    vol.Optional(ATTR_EXTERNAL_TEMPERATURE): vol.Coerce(float),
+    vol.Optional(ATTR_EXTERNAL_HUMIDITY): vol.Coerce(float),
+    vol.Optional(ATTR_HEAT_GAIN): vol.Coerce(float),
+    vol.Optional(ATTR_DOOR_OPEN): cv.boolean,
+}
+
+# Per-entity values, either as a list of objects with an entity_id or as a
+# mapping of entity_id to values
+BULK_STATE_SCHEMA = vol.Any(
+    {cv.entity_id: vol.Schema(STATE_VALUES_SCHEMA)},
+    [vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_id, **STATE_VALUES_SCHEMA})],
+)
 
 # Schema without entity_id - we handle it in code from target or data
 SET_STATE_SCHEMA = vol.Schema(
     {
-        vol.Optional(ATTR_CURRENT_TEMPERATURE): vol.Coerce(float),
-        vol.Optional(ATTR_CURRENT_HUMIDITY): vol.Coerce(float),
-        vol.Optional(ATTR_EXTERNAL_TEMPERATURE): vol.Coerce(float),
-        vol.Optional(ATTR_EXTERNAL_HUMIDITY): vol.Coerce(float),
+        **STATE_VALUES_SCHEMA,
+        vol.Optional(ATTR_ENTITIES): BULK_STATE_SCHEMA,
     },
     extra=vol.ALLOW_EXTRA,  # Allow entity_id and target to be passed
 )
 
 
+def _get_climate_entity(hass: HomeAssistant, entity_id: str) -> VirtualACClimate:
+    """Return the Virtual AC climate entity for any of its entity IDs."""
+    climate_entity = hass.data[DOMAIN][DATA_ENTITY_INDEX].get(entity_id)
+    if climate_entity is None:
+        raise ValueError(f"Could not find climate entity for {entity_id}")
+    return climate_entity
+
+
+def _get_target_climate_entities(hass: HomeAssistant, call: ServiceCall) -> list[VirtualACClimate]:
+    """Return the climate entities of every targeted entity, device and area.
+
+    Explicitly targeted entities must belong to Virtual AC; other entities of
+    targeted devices and areas are skipped. Each climate entity is returned
+    once, even if several of its entities were targeted.
+    """
+    selected = async_extract_referenced_entity_ids(hass, call)
+    entity_ids = set(selected.referenced)
+    # Fallback: entity IDs nested in data target (for backwards compatibility)
+    target = call.data.get("target") or {}
+    entity_ids.update(cv.ensure_list(target.get(ATTR_ENTITY_ID)))
+
+    index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+    climate_entities = {_get_climate_entity(hass, entity_id): None for entity_id in sorted(entity_ids)}
+    for entity_id in sorted(selected.indirectly_referenced):
+        climate_entity = index.get(entity_id)
+        if climate_entity is not None:
+            climate_entities[climate_entity] = None
+    return list(climate_entities)
+
+
+def _has_target(call: ServiceCall) -> bool:
+    """Return True if the service call targets entities, devices or areas."""
+    return any(key in call.data for key in (ATTR_ENTITY_ID, ATTR_DEVICE_ID, ATTR_AREA_ID, "target"))
+
+
+def _get_target_clocks(hass: HomeAssistant, call: ServiceCall) -> list[VirtualACClock]:
+    """Return the clocks a clock service acts on.
+
+    Targeted units get a clock of their own, unless they are zones of the
+    building. Without a target the clock shared by all other units is used.
+    """
+    if not _has_target(call):
+        return [hass.data[DOMAIN][DATA_CLOCK]]
+    return [
+        climate_entity.async_use_own_clock()
+        for climate_entity in _get_target_climate_entities(hass, call)
+    ]
+
+
+def _get_state_values(data: dict[str, Any]) -> dict[str, float | bool]:
+    """Return the state values given in service data."""
+    return {
+        attr: data[attr]
+        for attr in (
+            ATTR_CURRENT_TEMPERATURE,
+            ATTR_CURRENT_HUMIDITY,
+            ATTR_EXTERNAL_TEMPERATURE,
+            ATTR_EXTERNAL_HUMIDITY,
+            ATTR_HEAT_GAIN,
+            ATTR_DOOR_OPEN,
+        )
+        if data.get(attr) is not None
+    }
+
+
+@callback
+def _record_service_call(climate_entities: Iterable[VirtualACClimate], started: float) -> None:
+    """Add a service call that started at started to the counters of the targeted units."""
+    duration = time.perf_counter() - started
+    for climate_entity in climate_entities:
+        climate_entity.stats.record_service_call(duration)
+
+
 @callback
 def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Virtual AC."""
 
     async def async_set_state(call: ServiceCall) -> None:
-        """Set current temperature and/or humidity for testing."""
-        # Handle both target selector (UI/YAML) and direct entity_id
-        entity_id = call.data.get("entity_id")
-        if not entity_id:
-            # Try to get from target (UI selector or YAML target:)
-            if hasattr(call, "target") and call.target:
-                entity_ids = call.target.entity_id
-                if entity_ids:
-                    entity_id = entity_ids[0] if isinstance(entity_ids, list) else entity_ids
-            # Fallback: try from data target (for backwards compatibility)
-            if not entity_id:
-                target = call.data.get("target", {})
-                entity_ids = target.get("entity_id", [])
-                if entity_ids:
-                    entity_id = entity_ids[0] if isinstance(entity_ids, list) else entity_ids
-        if not entity_id:
-            raise ValueError("entity_id is required. Provide it directly in data, via target selector, or in YAML target: section.")
+        """Set current temperature and/or humidity for testing.
+
+        The shared values apply to every targeted unit. Per-entity values
+        from the bulk form override them. All units are resolved before any
+        of them is changed, then updated in a single pass.
+        """
+        started = time.perf_counter()
+        updates: dict[VirtualACClimate, dict[str, float | bool]] = {}
+        try:
+            _set_state(call, updates)
+        finally:
+            _record_service_call(updates, started)
+
+    def _set_state(
+        call: ServiceCall, updates: dict[VirtualACClimate, dict[str, float | bool]]
+    ) -> None:
+        """Resolve the units of async_set_state into updates, then apply them."""
+        values = _get_state_values(call.data)
+        for climate_entity in _get_target_climate_entities(hass, call):
+            updates[climate_entity] = dict(values)
+
+        bulk = call.data.get(ATTR_ENTITIES) or {}
+        if isinstance(bulk, dict):
+            bulk = [{ATTR_ENTITY_ID: entity_id, **item} for entity_id, item in bulk.items()]
+        for item in bulk:
+            climate_entity = _get_climate_entity(hass, item[ATTR_ENTITY_ID])
+            updates.setdefault(climate_entity, dict(values)).update(_get_state_values(item))
+
+        if not updates:
+            raise ValueError(
+                "entity_id is required. Provide it directly in data, via target selector, "
+                "in YAML target: section, or in entities."
+            )
 
-        # Find the climate entity ID
-        climate_entity_id = None
-        if entity_id.startswith("climate."):
-            climate_entity_id = entity_id
-        else:
-            # For sensor/select entities, find the associated climate entity
-            entity_registry = er.async_get(hass)
-            entity = entity_registry.async_get(entity_id)
-            if entity:
-                # Find climate entity with same config entry
-                entry_id = entity.config_entry_id
-                if entry_id in hass.data.get(DOMAIN, {}):
-                    climate_entity = hass.data[DOMAIN][entry_id].get("climate_entity")
-                    if climate_entity:
-                        climate_entity_id = climate_entity.entity_id
-            else:
-                # Try to find by device name pattern
-                for entry in hass.config_entries.async_entries(DOMAIN):
-                    device_name = entry.data.get("name", "Virtual AC")
-                    climate_id = f"climate.{device_name.lower().replace(' ', '_')}"
-                    if hass.states.get(climate_id):
-                        climate_entity_id = climate_id
-                        break
-
-        if climate_entity_id is None:
-            raise ValueError(f"Could not find climate entity for {entity_id}")
-
-        # Get the climate entity object
-        entity_registry = er.async_get(hass)
-        climate_entity_reg = entity_registry.async_get(climate_entity_id)
-        if climate_entity_reg is None:
-            raise ValueError(f"Climate entity {climate_entity_id} not in registry")
-
-        entry_id = climate_entity_reg.config_entry_id
-
-        if entry_id not in hass.data.get(DOMAIN, {}):
-            raise ValueError(f"Config entry {entry_id} not found")
-
-        climate_entity = hass.data[DOMAIN][entry_id].get("climate_entity")
-        if climate_entity is None:
-            raise ValueError(f"Climate entity object for {entry_id} not found")
-
-        # Call the climate entity's method to update state
-        await climate_entity.async_set_current_state(
-            current_temperature=call.data.get(ATTR_CURRENT_TEMPERATURE),
-            current_humidity=call.data.get(ATTR_CURRENT_HUMIDITY),
-            external_temperature=call.data.get(ATTR_EXTERNAL_TEMPERATURE),
-            external_humidity=call.data.get(ATTR_EXTERNAL_HUMIDITY),
-        )
+        for climate_entity, state_values in updates.items():
+            climate_entity.async_apply_current_state(**state_values)
 
     async def async_sync_from_entities(call: ServiceCall) -> None:
-        """Sync temperature and humidity from another climate entity and/or weather entity."""
-        # Handle both target selector (UI/YAML) and direct entity_id
-        entity_id = call.data.get("entity_id")
-        _LOGGER.debug("Service call data: %s", call.data)
-        _LOGGER.debug("Has target attr: %s", hasattr(call, "target"))
-
-        if not entity_id:
-            # Try to get from target (UI selector or YAML target:)
-            if hasattr(call, "target") and call.target:
-                _LOGGER.debug("call.target: %s", call.target)
-                _LOGGER.debug("call.target.entity_id: %s", getattr(call.target, "entity_id", None))
-                entity_ids = getattr(call.target, "entity_id", None)
-                if entity_ids:
-                    entity_id = entity_ids[0] if isinstance(entity_ids, list) else entity_ids
-                    _LOGGER.debug("Extracted entity_id from call.target: %s", entity_id)
-            # Fallback: try from data target (for backwards compatibility)
-            if not entity_id:
-                target = call.data.get("target", {})
-                _LOGGER.debug("Trying data.target: %s", target)
-                if target:
-                    entity_ids = target.get("entity_id", [])
-                    if entity_ids:
-                        entity_id = entity_ids[0] if isinstance(entity_ids, list) else entity_ids
-                        _LOGGER.debug("Extracted entity_id from data.target: %s", entity_id)
-
-        _LOGGER.debug("Final entity_id: %s", entity_id)
-        if not entity_id:
+        """Sync temperature and humidity from another climate entity and/or weather entity.
+
+        With follow set, the targeted units keep following the sources until
+        the service is called again with follow set to false.
+        """
+        started = time.perf_counter()
+        # Resolve targets first so an unknown entity fails before anything is read
+        climate_entities = _get_target_climate_entities(hass, call)
+        if not climate_entities:
             raise ValueError("entity_id is required. Provide it directly in data, via target selector, or in YAML target: section.")
+        try:
+            _sync_from_entities(call, climate_entities)
+        finally:
+            _record_service_call(climate_entities, started)
 
-        # Find the climate entity ID
-        climate_entity_id = None
-        if entity_id.startswith("climate."):
-            climate_entity_id = entity_id
-        else:
-            # For sensor/select entities, find the associated climate entity
-            entity_registry = er.async_get(hass)
-            entity = entity_registry.async_get(entity_id)
-            if entity:
-                # Find climate entity with same config entry
-                entry_id = entity.config_entry_id
-                if entry_id in hass.data.get(DOMAIN, {}):
-                    climate_entity = hass.data[DOMAIN][entry_id].get("climate_entity")
-                    if climate_entity:
-                        climate_entity_id = climate_entity.entity_id
-            else:
-                # Try to find by device name pattern
-                for entry in hass.config_entries.async_entries(DOMAIN):
-                    device_name = entry.data.get("name", "Virtual AC")
-                    climate_id = f"climate.{device_name.lower().replace(' ', '_')}"
-                    if hass.states.get(climate_id):
-                        climate_entity_id = climate_id
-                        break
-
-        if climate_entity_id is None:
-            raise ValueError(f"Could not find climate entity for {entity_id}")
-
-        # Get the climate entity object
-        entity_registry = er.async_get(hass)
-        climate_entity_reg = entity_registry.async_get(climate_entity_id)
-        if climate_entity_reg is None:
-            raise ValueError(f"Climate entity {climate_entity_id} not in registry")
-
-        entry_id = climate_entity_reg.config_entry_id
-
-        if entry_id not in hass.data.get(DOMAIN, {}):
-            raise ValueError(f"Config entry {entry_id} not found")
-
-        climate_entity = hass.data[DOMAIN][entry_id].get("climate_entity")
-        if climate_entity is None:
-            raise ValueError(f"Climate entity object for {entry_id} not found")
-
-        # Read from source climate entity if provided
+    def _sync_from_entities(call: ServiceCall, climate_entities: list[VirtualACClimate]) -> None:
+        """Apply async_sync_from_entities to the resolved units."""
         source_climate_id = call.data.get(ATTR_CLIMATE_ENTITY)
         source_weather_id = call.data.get(ATTR_WEATHER_ENTITY)
+        follow = call.data.get(ATTR_FOLLOW)
+
+        if follow:
+            if not source_climate_id and not source_weather_id:
+                raise ValueError("follow requires climate_entity and/or weather_entity.")
+            for climate_entity in climate_entities:
+                climate_entity.async_follow(
+                    source_climate_id,
+                    source_weather_id,
+                    call.data[ATTR_MIN_INTERVAL],
+                    call.data[ATTR_DEADBAND],
+                )
+            return
+
+        if follow is False:
+            for climate_entity in climate_entities:
+                climate_entity.async_unfollow()
+            if not source_climate_id and not source_weather_id:
+                return
+
+        values: dict[str, float] = {}
 
-        current_temp = None
-        current_humidity = None
-        external_temp = None
-        external_humidity = None
-
-        # Read from climate entity
+        # Read from source climate entity if provided
         if source_climate_id:
             climate_state = hass.states.get(source_climate_id)
             if climate_state is None:
                 _LOGGER.warning("Climate entity %s not found", source_climate_id)
             else:
-                # Get temperature from climate entity
-                temp_attr = climate_state.attributes.get("current_temperature")
-                if temp_attr is not None:
-                    try:
-                        current_temp = float(temp_attr)
-                        _LOGGER.debug("Read temperature %.2f from climate entity %s", current_temp, source_climate_id)
-                    except (ValueError, TypeError):
-                        _LOGGER.warning("Could not parse temperature from %s: %s", source_climate_id, temp_attr)
-
-                # Get humidity from climate entity
-                humidity_attr = climate_state.attributes.get("current_humidity")
-                if humidity_attr is None:
-                    # Try alternative attribute names
-                    humidity_attr = climate_state.attributes.get("humidity")
-                if humidity_attr is not None:
-                    try:
-                        current_humidity = float(humidity_attr)
-                        _LOGGER.debug("Read humidity %.2f from climate entity %s", current_humidity, source_climate_id)
-                    except (ValueError, TypeError):
-                        _LOGGER.warning("Could not parse humidity from %s: %s", source_climate_id, humidity_attr)
+                values.update(read_climate_source(climate_state))
 
         # Read from weather entity
         if source_weather_id:
@@ -222,43 +259,13 @@ def async_setup_services(hass: HomeAssistant) -> None:
             if weather_state is None:
                 _LOGGER.warning("Weather entity %s not found", source_weather_id)
             else:
-                # Get temperature from weather entity
-                temp_attr = weather_state.attributes.get("temperature")
-                if temp_attr is None:
-                    # Try alternative attribute names
-                    temp_attr = weather_state.state
-                if temp_attr is not None:
-                    try:
-                        external_temp = float(temp_attr)
-                        _LOGGER.debug("Read temperature %.2f from weather entity %s", external_temp, source_weather_id)
-                    except (ValueError, TypeError):
-                        _LOGGER.warning("Could not parse temperature from %s: %s", source_weather_id, temp_attr)
-
-                # Get humidity from weather entity
-                humidity_attr = weather_state.attributes.get("humidity")
-                if humidity_attr is not None:
-                    try:
-                        external_humidity = float(humidity_attr)
-                        _LOGGER.debug("Read humidity %.2f from weather entity %s", external_humidity, source_weather_id)
-                    except (ValueError, TypeError):
-                        _LOGGER.warning("Could not parse humidity from %s: %s", source_weather_id, humidity_attr)
+                values.update(read_weather_source(weather_state))
 
         # Update the virtual AC with the read values
-        if current_temp is not None or current_humidity is not None or external_temp is not None or external_humidity is not None:
-            await climate_entity.async_set_current_state(
-                current_temperature=current_temp,
-                current_humidity=current_humidity,
-                external_temperature=external_temp,
-                external_humidity=external_humidity,
-            )
-            _LOGGER.info(
-                "Synced Virtual AC %s: temp=%s, humidity=%s, external_temp=%s, external_humidity=%s",
-                climate_entity_id,
-                current_temp,
-                current_humidity,
-                external_temp,
-                external_humidity,
-            )
+        if values:
+            for climate_entity in climate_entities:
+                climate_entity.async_apply_current_state(**values)
+            _LOGGER.debug("Synced %d Virtual AC units: %s", len(climate_entities), values)
         else:
             _LOGGER.warning("No values were read from source entities. Please provide climate_entity and/or weather_entity.")
 
@@ -267,9 +274,141 @@ def async_setup_services(hass: HomeAssistant) -> None:
         {
             vol.Optional(ATTR_CLIMATE_ENTITY): cv.entity_id,
             vol.Optional(ATTR_WEATHER_ENTITY): cv.entity_id,
+            vol.Optional(ATTR_FOLLOW): cv.boolean,
+            vol.Optional(ATTR_MIN_INTERVAL, default=DEFAULT_FOLLOW_MIN_INTERVAL): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+            vol.Optional(ATTR_DEADBAND, default=DEFAULT_FOLLOW_DEADBAND): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
         },
         extra=vol.ALLOW_EXTRA,  # Allow entity_id and target to be passed
     )
 
+    async def async_set_clock_speed(call: ServiceCall) -> None:
+        """Run the simulation clock at a multiple of real time.
+
+        With shared set, the targeted units go back to the shared clock, and
+        the scenarios playing along their own clocks stop.
+        """
+        if not call.data.get(ATTR_SHARED):
+            if ATTR_SPEED not in call.data:
+                raise ValueError("speed is required unless shared is set.")
+            for clock in _get_target_clocks(hass, call):
+                clock.async_set_speed(call.data[ATTR_SPEED])
+            return
+        if not _has_target(call):
+            raise ValueError("shared needs a target: the units to move back to the shared clock.")
+        shared = hass.data[DOMAIN][DATA_CLOCK]
+        climate_entities = [
+            climate_entity
+            for climate_entity in _get_target_climate_entities(hass, call)
+            if climate_entity.clock is not shared
+        ]
+        hass.data[DOMAIN][DATA_SCENARIOS].async_stop(
+            {climate_entity.entity_id for climate_entity in climate_entities}
+        )
+        for climate_entity in climate_entities:
+            climate_entity.async_use_shared_clock()
+
+    async def async_step_clock(call: ServiceCall) -> None:
+        """Advance the simulation clock without waiting.
+
+        Scenarios playing along a clock read ahead as the step goes, so each
+        of their rows is applied at its own simulated time.
+        """
+        scenarios = hass.data[DOMAIN][DATA_SCENARIOS]
+        for clock in _get_target_clocks(hass, call):
+            if ATTR_UNTIL in call.data:
+                seconds = clock.seconds_until(call.data[ATTR_UNTIL])
+            else:
+                seconds = call.data[ATTR_DURATION].total_seconds()
+            await scenarios.async_advance(clock, seconds)
+
+    # Schemas without entity_id - the clock of all units is used without a target
+    SET_CLOCK_SPEED_SCHEMA = vol.Schema(
+        {
+            vol.Exclusive(ATTR_SPEED, "clock"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Exclusive(ATTR_SHARED, "clock"): cv.boolean,
+        },
+        extra=vol.ALLOW_EXTRA,
+    )
+    STEP_CLOCK_SCHEMA = vol.All(
+        vol.Schema(
+            {
+                vol.Exclusive(ATTR_DURATION, "step"): cv.positive_time_period,
+                vol.Exclusive(ATTR_UNTIL, "step"): cv.datetime,
+            },
+            extra=vol.ALLOW_EXTRA,
+        ),
+        cv.has_at_least_one_key(ATTR_DURATION, ATTR_UNTIL),
+    )
+
+    async def async_get_trace(call: ServiceCall) -> ServiceResponse:
+        """Return the latest simulation ticks of the targeted units."""
+        climate_entities = _get_target_climate_entities(hass, call)
+        if not climate_entities:
+            raise ValueError("entity_id is required. Provide it directly in data, via target selector, or in YAML target: section.")
+        return {
+            "units": {
+                climate_entity.entity_id: climate_entity.trace.as_list(climate_entity.clock)
+                for climate_entity in climate_entities
+            }
+        }
+
+    # Schema without entity_id - we handle it in code from target or data
+    GET_TRACE_SCHEMA = vol.Schema({}, extra=vol.ALLOW_EXTRA)
+
+    async def async_play_scenario(call: ServiceCall) -> None:
+        """Play a scenario file into the targeted units along their clock.
+
+        Rows naming an entity_id apply to that unit, which must be one of
+        the targeted units; the other rows apply to every targeted unit.
+        Without a target the scenario plays into every unit following the
+        shared clock.
+        """
+        if _has_target(call):
+            climate_entities = _get_target_climate_entities(hass, call)
+            clocks = {climate_entity.clock for climate_entity in climate_entities}
+            if len(clocks) > 1:
+                raise ValueError("The units of a scenario must follow the same simulation clock.")
+            clock = clocks.pop() if clocks else hass.data[DOMAIN][DATA_CLOCK]
+        else:
+            clock = hass.data[DOMAIN][DATA_CLOCK]
+            climate_entities = [
+                climate_entity
+                for climate_entity in hass.data[DOMAIN][DATA_ENTITY_INDEX].climates()
+                if climate_entity.clock is clock
+            ]
+        path = hass.config.path(call.data[ATTR_FILE])
+        if not hass.config.is_allowed_path(path):
+            raise ValueError(f"Scenario file {path} is not in allowlist_external_dirs.")
+        await hass.data[DOMAIN][DATA_SCENARIOS].async_play(path, clock, climate_entities)
+
+    async def async_stop_scenario(call: ServiceCall) -> None:
+        """Stop the scenarios playing into the targeted units, or all scenarios."""
+        scenarios = hass.data[DOMAIN][DATA_SCENARIOS]
+        if not _has_target(call):
+            scenarios.async_stop()
+            return
+        scenarios.async_stop(
+            {climate_entity.entity_id for climate_entity in _get_target_climate_entities(hass, call)}
+        )
+
+    # Schemas without entity_id - we handle it in code from target or data
+    PLAY_SCENARIO_SCHEMA = vol.Schema({vol.Required(ATTR_FILE): cv.string}, extra=vol.ALLOW_EXTRA)
+    STOP_SCENARIO_SCHEMA = vol.Schema({}, extra=vol.ALLOW_EXTRA)
+
     hass.services.async_register(DOMAIN, SERVICE_SET_STATE, async_set_state, schema=SET_STATE_SCHEMA)
     hass.services.async_register(DOMAIN, SERVICE_SYNC_FROM_ENTITIES, async_sync_from_entities, schema=SYNC_FROM_ENTITIES_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_SET_CLOCK_SPEED, async_set_clock_speed, schema=SET_CLOCK_SPEED_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_STEP_CLOCK, async_step_clock, schema=STEP_CLOCK_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TRACE,
+        async_get_trace,
+        schema=GET_TRACE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(DOMAIN, SERVICE_PLAY_SCENARIO, async_play_scenario, schema=PLAY_SCENARIO_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_STOP_SCENARIO, async_stop_scenario, schema=STOP_SCENARIO_SCHEMA)
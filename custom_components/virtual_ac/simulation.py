@@ -0,0 +1,923 @@
+"""Closed-form simulation engine for Virtual AC units.
+
+In the simple thermal model every HVAC mode moves the temperature at a
+constant rate until a limit (target, ambient value or bound) is reached. In
+the RC thermal model the room is a single heat capacity that exchanges heat
+with the outdoors through the envelope while the AC adds or removes heat,
+switching its compressor with a hysteresis around the target. Like a real
+unit, the compressor honours minimum run and off times, ramps up after
+starting and interrupts heating to defrost in cold weather. Temperature
+then follows an exponential towards an equilibrium between two compressor
+events.
+
+Humidity is tracked as the moisture content of the air, and the relative
+humidity shown to the user is derived from it (see psychrometrics). While the
+compressor cools, moisture condenses on the evaporator coil, drying the air
+exponentially towards saturation at the coil temperature. When OFF, the air
+exchanges moisture with the outdoors.
+
+Internal heat gains (occupants, appliances) raise the temperature the room
+settles at without the AC by gain / UA above the ambient temperature, in
+both models.
+
+In both models the state at any later time can be computed exactly from the
+state at an earlier time, no matter how many update intervals passed in
+between. The one exception is air cooled below its dew point: the excess
+moisture condenses at the end of each step, so it depends slightly on when
+the steps happen. The compressor load along the way is integrated exactly as
+well, so the energy use derived from it (see energy) does not depend on the
+update interval either.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from homeassistant.components.climate import HVACMode
+
+from .const import THERMAL_MODEL_RC, THERMAL_MODEL_SIMPLE
+from .psychrometrics import (
+    moisture_content,
+    relative_humidity,
+    relative_humidity_slopes,
+    saturation_moisture,
+)
+
+# Auto mode only acts when the temperature is outside this band (°C)
+AUTO_TOLERANCE = 0.5
+
+# Humidity rate of the coil in COOL mode (% per minute)
+COOL_HUMIDITY_RATE = 2.0
+
+# Humidity rates are turned into moisture exchange rates: at 1 % per minute,
+# 5% of the moisture above the limit condenses (or, when OFF, is exchanged
+# with the outdoor air) per minute
+MOISTURE_RATE_FACTOR = 0.05
+
+# Evaporator coil temperatures (°C). Air passing the coil dries towards the
+# moisture content of saturated air at this temperature; DRY runs the coil
+# colder with less airflow.
+COOL_COIL_TEMPERATURE = 10.0
+DRY_COIL_TEMPERATURE = 6.0
+
+# Fraction of the cooling rate applied in DRY mode
+DRY_COOLING_FACTOR = 0.3
+
+# Fraction of the dry humidity rate used for natural humidity drift when OFF
+OFF_HUMIDITY_DRIFT_FACTOR = 0.3
+
+# Smallest displayed humidity change (%)
+HUMIDITY_STEP = 0.1
+
+# Air properties used for the room heat capacity
+AIR_DENSITY = 1.2  # kg/m³
+AIR_SPECIFIC_HEAT = 1005.0  # J/(kg·K)
+
+# The compressor stops this far past the target and restarts this far on
+# the other side of it in COOL and HEAT (°C)
+COMPRESSOR_HYSTERESIS = 0.5
+
+# Compressor states; the RC model switches between them, the simple model
+# only reports them
+COMPRESSOR_OFF = 0
+COMPRESSOR_COOLING = -1
+COMPRESSOR_HEATING = 1
+COMPRESSOR_DEFROSTING = 2
+
+# Fraction of the capacity while the compressor ramps up after starting
+STARTUP_CAPACITY = 0.5
+
+# The outdoor coil only ices up while heating below this outdoor temperature (°C)
+DEFROST_OUTDOOR_TEMPERATURE = 5.0
+
+# Timers within this many minutes of expiring count as expired
+TIMER_TOLERANCE = 1e-9
+
+# Limit cycles are skipped once a cycle ends this close to where it started (°C)
+CYCLE_TOLERANCE = 1e-9
+
+
+@dataclass(slots=True)
+class SimulationParams:
+    """Inputs that stay constant between two simulation updates."""
+
+    target_temperature: float
+    cooling_rate: float
+    heating_rate: float
+    dry_humidity_rate: float
+    ambient_temperature: float
+    ambient_humidity: float
+    ambient_drift_rate: float
+    fan_multiplier: float
+    min_temp: float
+    max_temp: float
+    thermal_model: str = THERMAL_MODEL_SIMPLE
+    ac_capacity: float = 0.0  # W
+    heat_capacity: float = 0.0  # J/K
+    envelope_ua: float = 0.0  # W/K
+    heat_gain: float = 0.0  # W released inside the room
+    # Compressor protection and defrost cycle of the RC model (minutes)
+    min_run_time: float = 0.0
+    min_off_time: float = 0.0
+    startup_ramp: float = 0.0
+    # Minutes of heating between two defrosts, 0 never defrosts
+    defrost_interval: float = 0.0
+    defrost_duration: float = 0.0
+
+
+@dataclass(slots=True)
+class SimulationState:
+    """Simulated indoor conditions."""
+
+    temperature: float
+    # Moisture content of the air (g/kg)
+    moisture: float
+    # Only used by the RC model
+    compressor: int = COMPRESSOR_OFF
+    # Minutes since the compressor last started or stopped
+    cycle_minutes: float = 0.0
+    # Minutes of heating since the last defrost, or into the current defrost
+    defrost_minutes: float = 0.0
+
+    @property
+    def humidity(self) -> float:
+        """Return the relative humidity (%)."""
+        return min(100.0, relative_humidity(self.temperature, self.moisture))
+
+
+@dataclass(slots=True)
+class SimulationLoad:
+    """What the compressor did during one simulation step."""
+
+    # Minutes of cooling and of heating at full capacity; a defrost counts as
+    # heating, the compressor works as hard
+    cooling: float = 0.0
+    heating: float = 0.0
+    # Number of times the compressor started (RC model)
+    starts: int = 0
+
+
+def room_heat_capacity(room_volume: float, thermal_mass: float) -> float:
+    """Return the heat capacity (J/K) of the room air plus its thermal mass (kJ/K)."""
+    return room_volume * AIR_DENSITY * AIR_SPECIFIC_HEAT + thermal_mass * 1000.0
+
+
+def _approach(value: float, limit: float, rate: float, minutes: float) -> float:
+    """Move value toward limit at rate per minute without passing it."""
+    if value < limit:
+        return min(limit, value + rate * minutes)
+    if value > limit:
+        return max(limit, value - rate * minutes)
+    return value
+
+
+def _active_minutes(distance: float, rate: float, minutes: float) -> float:
+    """Return how long a ramp covering distance at rate runs within minutes."""
+    if distance <= 0:
+        return 0.0
+    if rate <= 0:
+        return minutes
+    return min(minutes, distance / rate)
+
+
+def _clamp(state: SimulationState, params: SimulationParams) -> SimulationState:
+    """Keep the state within the configured bounds and below saturation."""
+    temperature = max(params.min_temp, min(params.max_temp, state.temperature))
+    return SimulationState(
+        temperature=temperature,
+        moisture=max(0.0, min(saturation_moisture(temperature), state.moisture)),
+        compressor=state.compressor,
+        cycle_minutes=state.cycle_minutes,
+        defrost_minutes=state.defrost_minutes,
+    )
+
+
+def _exchange(moisture: float, limit: float, rate: float, minutes: float) -> float:
+    """Move moisture toward limit, closing the fraction rate of the gap per minute."""
+    return limit + (moisture - limit) * math.exp(-rate * minutes)
+
+
+def _coil(hvac_mode: HVACMode, params: SimulationParams, moisture: float) -> tuple[float, float]:
+    """Return the moisture limit and exchange rate of the coil while it cools.
+
+    The rate is 0 if the air is already drier than saturated air at the coil.
+    """
+    if hvac_mode == HVACMode.DRY:
+        temperature, rate = DRY_COIL_TEMPERATURE, params.dry_humidity_rate
+    else:
+        temperature, rate = COOL_COIL_TEMPERATURE, COOL_HUMIDITY_RATE
+    limit = saturation_moisture(temperature)
+    if moisture <= limit:
+        return limit, 0.0
+    return limit, rate * MOISTURE_RATE_FACTOR * params.fan_multiplier
+
+
+def _condense(
+    hvac_mode: HVACMode, params: SimulationParams, moisture: float, minutes: float
+) -> float:
+    """Dry the air on the coil for minutes of compressor time."""
+    limit, rate = _coil(hvac_mode, params, moisture)
+    return _exchange(moisture, limit, rate, minutes) if rate else moisture
+
+
+def free_running_temperature(params: SimulationParams) -> float:
+    """Return the temperature the room settles at while the AC does not run."""
+    if params.envelope_ua <= 0:
+        return params.ambient_temperature
+    return params.ambient_temperature + params.heat_gain / params.envelope_ua
+
+
+def _outdoor(params: SimulationParams) -> tuple[float, float]:
+    """Return the outdoor moisture content and the exchange rate when OFF."""
+    humidity = max(0.0, min(100.0, params.ambient_humidity))
+    return (
+        moisture_content(params.ambient_temperature, humidity),
+        params.dry_humidity_rate * OFF_HUMIDITY_DRIFT_FACTOR * MOISTURE_RATE_FACTOR,
+    )
+
+
+def _cool(
+    state: SimulationState, params: SimulationParams, minutes: float, limit: float
+) -> SimulationState:
+    """Cool down to limit, drying the air while the compressor runs."""
+    rate = params.cooling_rate * params.fan_multiplier
+    active = _active_minutes(state.temperature - limit, rate, minutes)
+    if active == 0:
+        return state
+    return SimulationState(
+        temperature=max(limit, state.temperature - rate * minutes),
+        moisture=_condense(HVACMode.COOL, params, state.moisture, active),
+    )
+
+
+def _heat(
+    state: SimulationState, params: SimulationParams, minutes: float, limit: float
+) -> SimulationState:
+    """Heat up to limit; the relative humidity drops as the air warms."""
+    rate = params.heating_rate * params.fan_multiplier
+    active = _active_minutes(limit - state.temperature, rate, minutes)
+    if active == 0:
+        return state
+    return SimulationState(
+        temperature=min(limit, state.temperature + rate * minutes),
+        moisture=state.moisture,
+    )
+
+
+def _dry(state: SimulationState, params: SimulationParams, minutes: float) -> SimulationState:
+    """Dehumidify with slight cooling down to the minimum temperature."""
+    temperature = state.temperature
+    if temperature > params.min_temp:
+        rate = params.cooling_rate * DRY_COOLING_FACTOR * params.fan_multiplier
+        temperature = max(params.min_temp, temperature - rate * minutes)
+    return SimulationState(
+        temperature=temperature,
+        moisture=_condense(HVACMode.DRY, params, state.moisture, minutes),
+    )
+
+
+def _off(state: SimulationState, params: SimulationParams, minutes: float) -> SimulationState:
+    """Drift temperature and moisture toward ambient."""
+    outdoor_moisture, moisture_rate = _outdoor(params)
+    return SimulationState(
+        temperature=_approach(
+            state.temperature, free_running_temperature(params), params.ambient_drift_rate, minutes
+        ),
+        moisture=_exchange(state.moisture, outdoor_moisture, moisture_rate, minutes),
+    )
+
+
+def advance(
+    hvac_mode: HVACMode,
+    state: SimulationState,
+    params: SimulationParams,
+    elapsed_minutes: float,
+) -> SimulationState:
+    """Return the exact state elapsed_minutes after state.
+
+    The result is the same whether the interval is simulated in one call or
+    split across any number of shorter calls.
+    """
+    state = _clamp(state, params)
+    if elapsed_minutes <= 0:
+        return state
+    if params.thermal_model == THERMAL_MODEL_RC:
+        return _clamp(_rc_advance(hvac_mode, state, params, elapsed_minutes)[0], params)
+
+    target = params.target_temperature
+    if hvac_mode == HVACMode.COOL:
+        state = _cool(state, params, elapsed_minutes, target)
+    elif hvac_mode == HVACMode.HEAT:
+        state = _heat(state, params, elapsed_minutes, target)
+    elif hvac_mode == HVACMode.DRY:
+        state = _dry(state, params, elapsed_minutes)
+    elif hvac_mode == HVACMode.AUTO:
+        # Auto stops acting as soon as the temperature enters the tolerance band
+        temp_diff = state.temperature - target
+        if temp_diff > AUTO_TOLERANCE:
+            state = _cool(state, params, elapsed_minutes, target + AUTO_TOLERANCE)
+        elif temp_diff < -AUTO_TOLERANCE:
+            state = _heat(state, params, elapsed_minutes, target - AUTO_TOLERANCE)
+    elif hvac_mode == HVACMode.OFF:
+        state = _off(state, params, elapsed_minutes)
+    # FAN_ONLY: air circulation only, no change
+
+    return _clamp(state, params)
+
+
+def advance_with_load(
+    hvac_mode: HVACMode,
+    state: SimulationState,
+    params: SimulationParams,
+    elapsed_minutes: float,
+) -> tuple[SimulationState, SimulationLoad]:
+    """Return the state elapsed_minutes after state, with the compressor load on the way.
+
+    The load is given as minutes of cooling and of heating at full capacity,
+    so a compressor running at half its capacity for a minute counts half a
+    minute. Like the state, it is exact for any split of the interval.
+    """
+    state = _clamp(state, params)
+    if elapsed_minutes <= 0:
+        return state, SimulationLoad()
+    if params.thermal_model == THERMAL_MODEL_RC:
+        end, load = _rc_advance(hvac_mode, state, params, elapsed_minutes)
+        return _clamp(end, params), load
+    end = advance(hvac_mode, state, params, elapsed_minutes)
+    return end, compressor_minutes(hvac_mode, state, end, params, elapsed_minutes)
+
+
+def compressor_minutes(
+    hvac_mode: HVACMode,
+    start: SimulationState,
+    end: SimulationState,
+    params: SimulationParams,
+    elapsed_minutes: float,
+) -> SimulationLoad:
+    """Return the full-capacity minutes of cooling and heating of a simple model step.
+
+    The compressor runs at full capacity while the temperature ramps towards
+    its limit. Once there, it only makes up for the heat the envelope lets in
+    or out at the end temperature, which stays constant until the next step.
+    """
+    ramp, target = hvac_mode, params.target_temperature
+    fan = params.fan_multiplier
+    cooling_ramp = heating_ramp = 0.0
+    if hvac_mode == HVACMode.AUTO:
+        temp_diff = start.temperature - target
+        if temp_diff > AUTO_TOLERANCE:
+            ramp, target = HVACMode.COOL, target + AUTO_TOLERANCE
+        elif temp_diff < -AUTO_TOLERANCE:
+            ramp, target = HVACMode.HEAT, target - AUTO_TOLERANCE
+    if ramp == HVACMode.COOL:
+        cooling_ramp = _active_minutes(
+            start.temperature - target, params.cooling_rate * fan, elapsed_minutes
+        )
+    elif ramp == HVACMode.HEAT:
+        heating_ramp = _active_minutes(
+            target - start.temperature, params.heating_rate * fan, elapsed_minutes
+        )
+    cooling, heating = compressor_load(hvac_mode, end, params)
+    holding = elapsed_minutes - cooling_ramp - heating_ramp
+    return SimulationLoad(cooling_ramp + cooling * holding, heating_ramp + heating * holding)
+
+
+def compressor_load(
+    hvac_mode: HVACMode, state: SimulationState, params: SimulationParams
+) -> tuple[float, float]:
+    """Return the current cooling and heating load as fractions of the capacity.
+
+    In the simple model a unit holding its target covers the heat flowing
+    through the envelope and the internal gains, in the direction its mode
+    can act, up to its capacity. In the RC model the compressor runs at full capacity, except
+    while it ramps up after starting, or not at all. DRY always runs a
+    reduced cooling load.
+    """
+    if params.thermal_model == THERMAL_MODEL_RC:
+        run = _rc_now(hvac_mode, state, params)
+        capacity = _rc_capacity(run.compressor, run.cycle_minutes, params)
+        return _rc_load(hvac_mode, run.compressor, capacity)
+    if hvac_mode == HVACMode.DRY:
+        return DRY_COOLING_FACTOR, 0.0
+    if hvac_mode not in (HVACMode.COOL, HVACMode.HEAT, HVACMode.AUTO):
+        return 0.0, 0.0
+
+    temp_diff = state.temperature - params.target_temperature
+    tolerance = AUTO_TOLERANCE if hvac_mode == HVACMode.AUTO else 0.0
+    if hvac_mode != HVACMode.HEAT and temp_diff > tolerance:
+        return 1.0, 0.0
+    if hvac_mode != HVACMode.COOL and temp_diff < -tolerance:
+        return 0.0, 1.0
+
+    capacity = params.ac_capacity * params.fan_multiplier
+    if capacity <= 0:
+        return 0.0, 0.0
+    load = params.envelope_ua * (free_running_temperature(params) - state.temperature) / capacity
+    if load > 0 and hvac_mode != HVACMode.HEAT:
+        return min(1.0, load), 0.0
+    if load < 0 and hvac_mode != HVACMode.COOL:
+        return 0.0, min(1.0, -load)
+    return 0.0, 0.0
+
+
+def compressor_state(
+    hvac_mode: HVACMode, state: SimulationState, params: SimulationParams
+) -> int:
+    """Return what the compressor does now, one of the COMPRESSOR_* states.
+
+    The compressor of the simple model counts as running whenever it carries
+    a load.
+    """
+    if params.thermal_model == THERMAL_MODEL_RC:
+        return _rc_now(hvac_mode, state, params).compressor
+    cooling, heating = compressor_load(hvac_mode, state, params)
+    if cooling > 0:
+        return COMPRESSOR_COOLING
+    if heating > 0:
+        return COMPRESSOR_HEATING
+    return COMPRESSOR_OFF
+
+
+def _ramp_minutes(value: float, limit: float, rate: float, step: float) -> float | None:
+    """Return minutes until a ramp moves by one step or reaches its limit."""
+    distance = abs(limit - value)
+    if distance == 0 or rate <= 0:
+        return None
+    return min(step, distance) / rate
+
+
+def _humidity_minutes(
+    state: SimulationState,
+    temperature_rate: float,
+    moisture_limit: float,
+    moisture_rate: float,
+    step: float,
+) -> float | None:
+    """Return minutes until the displayed relative humidity moves by one step.
+
+    Relative humidity depends on both temperature (changing at
+    temperature_rate °C per minute) and moisture (approaching its limit
+    exponentially), so the time is estimated from its current rate of change.
+    This only decides when the next state is published; the state itself is
+    always computed exactly. Moisture counts as settled once the rest of its
+    approach would not show.
+    """
+    moisture_slope = moisture_rate * (moisture_limit - state.moisture)
+    remaining = relative_humidity(state.temperature, moisture_limit) - relative_humidity(
+        state.temperature, state.moisture
+    )
+    if abs(remaining) < step:
+        moisture_slope = 0.0
+    by_temperature, by_moisture = relative_humidity_slopes(state.temperature, state.moisture)
+    rate = abs(by_temperature * temperature_rate + by_moisture * moisture_slope)
+    if rate == 0:
+        return None
+    return step / rate
+
+
+def next_change_minutes(
+    hvac_mode: HVACMode,
+    state: SimulationState,
+    params: SimulationParams,
+    temperature_step: float,
+    humidity_step: float = HUMIDITY_STEP,
+) -> float | None:
+    """Return minutes until the next observable change of state.
+
+    A change is observable when temperature or humidity moves by one display
+    step or reaches the value it is approaching. Returns None when the state
+    will not change again until one of the inputs does.
+    """
+    state = _clamp(state, params)
+    if params.thermal_model == THERMAL_MODEL_RC:
+        return _rc_next_change_minutes(hvac_mode, state, params, temperature_step, humidity_step)
+
+    target = params.target_temperature
+    fan = params.fan_multiplier
+    ramps: list[float | None] = []
+    temperature_rate = 0.0
+    moisture_limit, moisture_rate = state.moisture, 0.0
+
+    if hvac_mode == HVACMode.AUTO:
+        temp_diff = state.temperature - target
+        if temp_diff > AUTO_TOLERANCE:
+            hvac_mode, target = HVACMode.COOL, target + AUTO_TOLERANCE
+        elif temp_diff < -AUTO_TOLERANCE:
+            hvac_mode, target = HVACMode.HEAT, target - AUTO_TOLERANCE
+        else:
+            return None
+
+    if hvac_mode == HVACMode.COOL and state.temperature > target:
+        rate = params.cooling_rate * fan
+        ramps.append(_ramp_minutes(state.temperature, target, rate, temperature_step))
+        temperature_rate = -rate
+        moisture_limit, moisture_rate = _coil(HVACMode.COOL, params, state.moisture)
+    elif hvac_mode == HVACMode.HEAT and state.temperature < target:
+        rate = params.heating_rate * fan
+        ramps.append(_ramp_minutes(state.temperature, target, rate, temperature_step))
+        temperature_rate = rate
+    elif hvac_mode == HVACMode.DRY:
+        if state.temperature > params.min_temp:
+            rate = params.cooling_rate * DRY_COOLING_FACTOR * fan
+            ramps.append(_ramp_minutes(state.temperature, params.min_temp, rate, temperature_step))
+            temperature_rate = -rate
+        moisture_limit, moisture_rate = _coil(HVACMode.DRY, params, state.moisture)
+    elif hvac_mode == HVACMode.OFF:
+        ambient_temperature = max(params.min_temp, min(params.max_temp, free_running_temperature(params)))
+        ramps.append(
+            _ramp_minutes(
+                state.temperature, ambient_temperature, params.ambient_drift_rate, temperature_step
+            )
+        )
+        if state.temperature != ambient_temperature:
+            temperature_rate = math.copysign(
+                params.ambient_drift_rate, ambient_temperature - state.temperature
+            )
+        moisture_limit, moisture_rate = _outdoor(params)
+    ramps.append(
+        _humidity_minutes(state, temperature_rate, moisture_limit, moisture_rate, humidity_step)
+    )
+
+    active = [minutes for minutes in ramps if minutes is not None]
+    return min(active) if active else None
+
+
+def _rc_thresholds(hvac_mode: HVACMode, target: float) -> tuple[float | None, ...]:
+    """Return the (start, stop) temperatures for cooling and for heating.
+
+    A None start means the mode never runs the compressor in that direction.
+    """
+    if hvac_mode == HVACMode.COOL:
+        return target + COMPRESSOR_HYSTERESIS, target - COMPRESSOR_HYSTERESIS, None, None
+    if hvac_mode == HVACMode.HEAT:
+        return None, None, target - COMPRESSOR_HYSTERESIS, target + COMPRESSOR_HYSTERESIS
+    if hvac_mode == HVACMode.AUTO:
+        # Auto starts outside its tolerance band and stops at the target
+        return target + AUTO_TOLERANCE, target, target - AUTO_TOLERANCE, target
+    return None, None, None, None
+
+
+def _rc_compressor(
+    temperature: float, compressor: int, thresholds: tuple[float | None, ...]
+) -> int:
+    """Return the compressor state the thermostat selects at temperature."""
+    cool_start, cool_stop, heat_start, heat_stop = thresholds
+    if compressor == COMPRESSOR_COOLING and (cool_stop is None or temperature <= cool_stop):
+        compressor = COMPRESSOR_OFF
+    elif compressor == COMPRESSOR_HEATING and (heat_stop is None or temperature >= heat_stop):
+        compressor = COMPRESSOR_OFF
+    if compressor == COMPRESSOR_OFF:
+        if cool_start is not None and temperature >= cool_start:
+            compressor = COMPRESSOR_COOLING
+        elif heat_start is not None and temperature <= heat_start:
+            compressor = COMPRESSOR_HEATING
+    return compressor
+
+
+def _rc_defrosts(hvac_mode: HVACMode, params: SimulationParams) -> bool:
+    """Return True if the outdoor coil ices up while heating and has to defrost."""
+    return (
+        hvac_mode in (HVACMode.HEAT, HVACMode.AUTO)
+        and params.defrost_interval > 0
+        and params.defrost_duration > 0
+        and params.ambient_temperature < DEFROST_OUTDOOR_TEMPERATURE
+    )
+
+
+def _rc_pending(minutes: float, timer: float) -> bool:
+    """Return True if a timer started minutes ago has not expired yet."""
+    return minutes < timer - TIMER_TOLERANCE
+
+
+def _rc_capacity(compressor: int, cycle_minutes: float, params: SimulationParams) -> float:
+    """Return the fraction of its capacity the compressor delivers."""
+    if compressor in (COMPRESSOR_COOLING, COMPRESSOR_HEATING) and _rc_pending(
+        cycle_minutes, params.startup_ramp
+    ):
+        return STARTUP_CAPACITY
+    return 1.0
+
+
+def _rc_load(hvac_mode: HVACMode, compressor: int, capacity: float) -> tuple[float, float]:
+    """Return the cooling and heating load of a compressor state as fractions of the capacity."""
+    if hvac_mode == HVACMode.DRY:
+        return DRY_COOLING_FACTOR, 0.0
+    if compressor == COMPRESSOR_COOLING:
+        return capacity, 0.0
+    if compressor in (COMPRESSOR_HEATING, COMPRESSOR_DEFROSTING):
+        return 0.0, capacity
+    return 0.0, 0.0
+
+
+def _rc_equilibrium(
+    hvac_mode: HVACMode, compressor: int, capacity: float, params: SimulationParams
+) -> float:
+    """Return the temperature the room settles at with the given compressor state."""
+    power = params.ac_capacity * params.fan_multiplier
+    if hvac_mode == HVACMode.DRY:
+        heat_flow = -power * DRY_COOLING_FACTOR
+    elif compressor == COMPRESSOR_DEFROSTING:
+        # The indoor fan stops while the outdoor coil defrosts
+        heat_flow = 0.0
+    else:
+        heat_flow = compressor * power * capacity
+    return free_running_temperature(params) + heat_flow / params.envelope_ua
+
+
+def _rc_time_constant(params: SimulationParams) -> float:
+    """Return the time constant of the room in minutes."""
+    return params.heat_capacity / params.envelope_ua / 60.0
+
+
+def _rc_minutes_to(
+    temperature: float, equilibrium: float, tau: float, threshold: float
+) -> float | None:
+    """Return minutes until an exponential approach reaches threshold, if ever."""
+    distance = temperature - equilibrium
+    if distance == 0:
+        return None
+    ratio = (threshold - equilibrium) / distance
+    if not 0 < ratio <= 1:
+        return None
+    return -tau * math.log(ratio)
+
+
+def _rc_next_switch(
+    temperature: float,
+    equilibrium: float,
+    tau: float,
+    compressor: int,
+    thresholds: tuple[float | None, ...],
+) -> tuple[float, float] | None:
+    """Return (minutes, temperature) of the next compressor switch, if any."""
+    cool_start, cool_stop, heat_start, heat_stop = thresholds
+    if compressor == COMPRESSOR_COOLING:
+        candidates = [cool_stop]
+    elif compressor == COMPRESSOR_HEATING:
+        candidates = [heat_stop]
+    else:
+        candidates = [cool_start, heat_start]
+    switches = [
+        (minutes, threshold)
+        for threshold in candidates
+        if threshold is not None
+        and (minutes := _rc_minutes_to(temperature, equilibrium, tau, threshold)) is not None
+    ]
+    return min(switches) if switches else None
+
+
+def _rc_coil_cold(hvac_mode: HVACMode, compressor: int) -> bool:
+    """Return True if moisture condenses on the coil with the given compressor state."""
+    return hvac_mode == HVACMode.DRY or compressor == COMPRESSOR_COOLING
+
+
+@dataclass(slots=True)
+class _RCRun:
+    """State of the RC model while it is advanced, with what happened so far."""
+
+    temperature: float
+    compressor: int
+    cycle_minutes: float
+    defrost_minutes: float
+    minutes: float = 0.0
+    # Minutes the coil ran cold
+    cold_minutes: float = 0.0
+    cooling: float = 0.0
+    heating: float = 0.0
+    starts: int = 0
+
+
+def _rc_now(
+    hvac_mode: HVACMode, state: SimulationState, params: SimulationParams
+) -> _RCRun:
+    """Return the RC model at state, after the switches due at that instant."""
+    run = _RCRun(state.temperature, state.compressor, state.cycle_minutes, state.defrost_minutes)
+    _rc_switch(hvac_mode, run, params, _rc_thresholds(hvac_mode, params.target_temperature))
+    return run
+
+
+def _rc_switch(
+    hvac_mode: HVACMode,
+    run: _RCRun,
+    params: SimulationParams,
+    thresholds: tuple[float | None, ...],
+) -> None:
+    """Apply the defrost cycle, the thermostat and the protection timers now.
+
+    A running compressor keeps running for the minimum run time and then
+    stops before it can start the other way; a stopped one stays off for
+    the minimum off time. Defrosting interrupts heating after each defrost
+    interval of heating, whatever the thermostat wants.
+    """
+    if run.compressor == COMPRESSOR_DEFROSTING:
+        if _rc_pending(run.defrost_minutes, params.defrost_duration):
+            return
+        run.compressor, run.defrost_minutes = COMPRESSOR_HEATING, 0.0
+    elif (
+        run.compressor == COMPRESSOR_HEATING
+        and _rc_defrosts(hvac_mode, params)
+        and not _rc_pending(run.defrost_minutes, params.defrost_interval)
+    ):
+        run.compressor, run.defrost_minutes = COMPRESSOR_DEFROSTING, 0.0
+        return
+
+    wanted = _rc_compressor(run.temperature, run.compressor, thresholds)
+    if wanted == run.compressor:
+        return
+    if run.compressor != COMPRESSOR_OFF:
+        if _rc_pending(run.cycle_minutes, params.min_run_time):
+            return
+        wanted = COMPRESSOR_OFF
+    elif _rc_pending(run.cycle_minutes, params.min_off_time):
+        return
+    else:
+        run.starts += 1
+    run.compressor, run.cycle_minutes = wanted, 0.0
+
+
+def _rc_next_event(
+    hvac_mode: HVACMode,
+    run: _RCRun,
+    params: SimulationParams,
+    tau: float,
+    thresholds: tuple[float | None, ...],
+) -> tuple[float, float | None] | None:
+    """Return minutes until the compressor switches or changes capacity, if ever.
+
+    Also returns the threshold temperature when the thermostat switches
+    there, so the segment can land exactly on it.
+    """
+    capacity = _rc_capacity(run.compressor, run.cycle_minutes, params)
+    events: list[tuple[float, float | None]] = []
+    if capacity < 1:
+        events.append((params.startup_ramp - run.cycle_minutes, None))
+    if run.compressor == COMPRESSOR_DEFROSTING:
+        events.append((params.defrost_duration - run.defrost_minutes, None))
+    else:
+        if run.compressor == COMPRESSOR_HEATING and _rc_defrosts(hvac_mode, params):
+            events.append((params.defrost_interval - run.defrost_minutes, None))
+        timer = params.min_off_time if run.compressor == COMPRESSOR_OFF else params.min_run_time
+        held = timer - run.cycle_minutes
+        equilibrium = _rc_equilibrium(hvac_mode, run.compressor, capacity, params)
+        if _rc_compressor(run.temperature, run.compressor, thresholds) != run.compressor:
+            # The thermostat already wants to switch; the timer holds the compressor
+            events.append((held, None))
+        elif switch := _rc_next_switch(
+            run.temperature, equilibrium, tau, run.compressor, thresholds
+        ):
+            # Temperatures only move away from a crossed threshold, so a
+            # switch held back by the timer happens when the timer expires
+            events.append(switch if switch[0] >= held else (held, None))
+    if not events:
+        return None
+    minutes, temperature = min(events, key=lambda event: event[0])
+    return max(0.0, minutes), temperature
+
+
+def _rc_segment(
+    hvac_mode: HVACMode,
+    run: _RCRun,
+    params: SimulationParams,
+    tau: float,
+    minutes: float,
+    temperature: float | None = None,
+) -> None:
+    """Keep the compressor as it is for minutes, landing on temperature if given."""
+    capacity = _rc_capacity(run.compressor, run.cycle_minutes, params)
+    if temperature is None:
+        equilibrium = _rc_equilibrium(hvac_mode, run.compressor, capacity, params)
+        temperature = equilibrium + (run.temperature - equilibrium) * math.exp(-minutes / tau)
+    run.temperature = temperature
+    cooling, heating = _rc_load(hvac_mode, run.compressor, capacity)
+    run.cooling += cooling * minutes
+    run.heating += heating * minutes
+    if _rc_coil_cold(hvac_mode, run.compressor):
+        run.cold_minutes += minutes
+    if run.compressor == COMPRESSOR_DEFROSTING or (
+        run.compressor == COMPRESSOR_HEATING and _rc_defrosts(hvac_mode, params)
+    ):
+        run.defrost_minutes += minutes
+    run.cycle_minutes += minutes
+    run.minutes += minutes
+
+
+def _rc_run(
+    hvac_mode: HVACMode,
+    run: _RCRun,
+    params: SimulationParams,
+    minutes: float,
+    until_stop: bool = False,
+) -> bool:
+    """Advance the RC model for minutes, one exponential segment per event.
+
+    With until_stop, returns True as soon as the running compressor stops.
+    Otherwise whole limit cycles are skipped once they repeat.
+    """
+    tau = _rc_time_constant(params)
+    thresholds = _rc_thresholds(hvac_mode, params.target_temperature)
+    end = run.minutes + minutes
+    skipped = until_stop
+    while True:
+        running = run.compressor in (COMPRESSOR_COOLING, COMPRESSOR_HEATING)
+        _rc_switch(hvac_mode, run, params, thresholds)
+        if running and run.compressor == COMPRESSOR_OFF:
+            if until_stop:
+                return True
+            if not skipped:
+                skipped = _rc_skip_cycles(hvac_mode, run, params, end - run.minutes)
+        remaining = end - run.minutes
+        if remaining <= 0:
+            return False
+        event = _rc_next_event(hvac_mode, run, params, tau, thresholds)
+        if event is None or event[0] > remaining:
+            _rc_segment(hvac_mode, run, params, tau, remaining)
+            return False
+        _rc_segment(hvac_mode, run, params, tau, *event)
+
+
+def _rc_skip_cycles(
+    hvac_mode: HVACMode, run: _RCRun, params: SimulationParams, minutes: float
+) -> bool:
+    """Skip whole on/off cycles within minutes, called when the compressor just stopped.
+
+    First-order dynamics make every cycle that starts where the previous one
+    did identical, so once a cycle ends at the temperature it started from,
+    whole cycles can be skipped instead of being integrated one switch at a
+    time. Returns True once cycles were skipped. Cycles are not skipped while
+    the coil ices up, since defrosts break the pattern.
+    """
+    if _rc_defrosts(hvac_mode, params):
+        return True
+    cycle = _RCRun(run.temperature, run.compressor, run.cycle_minutes, run.defrost_minutes)
+    if (
+        not _rc_run(hvac_mode, cycle, params, minutes, until_stop=True)
+        or cycle.minutes <= 0
+        or abs(cycle.temperature - run.temperature) > CYCLE_TOLERANCE
+    ):
+        return False
+    cycles = int(minutes // cycle.minutes)
+    run.minutes += cycles * cycle.minutes
+    run.cold_minutes += cycles * cycle.cold_minutes
+    run.cooling += cycles * cycle.cooling
+    run.heating += cycles * cycle.heating
+    run.starts += cycles * cycle.starts
+    return True
+
+
+def _rc_advance(
+    hvac_mode: HVACMode, state: SimulationState, params: SimulationParams, minutes: float
+) -> tuple[SimulationState, SimulationLoad]:
+    """Advance the RC model and return the new state with the compressor load."""
+    moisture = state.moisture
+    if hvac_mode == HVACMode.OFF:
+        # Moisture drifts as in the simple model; temperature follows the RC model
+        moisture = _off(state, params, minutes).moisture
+    run = _RCRun(state.temperature, state.compressor, state.cycle_minutes, state.defrost_minutes)
+    _rc_run(hvac_mode, run, params, minutes)
+    if run.cold_minutes:
+        moisture = _condense(hvac_mode, params, moisture, run.cold_minutes)
+    return (
+        SimulationState(
+            run.temperature, moisture, run.compressor, run.cycle_minutes, run.defrost_minutes
+        ),
+        SimulationLoad(run.cooling, run.heating, run.starts),
+    )
+
+
+def _rc_next_change_minutes(
+    hvac_mode: HVACMode,
+    state: SimulationState,
+    params: SimulationParams,
+    temperature_step: float,
+    humidity_step: float,
+) -> float | None:
+    """Return minutes until the next display step or compressor event in the RC model."""
+    tau = _rc_time_constant(params)
+    thresholds = _rc_thresholds(hvac_mode, params.target_temperature)
+    run = _rc_now(hvac_mode, state, params)
+    capacity = _rc_capacity(run.compressor, run.cycle_minutes, params)
+    equilibrium = _rc_equilibrium(hvac_mode, run.compressor, capacity, params)
+    changes: list[float | None] = []
+    if event := _rc_next_event(hvac_mode, run, params, tau, thresholds):
+        changes.append(event[0])
+
+    # The displayed temperature cannot move past the configured bounds
+    temperature_rate = 0.0
+    distance = max(params.min_temp, min(params.max_temp, equilibrium)) - state.temperature
+    if abs(distance) >= temperature_step:
+        step_to = state.temperature + math.copysign(temperature_step, distance)
+        changes.append(_rc_minutes_to(state.temperature, equilibrium, tau, step_to))
+        temperature_rate = (equilibrium - state.temperature) / tau
+
+    moisture_limit, moisture_rate = state.moisture, 0.0
+    if hvac_mode == HVACMode.OFF:
+        moisture_limit, moisture_rate = _outdoor(params)
+    elif _rc_coil_cold(hvac_mode, run.compressor):
+        moisture_limit, moisture_rate = _coil(hvac_mode, params, state.moisture)
+    changes.append(
+        _humidity_minutes(state, temperature_rate, moisture_limit, moisture_rate, humidity_step)
+    )
+
+    active = [minutes for minutes in changes if minutes is not None]
+    return min(active) if active else None
@@ -0,0 +1,105 @@
+"""Performance counters of Virtual AC units."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_STATS, DOMAIN
+
+# Number of recent durations kept for percentiles
+DURATION_WINDOW = 1000
+
+
+def _percentile(values: deque[float], fraction: float) -> float:
+    """Return the value below which the given fraction of values fall."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def _ms(seconds: float) -> float:
+    """Return seconds as rounded milliseconds."""
+    return round(seconds * 1000.0, 3)
+
+
+@dataclass(slots=True)
+class VirtualACStats:
+    """Counters of one config entry.
+
+    Recording only increments plain counters and appends to bounded deques
+    on the event loop, so the counters are always enabled. Percentiles are
+    computed from the most recent durations when the counters are read.
+    """
+
+    ticks: int = 0
+    tick_time: float = 0.0
+    tick_time_max: float = 0.0
+    tick_durations: deque[float] = field(
+        default_factory=lambda: deque(maxlen=DURATION_WINDOW)
+    )
+    lateness_total: float = 0.0
+    lateness_max: float = 0.0
+    writes: int = 0
+    writes_suppressed: int = 0
+    notifications: int = 0
+    service_calls: int = 0
+    service_time: float = 0.0
+    service_time_max: float = 0.0
+    service_durations: deque[float] = field(
+        default_factory=lambda: deque(maxlen=DURATION_WINDOW)
+    )
+
+    def record_tick(self, duration: float, lateness: float) -> None:
+        """Add a simulation tick that took duration seconds and ran lateness seconds late."""
+        self.ticks += 1
+        self.tick_time += duration
+        self.tick_time_max = max(self.tick_time_max, duration)
+        self.tick_durations.append(duration)
+        self.lateness_total += lateness
+        self.lateness_max = max(self.lateness_max, lateness)
+
+    def record_service_call(self, duration: float) -> None:
+        """Add a service call that took duration seconds."""
+        self.service_calls += 1
+        self.service_time += duration
+        self.service_time_max = max(self.service_time_max, duration)
+        self.service_durations.append(duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters with durations in milliseconds."""
+        ticks = self.ticks or 1
+        service_calls = self.service_calls or 1
+        return {
+            "ticks": self.ticks,
+            "tick_duration_avg_ms": _ms(self.tick_time / ticks),
+            "tick_duration_p99_ms": _ms(_percentile(self.tick_durations, 0.99)),
+            "tick_duration_max_ms": _ms(self.tick_time_max),
+            "tick_lateness_avg_ms": _ms(self.lateness_total / ticks),
+            "tick_lateness_max_ms": _ms(self.lateness_max),
+            "state_writes": self.writes,
+            "state_writes_suppressed": self.writes_suppressed,
+            "coordinator_notifications": self.notifications,
+            "service_calls": self.service_calls,
+            "service_latency_avg_ms": _ms(self.service_time / service_calls),
+            "service_latency_p99_ms": _ms(_percentile(self.service_durations, 0.99)),
+            "service_latency_max_ms": _ms(self.service_time_max),
+        }
+
+
+def async_get_stats(hass: HomeAssistant, entry_id: str) -> VirtualACStats:
+    """Return the counters of a config entry, creating them on first use.
+
+    An entry that is not set up gets counters that are not kept, so late
+    readers do not bring back the data of an unloaded entry.
+    """
+    if (entry_data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
+        return VirtualACStats()
+    if (stats := entry_data.get(DATA_STATS)) is None:
+        stats = entry_data[DATA_STATS] = VirtualACStats()
+    return stats
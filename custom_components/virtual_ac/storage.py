@@ -0,0 +1,93 @@
+"""Persistent simulation state of Virtual AC units."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .climate import VirtualACClimate
+
+STORAGE_KEY = f"{DOMAIN}.state"
+STORAGE_VERSION = 1
+
+# Seconds between writes of the storage file
+SAVE_DELAY = 60
+
+
+class VirtualACStore:
+    """Snapshots of the simulation state of every unit, kept in one file.
+
+    Units ask for a save whenever their state changes, but the file is
+    written at most once per SAVE_DELAY for the whole fleet, and once more
+    when Home Assistant stops. The snapshots are taken when the file is
+    written. Each one holds the simulated time its state belongs to, so a
+    unit resumes exactly from it, however old it is.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._data: dict[str, dict[str, Any]] = {}
+        self._units: dict[str, VirtualACClimate] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the snapshots saved before the last restart."""
+        self._data = await self._store.async_load() or {}
+
+    def get(self, entry_id: str) -> dict[str, Any] | None:
+        """Return the last snapshot of a unit, None if it was never saved."""
+        return self._data.get(entry_id)
+
+    @callback
+    def async_add(self, unit: VirtualACClimate) -> CALLBACK_TYPE:
+        """Save the state of a unit from now on and return a function to stop."""
+        self._units[unit.entry_id] = unit
+
+        @callback
+        def remove_unit() -> None:
+            """Keep the final snapshot of the unit for when it is added again."""
+            if self._units.get(unit.entry_id) is unit:
+                del self._units[unit.entry_id]
+                self._data[unit.entry_id] = unit.snapshot()
+                self.async_schedule_save()
+
+        return remove_unit
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Forget the snapshot of a deleted config entry."""
+        self._units.pop(entry_id, None)
+        if self._data.pop(entry_id, None) is not None:
+            self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Write the snapshots of all units after SAVE_DELAY.
+
+        Requests made while a write is pending are covered by that write,
+        since the snapshots are only taken when it happens.
+        """
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write the snapshots of all units now, replacing a pending write."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the snapshots of all units, taken now."""
+        self._save_pending = False
+        for entry_id, unit in self._units.items():
+            self._data[entry_id] = unit.snapshot()
+        return self._data
@@ -0,0 +1,69 @@
+"""Simulation trace of Virtual AC units."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .clock import VirtualACClock
+
+# Number of ticks kept per unit
+TRACE_LENGTH = 100
+
+
+@dataclass(slots=True)
+class TickRecord:
+    """What one simulation tick did to a unit."""
+
+    # Simulated time of the tick, see VirtualACClock.time
+    time: float
+    hvac_mode: str
+    temperature: float
+    humidity: float
+    # Simulated minutes since the previous tick
+    elapsed: float
+    fan_multiplier: float
+
+
+class VirtualACTrace:
+    """Fixed-size ring buffer with the latest simulation ticks of a unit.
+
+    Recording a tick only appends a small record, so the trace stays enabled
+    at all times instead of logging every tick.
+    """
+
+    def __init__(self, length: int = TRACE_LENGTH) -> None:
+        """Initialize an empty trace."""
+        self._records: deque[TickRecord] = deque(maxlen=length)
+
+    def __len__(self) -> int:
+        """Return the number of recorded ticks."""
+        return len(self._records)
+
+    def record(
+        self,
+        time: float,
+        hvac_mode: str,
+        temperature: float,
+        humidity: float,
+        elapsed: float,
+        fan_multiplier: float,
+    ) -> None:
+        """Add a tick, dropping the oldest one when the trace is full."""
+        self._records.append(
+            TickRecord(time, hvac_mode, temperature, humidity, elapsed, fan_multiplier)
+        )
+
+    def as_list(self, clock: VirtualACClock) -> list[dict[str, Any]]:
+        """Return the ticks, oldest first, with simulated dates for their times."""
+        now, time = clock.now(), clock.time()
+        return [
+            {
+                **asdict(record),
+                "time": (now - timedelta(seconds=time - record.time)).isoformat(),
+            }
+            for record in self._records
+        ]
@@ -0,0 +1 @@
+"""Tests for the Virtual AC integration."""
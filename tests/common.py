@@ -0,0 +1,45 @@
+"""Helpers for the Virtual AC tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.virtual_ac.const import (
+    CONF_SIMULATION_MODE,
+    CONF_UPDATE_INTERVAL,
+    DOMAIN,
+    SIMULATION_MODE_REALISTIC,
+)
+
+
+async def async_setup_units(
+    hass: HomeAssistant, names: list[str], **options: Any
+) -> list[MockConfigEntry]:
+    """Set up a realistic-mode unit per name and return their config entries.
+
+    The climate entity of a unit named "Living Room" is climate.living_room.
+    """
+    entries = []
+    for name in names:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=name,
+            data={
+                CONF_NAME: name,
+                CONF_SIMULATION_MODE: SIMULATION_MODE_REALISTIC,
+                CONF_UPDATE_INTERVAL: 10,
+                **options,
+            },
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+    # Setting up the integration sets up every entry added above
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    return entries
@@ -0,0 +1,24 @@
+"""Fixtures for the Virtual AC tests.
+
+Run with: python -m pytest tests
+"""
+
+from __future__ import annotations
+
+import importlib.util
+
+import pytest
+
+if importlib.util.find_spec("pytest_homeassistant_custom_component") is None:
+    # The tests run on the Home Assistant test harness, see requirements-dev.txt
+    collect_ignore_glob = ["test_*.py"]
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Run the async tests and fixtures without explicit markers."""
+    config.option.asyncio_mode = "auto"
@@ -0,0 +1,74 @@
+"""Tests for multi-zone buildings coupled through shared walls."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.virtual_ac.building import exchange_heat
+from custom_components.virtual_ac.const import (
+    CONF_NEIGHBORS,
+    DATA_BUILDING,
+    DATA_ENTITY_INDEX,
+    DOMAIN,
+)
+
+from .common import async_setup_units
+
+
+def test_exchange_heat_two_zones() -> None:
+    """Two zones meet the backward Euler step of their coupled equations."""
+    capacities = [100_000.0, 300_000.0]
+    conductance, minutes = 20.0, 30.0
+    weight = conductance * minutes * 60.0
+
+    first, second = exchange_heat([30.0, 20.0], capacities, [(0, 1, conductance)], minutes)
+
+    assert capacities[0] * (first - 30.0) == pytest.approx(weight * (second - first))
+    assert capacities[1] * (second - 20.0) == pytest.approx(weight * (first - second))
+    # Implicit steps never overshoot the mean
+    assert 20.0 < second < first < 30.0
+
+
+def test_exchange_heat_conserves_heat() -> None:
+    """Any step of a random building keeps the total heat and the temperature bounds."""
+    rng = random.Random(2)
+    count = 40
+    temperatures = [rng.uniform(10, 35) for _ in range(count)]
+    capacities = [rng.uniform(50_000, 500_000) for _ in range(count)]
+    walls = [(index, index + 1, rng.uniform(5, 50)) for index in range(count - 1)]
+    walls += [(rng.randrange(count), rng.randrange(count), 20.0) for _ in range(20)]
+    walls = [wall for wall in walls if wall[0] != wall[1]]
+
+    for minutes in (0.1, 1.0, 600.0):
+        result = exchange_heat(temperatures, capacities, walls, minutes)
+        before = sum(c * t for c, t in zip(capacities, temperatures))
+        after = sum(c * t for c, t in zip(capacities, result))
+        assert after == pytest.approx(before, rel=1e-9)
+        assert min(temperatures) - 1e-9 <= min(result)
+        assert max(result) <= max(temperatures) + 1e-9
+
+
+def test_exchange_heat_without_walls() -> None:
+    """Zones without walls keep their temperature."""
+    assert exchange_heat([21.0, 25.0], [1.0, 1.0], [], 10.0) == [21.0, 25.0]
+
+
+async def test_reload_rebuilds_building(hass: HomeAssistant) -> None:
+    """New walls take effect once the unit is reloaded."""
+    first, second = await async_setup_units(hass, ["Unit A", "Unit B"])
+    building = hass.data[DOMAIN][DATA_BUILDING]
+    index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+    assert index.get(first.entry_id) not in building
+
+    hass.config_entries.async_update_entry(
+        first, options={CONF_NEIGHBORS: ["climate.unit_b"]}
+    )
+    assert await hass.config_entries.async_reload(first.entry_id)
+    await hass.async_block_till_done()
+
+    assert index.get(first.entry_id) in building
+    assert index.get(second.entry_id) in building
@@ -0,0 +1,150 @@
+"""Tests for the simulation clocks of Virtual AC units."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.virtual_ac.clock import VirtualACClock
+
+from custom_components.virtual_ac.const import (
+    CONF_NEIGHBORS,
+    DATA_BUILDING,
+    DATA_CLOCK,
+    DATA_ENTITY_INDEX,
+    DOMAIN,
+)
+
+from .common import async_setup_units
+
+
+async def test_date_follows_corrected_wall_clock(hass: HomeAssistant) -> None:
+    """A clock created while the wall clock was wrong shows the corrected date."""
+    with patch.object(dt_util, "utcnow", return_value=dt_util.utcnow() - timedelta(days=365)):
+        clock = VirtualACClock(hass)
+    clock.async_advance(3600)
+
+    lead = (clock.now() - dt_util.utcnow()).total_seconds()
+    assert lead == pytest.approx(3600, abs=1)
+
+
+async def test_jump_runs_alarms_at_their_time(hass: HomeAssistant) -> None:
+    """A jump stops at every alarm on its way, in time order."""
+    clock = VirtualACClock(hass, speed=0)
+    start = clock.time()
+    rung = []
+    for offset in (30.0, 10.0, 20.0):
+        clock.async_call_at(start + offset, lambda: rung.append(clock.time() - start))
+    cancel = clock.async_call_at(start + 15.0, lambda: rung.append(None))
+    cancel()
+
+    clock.async_advance(25.0)
+    assert rung == [pytest.approx(10.0), pytest.approx(20.0)]
+    assert clock.time() == pytest.approx(start + 25.0)
+
+    clock.async_advance(60.0)
+    assert rung == [pytest.approx(10.0), pytest.approx(20.0), pytest.approx(30.0)]
+    clock.async_shutdown()
+
+
+async def test_alarm_rings_at_clock_speed(hass: HomeAssistant, freezer) -> None:
+    """An alarm rings after its simulated delay divided by the speed."""
+    clock = VirtualACClock(hass, speed=60)
+    rung = []
+    clock.async_call_at(clock.time() + 600.0, lambda: rung.append(True))
+
+    freezer.tick(timedelta(seconds=9))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert not rung
+
+    freezer.tick(timedelta(seconds=1.5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert rung
+
+
+async def test_paused_clock_keeps_alarms(hass: HomeAssistant, freezer) -> None:
+    """Alarms of a paused clock wait until it runs again or is stepped."""
+    clock = VirtualACClock(hass)
+    rung = []
+    clock.async_call_at(clock.time() + 5.0, lambda: rung.append(True))
+    clock.async_set_speed(0)
+
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert not rung
+
+    clock.async_advance(5.0)
+    assert rung
+
+
+async def test_unit_returns_to_shared_clock(hass: HomeAssistant) -> None:
+    """A unit given its own clock can go back to the shared one and catch up."""
+    (entry,) = await async_setup_units(hass, ["Unit"])
+    climate = hass.data[DOMAIN][DATA_ENTITY_INDEX].get(entry.entry_id)
+    shared = hass.data[DOMAIN][DATA_CLOCK]
+
+    await hass.services.async_call(
+        DOMAIN, "set_clock_speed", {"entity_id": "climate.unit", "speed": 0}, blocking=True
+    )
+    clock = climate.clock
+    assert clock is not shared
+    assert clock.speed == 0
+
+    # The paused clock falls an hour behind
+    await hass.services.async_call(
+        DOMAIN, "step_clock", {"duration": timedelta(hours=1)}, blocking=True
+    )
+    temperature = climate.current_temperature
+
+    await hass.services.async_call(
+        DOMAIN, "set_clock_speed", {"entity_id": "climate.unit", "shared": True}, blocking=True
+    )
+    assert climate.clock is shared
+    assert climate.current_temperature != temperature
+
+
+async def test_zone_keeps_shared_clock(hass: HomeAssistant) -> None:
+    """Zones of the building refuse a clock of their own."""
+    (entry,) = await async_setup_units(hass, ["Unit"], **{CONF_NEIGHBORS: ["climate.other"]})
+    climate = hass.data[DOMAIN][DATA_ENTITY_INDEX].get(entry.entry_id)
+
+    with pytest.raises(ValueError):
+        await hass.services.async_call(
+            DOMAIN, "step_clock", {"entity_id": "climate.unit", "duration": 60}, blocking=True
+        )
+    assert climate.clock is hass.data[DOMAIN][DATA_CLOCK]
+    assert climate in hass.data[DOMAIN][DATA_BUILDING]
+
+
+async def test_own_clock_survives_reload(hass: HomeAssistant) -> None:
+    """The speed and lead of a unit's own clock are saved with the unit."""
+    (entry,) = await async_setup_units(hass, ["Unit"])
+    await hass.services.async_call(
+        DOMAIN, "set_clock_speed", {"entity_id": "climate.unit", "speed": 0}, blocking=True
+    )
+    await hass.services.async_call(
+        DOMAIN,
+        "step_clock",
+        {"entity_id": "climate.unit", "duration": timedelta(hours=2)},
+        blocking=True,
+    )
+
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    climate = hass.data[DOMAIN][DATA_ENTITY_INDEX].get(entry.entry_id)
+    shared = hass.data[DOMAIN][DATA_CLOCK]
+    assert climate.clock is not shared
+    assert climate.clock.speed == 0
+    lead = (climate.clock.now() - shared.now()).total_seconds()
+    assert lead == pytest.approx(7200, abs=1)
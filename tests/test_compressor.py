@@ -0,0 +1,155 @@
+"""Tests for the compressor state machine of the RC model."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from homeassistant.components.climate import HVACMode
+
+from custom_components.virtual_ac.const import THERMAL_MODEL_RC
+from custom_components.virtual_ac.simulation import (
+    COMPRESSOR_COOLING,
+    COMPRESSOR_DEFROSTING,
+    COMPRESSOR_HEATING,
+    COMPRESSOR_OFF,
+    STARTUP_CAPACITY,
+    SimulationParams,
+    SimulationState,
+    advance_with_load,
+    compressor_load,
+    compressor_state,
+    room_heat_capacity,
+)
+
+# Moisture content (g/kg) of the tests, it does not drive the compressor
+MOISTURE = 8.0
+
+
+def _params(**changes: float) -> SimulationParams:
+    """Return the parameters of a default RC unit with some of them changed."""
+    params = {
+        "target_temperature": 22.0,
+        "cooling_rate": 0.5,
+        "heating_rate": 0.5,
+        "dry_humidity_rate": 2.0,
+        "ambient_temperature": 30.0,
+        "ambient_humidity": 60.0,
+        "ambient_drift_rate": 0.1,
+        "fan_multiplier": 1.0,
+        "min_temp": 7.0,
+        "max_temp": 35.0,
+        "thermal_model": THERMAL_MODEL_RC,
+        "ac_capacity": 2500.0,
+        "heat_capacity": room_heat_capacity(40.0, 400.0),
+        "envelope_ua": 60.0,
+        "min_run_time": 3.0,
+        "min_off_time": 3.0,
+        "startup_ramp": 1.0,
+        "defrost_interval": 60.0,
+        "defrost_duration": 5.0,
+    }
+    return SimulationParams(**{**params, **changes})
+
+
+def _state(
+    temperature: float, compressor: int = COMPRESSOR_OFF, cycle_minutes: float = 10.0
+) -> SimulationState:
+    """Return a state with the compressor in a state for cycle_minutes."""
+    return SimulationState(temperature, MOISTURE, compressor, cycle_minutes)
+
+
+def test_hysteresis() -> None:
+    """COOL starts half a degree above the target and stops half a degree below."""
+    params = _params()
+    assert compressor_state(HVACMode.COOL, _state(22.4), params) == COMPRESSOR_OFF
+    assert compressor_state(HVACMode.COOL, _state(22.5), params) == COMPRESSOR_COOLING
+    running = _state(21.6, COMPRESSOR_COOLING)
+    assert compressor_state(HVACMode.COOL, running, params) == COMPRESSOR_COOLING
+    running = _state(21.5, COMPRESSOR_COOLING)
+    assert compressor_state(HVACMode.COOL, running, params) == COMPRESSOR_OFF
+
+
+def test_minimum_off_time() -> None:
+    """A compressor that just stopped does not start before the minimum off time."""
+    params = _params()
+    stopped = _state(23.0, COMPRESSOR_OFF, cycle_minutes=1.0)
+    assert compressor_state(HVACMode.COOL, stopped, params) == COMPRESSOR_OFF
+
+    state, load = advance_with_load(HVACMode.COOL, stopped, params, 2.5)
+    assert state.compressor == COMPRESSOR_COOLING
+    assert state.cycle_minutes == pytest.approx(0.5)
+    assert load.starts == 1
+
+
+def test_minimum_run_time() -> None:
+    """A compressor that just started runs for the minimum run time."""
+    params = _params()
+    started = _state(21.0, COMPRESSOR_COOLING, cycle_minutes=1.0)
+    assert compressor_state(HVACMode.COOL, started, params) == COMPRESSOR_COOLING
+
+    state = advance_with_load(HVACMode.COOL, started, params, 2.5)[0]
+    assert state.compressor == COMPRESSOR_OFF
+
+
+def test_startup_ramp() -> None:
+    """The compressor delivers part of its capacity right after starting."""
+    params = _params()
+    assert compressor_load(HVACMode.COOL, _state(23.0, COMPRESSOR_COOLING, 0.5), params) == (
+        STARTUP_CAPACITY,
+        0.0,
+    )
+    assert compressor_load(HVACMode.COOL, _state(23.0, COMPRESSOR_COOLING, 1.5), params) == (
+        1.0,
+        0.0,
+    )
+
+
+def test_defrost_in_cold_weather() -> None:
+    """Heating below the defrost temperature stops for a defrost after each interval."""
+    params = _params(ambient_temperature=0.0)
+    heating = SimulationState(18.0, MOISTURE, COMPRESSOR_HEATING, 30.0, 59.0)
+
+    state = advance_with_load(HVACMode.HEAT, heating, params, 2.0)[0]
+    assert state.compressor == COMPRESSOR_DEFROSTING
+    state = advance_with_load(HVACMode.HEAT, state, params, params.defrost_duration)[0]
+    assert state.compressor == COMPRESSOR_HEATING
+
+    # Mild weather never ices the coil
+    state = advance_with_load(HVACMode.HEAT, heating, _params(ambient_temperature=10.0), 2.0)[0]
+    assert state.compressor == COMPRESSOR_HEATING
+
+
+def test_split_steps_match_one_step() -> None:
+    """Advancing in several steps gives the state, load and starts of one long step."""
+    rng = random.Random(3)
+    for _ in range(200):
+        params = _params(
+            target_temperature=rng.uniform(18, 26),
+            ambient_temperature=rng.uniform(-10, 38),
+            heat_gain=rng.uniform(0, 800),
+        )
+        hvac_mode = rng.choice((HVACMode.COOL, HVACMode.HEAT, HVACMode.AUTO, HVACMode.OFF))
+        start = _state(
+            rng.uniform(15, 30),
+            rng.choice((COMPRESSOR_OFF, COMPRESSOR_COOLING, COMPRESSOR_HEATING)),
+            rng.uniform(0, 5),
+        )
+        minutes = [rng.uniform(0, 90) for _ in range(3)]
+
+        split, cooling, heating, starts = start, 0.0, 0.0, 0
+        for step in minutes:
+            split, load = advance_with_load(hvac_mode, split, params, step)
+            cooling, heating, starts = (
+                cooling + load.cooling,
+                heating + load.heating,
+                starts + load.starts,
+            )
+        whole, load = advance_with_load(hvac_mode, start, params, sum(minutes))
+
+        assert split.temperature == pytest.approx(whole.temperature, abs=1e-6)
+        assert split.compressor == whole.compressor
+        assert cooling == pytest.approx(load.cooling, abs=1e-6)
+        assert heating == pytest.approx(load.heating, abs=1e-6)
+        assert starts == load.starts
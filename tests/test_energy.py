@@ -0,0 +1,51 @@
+"""Tests for the energy use of Virtual AC units."""
+
+from __future__ import annotations
+
+import math
+from datetime import timedelta
+
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN, HVACMode
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.virtual_ac.const import DATA_ENTITY_INDEX, DOMAIN
+from custom_components.virtual_ac.energy import energy_step_minutes
+
+from .common import async_setup_units
+
+
+def test_energy_step_minutes() -> None:
+    """A 600 W draw moves the energy by 0.01 kWh every minute."""
+    assert energy_step_minutes(600.0) == 1.0
+    assert energy_step_minutes(0.0) == math.inf
+
+
+async def test_energy_published_without_polling(hass: HomeAssistant, freezer) -> None:
+    """A unit holding its target still wakes up for every energy step."""
+    (entry,) = await async_setup_units(hass, ["Unit"])
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        "set_hvac_mode",
+        {ATTR_ENTITY_ID: "climate.unit", "hvac_mode": HVACMode.FAN_ONLY},
+        blocking=True,
+    )
+    climate = hass.data[DOMAIN][DATA_ENTITY_INDEX].get(entry.entry_id)
+    sensor = next(
+        state.entity_id
+        for state in hass.states.async_all("sensor")
+        if state.entity_id.endswith("_energy")
+    )
+    assert not hass.data["entity_components"]["sensor"].get_entity(sensor).should_poll
+
+    step = energy_step_minutes(climate.power) * 60.0
+    assert climate.next_change_delay() <= step
+
+    start = float(hass.states.get(sensor).state)
+    for _ in range(4):
+        freezer.tick(timedelta(seconds=step))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert float(hass.states.get(sensor).state) >= start + 0.03
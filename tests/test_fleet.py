@@ -0,0 +1,225 @@
+"""Tests for the vectorized fleet engine against the per-unit engine."""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN, HVACMode
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.virtual_ac.const import DATA_ENTITY_INDEX, DOMAIN
+from custom_components.virtual_ac.fleet import FLEET_MIN_UNITS, VirtualACFleet
+from custom_components.virtual_ac.psychrometrics import moisture_content
+from custom_components.virtual_ac.simulation import (
+    SimulationParams,
+    SimulationState,
+    advance,
+    compressor_state,
+    next_change_minutes,
+)
+
+from .common import async_setup_units
+
+# Random units compared per test
+CASES = 5000
+
+_MODES = (
+    HVACMode.OFF,
+    HVACMode.COOL,
+    HVACMode.HEAT,
+    HVACMode.DRY,
+    HVACMode.FAN_ONLY,
+    HVACMode.AUTO,
+)
+
+
+@dataclass
+class _Clock:
+    """Simulation clock standing still at a given time."""
+
+    now: float
+
+    def time(self) -> float:
+        """Return the simulated time."""
+        return self.now
+
+    def real_delay(self, seconds: float | None) -> float | None:
+        """Return the delay unchanged, the clock runs at real time."""
+        return seconds
+
+
+@dataclass(eq=False)
+class _Unit:
+    """Stand-in for a climate entity with the inputs the fleet reads."""
+
+    hvac_mode: HVACMode
+    state: SimulationState
+    params: SimulationParams
+    last_update: float
+    temperature_step: float
+    clock: _Clock
+    applied: tuple[float, float, bool] | None = field(default=None)
+
+    def simulation_inputs(self):
+        """Return the inputs like VirtualACClimate.simulation_inputs."""
+        return (
+            self.hvac_mode,
+            self.state,
+            self.params,
+            self.last_update,
+            self.temperature_step,
+        )
+
+    def next_energy_minutes(self) -> float:
+        """Return infinity, the fake unit draws no power."""
+        return math.inf
+
+    def async_apply_simulation(self, temperature, moisture, humidity, now, publish):
+        """Keep the state computed by the fleet."""
+        self.applied = (temperature, moisture, publish)
+
+
+def _random_unit(rng: random.Random) -> _Unit:
+    """Return a simple-model unit with random inputs, ticked after random minutes."""
+    target = rng.uniform(16, 30)
+    temperature = rng.choice((target, target + 0.5, target - 0.5, rng.uniform(5, 40)))
+    params = SimulationParams(
+        target_temperature=target,
+        cooling_rate=rng.choice((0.0, rng.uniform(0.01, 1.0))),
+        heating_rate=rng.choice((0.0, rng.uniform(0.01, 1.0))),
+        dry_humidity_rate=rng.uniform(0.0, 5.0),
+        ambient_temperature=rng.uniform(-10, 40),
+        ambient_humidity=rng.uniform(0, 100),
+        ambient_drift_rate=rng.uniform(0.0, 0.5),
+        fan_multiplier=rng.choice((0.5, 1.0, 1.5)),
+        min_temp=7.0,
+        max_temp=35.0,
+        ac_capacity=rng.choice((0.0, rng.uniform(500, 5000))),
+        envelope_ua=rng.uniform(0, 200),
+        heat_gain=rng.choice((0.0, rng.uniform(0, 500))),
+    )
+    state = SimulationState(temperature, moisture_content(temperature, rng.uniform(5, 100)))
+    now = 1000.0 + rng.uniform(0, 7200)
+    return _Unit(
+        rng.choice(_MODES),
+        state,
+        params,
+        1000.0,
+        rng.choice((0.1, 0.5, 1.0)),
+        _Clock(now),
+    )
+
+
+def test_fleet_matches_per_unit_engine() -> None:
+    """The fleet ends in the state, and wakes at the time, of the per-unit engine."""
+    rng = random.Random(20240317)
+    units = [_random_unit(rng) for _ in range(CASES)]
+    fleet = VirtualACFleet()
+    for unit in units:
+        fleet.add(unit)
+        fleet.load(unit)
+
+    delays = fleet.async_tick(units)
+
+    for unit, delay in zip(units, delays):
+        minutes = (unit.clock.now - unit.last_update) / 60.0
+        expected = advance(unit.hvac_mode, unit.state, unit.params, minutes)
+        temperature, moisture, _ = unit.applied
+        assert temperature == pytest.approx(expected.temperature, rel=1e-9, abs=1e-9)
+        assert moisture == pytest.approx(expected.moisture, rel=1e-9, abs=1e-9)
+
+        expected_minutes = next_change_minutes(
+            unit.hvac_mode, expected, unit.params, unit.temperature_step
+        )
+        if expected_minutes is None:
+            assert delay is None
+        else:
+            assert delay == pytest.approx(expected_minutes * 60.0, rel=1e-6, abs=1e-6)
+
+
+def test_fleet_writes_compressor_stop() -> None:
+    """A unit whose compressor stops writes its state, though its display did not move."""
+    params = SimulationParams(
+        target_temperature=22.0,
+        cooling_rate=0.1,
+        heating_rate=0.1,
+        dry_humidity_rate=2.0,
+        ambient_temperature=15.0,
+        ambient_humidity=50.0,
+        ambient_drift_rate=0.1,
+        fan_multiplier=1.0,
+        min_temp=7.0,
+        max_temp=35.0,
+        ac_capacity=2000.0,
+        envelope_ua=60.0,
+    )
+    state = SimulationState(22.02, moisture_content(22.02, 50.0))
+    units = [
+        _Unit(HVACMode.COOL, state, params, 1000.0, 0.5, _Clock(1060.0))
+        for _ in range(2)
+    ]
+    fleet = VirtualACFleet()
+    for unit in units:
+        fleet.add(unit)
+        fleet.load(unit)
+
+    fleet.async_tick(units)
+
+    for unit in units:
+        temperature, _, publish = unit.applied
+        assert temperature == 22.0
+        assert compressor_state(unit.hvac_mode, unit.state, params) != compressor_state(
+            unit.hvac_mode, SimulationState(22.0, state.moisture), params
+        )
+        assert publish
+
+
+async def test_fleet_shares_every_step_with_sensors(hass: HomeAssistant, freezer) -> None:
+    """Steps the fleet does not write still reach the coordinator, like per-unit steps."""
+    entries = await async_setup_units(hass, [f"Unit {index}" for index in range(FLEET_MIN_UNITS)])
+    entity_ids = [f"climate.unit_{index}" for index in range(FLEET_MIN_UNITS)]
+    # set_temperature does not switch the mode, so cooling is turned on first
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        "set_hvac_mode",
+        {ATTR_ENTITY_ID: entity_ids, "hvac_mode": HVACMode.COOL},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        "set_temperature",
+        {ATTR_ENTITY_ID: entity_ids, "temperature": 16},
+        blocking=True,
+    )
+    # Let the compressors start, so the step below only moves the temperature
+    for _ in range(30):
+        freezer.tick(timedelta(seconds=10))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+    climates = [index.get(entry.entry_id) for entry in entries]
+    fleet = VirtualACFleet()
+    for climate in climates:
+        fleet.add(climate)
+        fleet.load(climate)
+
+    # One second of cooling does not move the displayed temperature
+    freezer.tick(timedelta(seconds=1))
+    writes = [climate.stats.writes for climate in climates]
+    fleet.async_tick(climates)
+    await hass.async_block_till_done()
+
+    for entry, climate, written in zip(entries, climates, writes):
+        assert climate.stats.writes == written
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+        assert coordinator.current_temperature == climate.current_temperature
@@ -0,0 +1,136 @@
+"""Tests for the Virtual AC follow mode."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.virtual_ac.const import (
+    CONF_FOLLOW_CLIMATE_ENTITY,
+    CONF_FOLLOW_WEATHER_ENTITY,
+    CONF_SIMULATION_MODE,
+    DOMAIN,
+    SIMULATION_MODE_INSTANT,
+)
+
+from .common import async_setup_units
+
+SOURCE = "climate.real"
+WEATHER = "weather.home"
+
+# Instant units do not tick, so only the sources move the ambient values
+INSTANT = {CONF_SIMULATION_MODE: SIMULATION_MODE_INSTANT}
+
+
+def _set_source(hass: HomeAssistant, temperature: float, humidity: float) -> None:
+    """Write the state of the source climate entity."""
+    hass.states.async_set(
+        SOURCE, "cool", {"current_temperature": temperature, "current_humidity": humidity}
+    )
+
+
+async def _async_follow(hass: HomeAssistant, **data) -> None:
+    """Make climate.unit follow the sources."""
+    await hass.services.async_call(
+        DOMAIN,
+        "sync_from_entities",
+        {"entity_id": "climate.unit", "follow": True, **data},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+
+async def test_follow_pushes_source_changes(hass: HomeAssistant) -> None:
+    """The unit takes the current values at once and every later change."""
+    _set_source(hass, 24.0, 55.0)
+    hass.states.async_set(WEATHER, "sunny", {"temperature": 31.0, "humidity": 40.0})
+    (entry,) = await async_setup_units(hass, ["Unit"], **INSTANT)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    await _async_follow(hass, climate_entity=SOURCE, weather_entity=WEATHER)
+    assert coordinator.current_temperature == 24.0
+    assert coordinator.current_humidity == 55.0
+    assert coordinator.external_temperature == 31.0
+    assert entry.options[CONF_FOLLOW_CLIMATE_ENTITY] == SOURCE
+    assert entry.options[CONF_FOLLOW_WEATHER_ENTITY] == WEATHER
+
+    _set_source(hass, 25.5, 50.0)
+    await hass.async_block_till_done()
+    assert coordinator.current_temperature == 25.5
+    assert coordinator.current_humidity == pytest.approx(50.0)
+
+
+async def test_follow_deadband(hass: HomeAssistant) -> None:
+    """Changes within the deadband of the applied value are ignored."""
+    _set_source(hass, 24.0, 55.0)
+    (entry,) = await async_setup_units(hass, ["Unit"], **INSTANT)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    await _async_follow(hass, climate_entity=SOURCE, deadband=0.5)
+
+    _set_source(hass, 24.3, 55.0)
+    await hass.async_block_till_done()
+    assert coordinator.current_temperature == 24.0
+
+    _set_source(hass, 24.6, 55.0)
+    await hass.async_block_till_done()
+    assert coordinator.current_temperature == 24.6
+
+
+async def test_follow_min_interval(hass: HomeAssistant, freezer) -> None:
+    """Changes arriving faster than the minimum interval are pushed together."""
+    _set_source(hass, 24.0, 55.0)
+    (entry,) = await async_setup_units(hass, ["Unit"], **INSTANT)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    await _async_follow(hass, climate_entity=SOURCE, min_interval=30)
+
+    _set_source(hass, 25.0, 55.0)
+    await hass.async_block_till_done()
+    _set_source(hass, 26.0, 52.0)
+    await hass.async_block_till_done()
+    assert coordinator.current_temperature == 24.0
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.current_temperature == 26.0
+    assert coordinator.current_humidity == pytest.approx(52.0)
+
+
+async def test_unfollow(hass: HomeAssistant) -> None:
+    """Following stops and the saved sources are forgotten."""
+    _set_source(hass, 24.0, 55.0)
+    (entry,) = await async_setup_units(hass, ["Unit"], **INSTANT)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    await _async_follow(hass, climate_entity=SOURCE)
+
+    await hass.services.async_call(
+        DOMAIN,
+        "sync_from_entities",
+        {"entity_id": "climate.unit", "follow": False},
+        blocking=True,
+    )
+    _set_source(hass, 27.0, 45.0)
+    await hass.async_block_till_done()
+    assert coordinator.current_temperature == 24.0
+    assert CONF_FOLLOW_CLIMATE_ENTITY not in entry.options
+
+
+async def test_follow_survives_reload(hass: HomeAssistant) -> None:
+    """A reloaded unit resumes following the saved sources."""
+    _set_source(hass, 24.0, 55.0)
+    (entry,) = await async_setup_units(hass, ["Unit"], **INSTANT)
+    await _async_follow(hass, climate_entity=SOURCE)
+
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    _set_source(hass, 22.5, 60.0)
+    await hass.async_block_till_done()
+    assert coordinator.current_temperature == 22.5
+    assert coordinator.current_humidity == pytest.approx(60.0)
@@ -0,0 +1,67 @@
+"""Tests for the psychrometric helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.virtual_ac.psychrometrics import (
+    moisture_content,
+    relative_humidity,
+    relative_humidity_slopes,
+    saturation_moisture,
+    saturation_vapor_pressure,
+)
+
+
+@pytest.mark.parametrize(
+    ("temperature", "pressure"),
+    [(-20.0, 1.2540), (0.0, 6.1121), (20.0, 23.388), (30.0, 42.455), (50.0, 123.44)],
+)
+def test_saturation_vapor_pressure(temperature: float, pressure: float) -> None:
+    """The Magnus formula stays within 0.4% of the reference values over water (hPa)."""
+    assert saturation_vapor_pressure(temperature) == pytest.approx(pressure, rel=4e-3)
+
+
+def test_moisture_content() -> None:
+    """Air at 20 °C and 50% holds about 7.26 g of water per kg of dry air."""
+    assert moisture_content(20.0, 50.0) == pytest.approx(7.26, abs=0.03)
+    assert saturation_moisture(20.0) == pytest.approx(moisture_content(20.0, 100.0))
+
+
+@pytest.mark.parametrize("temperature", [-10.0, 5.0, 22.0, 40.0])
+@pytest.mark.parametrize("humidity", [5.0, 50.0, 100.0])
+def test_round_trip(temperature: float, humidity: float) -> None:
+    """Relative humidity is recovered from the moisture content it gives."""
+    moisture = moisture_content(temperature, humidity)
+    assert relative_humidity(temperature, moisture) == pytest.approx(humidity)
+
+
+def test_cooling_raises_relative_humidity() -> None:
+    """The same air shows a higher relative humidity when it is cooler."""
+    moisture = moisture_content(25.0, 50.0)
+    assert relative_humidity(20.0, moisture) > 50.0 > relative_humidity(30.0, moisture)
+
+
+def test_slopes_match_finite_differences() -> None:
+    """The slopes are the derivatives of the relative humidity."""
+    temperature, moisture, delta = 23.0, 9.0, 1e-5
+    by_temperature, by_moisture = relative_humidity_slopes(temperature, moisture)
+
+    expected = (
+        relative_humidity(temperature + delta, moisture)
+        - relative_humidity(temperature - delta, moisture)
+    ) / (2 * delta)
+    assert by_temperature == pytest.approx(expected, rel=1e-6)
+    expected = (
+        relative_humidity(temperature, moisture + delta)
+        - relative_humidity(temperature, moisture - delta)
+    ) / (2 * delta)
+    assert by_moisture == pytest.approx(expected, rel=1e-6)
+
+
+def test_arrays() -> None:
+    """The helpers work element-wise on NumPy arrays."""
+    np = pytest.importorskip("numpy")
+    temperatures = np.array([10.0, 20.0, 30.0])
+    moisture = moisture_content(temperatures, np.array([40.0, 50.0, 60.0]))
+    assert relative_humidity(temperatures, moisture) == pytest.approx([40.0, 50.0, 60.0])
@@ -0,0 +1,96 @@
+"""Tests for scenario files played into Virtual AC units."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.virtual_ac.const import DOMAIN
+from custom_components.virtual_ac.scenario import ScenarioRow, parse_scenario, read_scenario
+
+from .common import async_setup_units
+
+
+def test_parse_minutes_and_values() -> None:
+    """Rows keep their minutes, unit and the values they set."""
+    rows = list(
+        parse_scenario(
+            [
+                {"minutes": "0", "external_temperature": "31.5", "door_open": "open"},
+                {"minutes": "15", "entity_id": "climate.unit", "heat_gain": "300", "door_open": ""},
+            ]
+        )
+    )
+    assert rows == [
+        ScenarioRow(0.0, None, {"external_temperature": 31.5, "door_open": True}),
+        ScenarioRow(15.0, "climate.unit", {"heat_gain": 300.0}),
+    ]
+
+
+def test_parse_times_from_first_row() -> None:
+    """Dates and times count from the first row."""
+    rows = parse_scenario(
+        [
+            {"time": "2024-07-01T12:00:00+02:00", "external_temperature": 30},
+            {"time": "2024-07-01T10:30:00Z", "external_temperature": 32},
+        ]
+    )
+    assert [row.minutes for row in rows] == [0.0, 30.0]
+
+
+@pytest.mark.parametrize(
+    ("records", "message"),
+    [
+        ([{"external_temperature": 30}], "Row 1: Scenario rows need"),
+        ([{"minutes": 5}, {"minutes": 1}], "Row 2 is earlier"),
+        ([{"minutes": 0, "door_open": "ajar"}], "Row 1: Invalid door_open"),
+        ([{"minutes": 0, "heat_gain": "lots"}], "Row 1:"),
+    ],
+)
+def test_parse_rejects_invalid_rows(records: list[dict], message: str) -> None:
+    """Invalid rows are reported with their number."""
+    with pytest.raises(ValueError, match=message):
+        list(parse_scenario(records))
+
+
+def test_read_csv_and_json_lines(tmp_path) -> None:
+    """CSV files and JSON Lines files give the same rows."""
+    csv_path = tmp_path / "day.csv"
+    csv_path.write_text("minutes,external_temperature\n0,25\n60,28\n", encoding="utf-8")
+    jsonl_path = tmp_path / "day.jsonl"
+    jsonl_path.write_text(
+        '{"minutes": 0, "external_temperature": 25}\n\n{"minutes": 60, "external_temperature": 28}\n',
+        encoding="utf-8",
+    )
+    assert list(read_scenario(str(csv_path))) == list(read_scenario(str(jsonl_path)))
+
+
+async def test_play_along_stepped_clock(hass: HomeAssistant, tmp_path) -> None:
+    """Each row is applied when the clock reaches it, also when stepping over it."""
+    path = tmp_path / "day.csv"
+    path.write_text("minutes,external_temperature\n0,30\n60,25\n120,20\n", encoding="utf-8")
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    (entry,) = await async_setup_units(hass, ["Unit"])
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    await hass.services.async_call(DOMAIN, "set_clock_speed", {"speed": 0}, blocking=True)
+    await hass.services.async_call(
+        DOMAIN, "play_scenario", {"entity_id": "climate.unit", "file": str(path)}, blocking=True
+    )
+    await hass.async_block_till_done()
+    assert coordinator.external_temperature == 30
+
+    await hass.services.async_call(
+        DOMAIN, "step_clock", {"duration": timedelta(minutes=90)}, blocking=True
+    )
+    await hass.async_block_till_done()
+    assert coordinator.external_temperature == 25
+
+    await hass.services.async_call(
+        DOMAIN, "step_clock", {"duration": timedelta(minutes=30)}, blocking=True
+    )
+    await hass.async_block_till_done()
+    assert coordinator.external_temperature == 20
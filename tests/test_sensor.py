@@ -0,0 +1,74 @@
+"""Tests for the Virtual AC sensors."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.virtual_ac.const import (
+    CONF_HUMIDITY_DEADBAND,
+    CONF_SIMULATION_MODE,
+    CONF_TEMPERATURE_DEADBAND,
+    DOMAIN,
+    SENSOR_SETTLE_TIME,
+    SIMULATION_MODE_INSTANT,
+)
+
+from .common import async_setup_units
+
+TEMPERATURE_SENSOR = "sensor.unit_indoor_temperature"
+HUMIDITY_SENSOR = "sensor.unit_indoor_humidity"
+
+# Instant units do not tick, so only the test moves the humidity
+INSTANT = {CONF_SIMULATION_MODE: SIMULATION_MODE_INSTANT}
+
+
+async def test_deadband_compares_rounded_value(hass: HomeAssistant) -> None:
+    """Changes hidden by the display precision are not written."""
+    (entry,) = await async_setup_units(
+        hass, ["Unit"], **INSTANT, **{CONF_TEMPERATURE_DEADBAND: 0.0}
+    )
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    coordinator.update(current_temperature=21.0)
+    await hass.async_block_till_done()
+    written = hass.states.get(TEMPERATURE_SENSOR).last_updated
+
+    coordinator.update(current_temperature=21.01)
+    await hass.async_block_till_done()
+    assert hass.states.get(TEMPERATURE_SENSOR).last_updated == written
+
+    coordinator.update(current_temperature=21.1)
+    await hass.async_block_till_done()
+    assert hass.states.get(TEMPERATURE_SENSOR).state == "21.1"
+
+
+async def test_deadband_writes_settled_value(hass: HomeAssistant, freezer) -> None:
+    """A value held back by the deadband is written once it stops changing."""
+    (entry,) = await async_setup_units(hass, ["Unit"], **INSTANT, **{CONF_HUMIDITY_DEADBAND: 0.5})
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    coordinator.update(current_humidity=48.0)
+    await hass.async_block_till_done()
+    assert hass.states.get(HUMIDITY_SENSOR).state == "48.0"
+
+    # Still changing halfway through: wait for it to settle
+    coordinator.update(current_humidity=48.2)
+    await hass.async_block_till_done()
+    freezer.tick(timedelta(seconds=SENSOR_SETTLE_TIME / 2))
+    async_fire_time_changed(hass)
+    coordinator.update(current_humidity=48.3)
+    await hass.async_block_till_done()
+
+    freezer.tick(timedelta(seconds=SENSOR_SETTLE_TIME / 2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(HUMIDITY_SENSOR).state == "48.0"
+
+    freezer.tick(timedelta(seconds=SENSOR_SETTLE_TIME / 2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(HUMIDITY_SENSOR).state == "48.3"
@@ -0,0 +1,116 @@
+"""Tests for the closed-form simulation engine of the simple model."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from homeassistant.components.climate import HVACMode
+
+from custom_components.virtual_ac.psychrometrics import moisture_content
+from custom_components.virtual_ac.simulation import (
+    SimulationParams,
+    SimulationState,
+    advance,
+    next_change_minutes,
+)
+
+_MODES = (
+    HVACMode.OFF,
+    HVACMode.COOL,
+    HVACMode.HEAT,
+    HVACMode.DRY,
+    HVACMode.FAN_ONLY,
+    HVACMode.AUTO,
+)
+
+
+def _params(**changes: float) -> SimulationParams:
+    """Return the parameters of a default unit with some of them changed."""
+    params = {
+        "target_temperature": 22.0,
+        "cooling_rate": 0.5,
+        "heating_rate": 0.5,
+        "dry_humidity_rate": 2.0,
+        "ambient_temperature": 20.0,
+        "ambient_humidity": 60.0,
+        "ambient_drift_rate": 0.1,
+        "fan_multiplier": 1.0,
+        "min_temp": 16.0,
+        "max_temp": 30.0,
+    }
+    return SimulationParams(**{**params, **changes})
+
+
+def _state(temperature: float, humidity: float = 50.0) -> SimulationState:
+    """Return the state at a temperature and relative humidity."""
+    return SimulationState(temperature, moisture_content(temperature, humidity))
+
+
+def test_cool_moves_at_cooling_rate_and_stops_at_target() -> None:
+    """COOL lowers the temperature at the cooling rate and holds the target."""
+    params = _params(target_temperature=20.0)
+
+    assert advance(HVACMode.COOL, _state(25.0), params, 4.0).temperature == pytest.approx(23.0)
+    assert advance(HVACMode.COOL, _state(25.0), params, 60.0).temperature == 20.0
+
+
+def test_fan_speed_scales_rate() -> None:
+    """A faster fan cools and heats faster."""
+    params = _params(target_temperature=20.0, fan_multiplier=1.5)
+    assert advance(HVACMode.HEAT, _state(18.0), params, 1.0).temperature == pytest.approx(18.75)
+    assert advance(HVACMode.COOL, _state(25.0), params, 2.0).temperature == pytest.approx(23.5)
+
+
+def test_off_drifts_towards_ambient() -> None:
+    """OFF drifts towards the ambient temperature without passing it."""
+    params = _params(ambient_temperature=26.0)
+    assert advance(HVACMode.OFF, _state(22.0), params, 10.0).temperature == pytest.approx(23.0)
+    assert advance(HVACMode.OFF, _state(22.0), params, 600.0).temperature == pytest.approx(26.0)
+
+
+def test_auto_stops_within_tolerance() -> None:
+    """AUTO does nothing while the temperature is close to the target."""
+    state = _state(22.3)
+    assert advance(HVACMode.AUTO, state, _params(), 30.0) == state
+    assert next_change_minutes(HVACMode.AUTO, state, _params(), 0.1) is None
+
+
+def test_split_steps_match_one_step() -> None:
+    """Advancing in several steps gives the state of one long step."""
+    rng = random.Random(1)
+    for _ in range(500):
+        params = _params(
+            target_temperature=rng.uniform(16, 30),
+            ambient_temperature=rng.uniform(-5, 40),
+            ambient_humidity=rng.uniform(10, 95),
+            fan_multiplier=rng.choice((0.5, 1.0, 1.5)),
+        )
+        hvac_mode = rng.choice(_MODES)
+        start = _state(rng.uniform(16, 30), rng.uniform(20, 90))
+        minutes = [rng.uniform(0, 20) for _ in range(4)]
+
+        split = start
+        for step in minutes:
+            split = advance(hvac_mode, split, params, step)
+        whole = advance(hvac_mode, start, params, sum(minutes))
+
+        assert split.temperature == pytest.approx(whole.temperature, abs=1e-9)
+        assert split.moisture == pytest.approx(whole.moisture, abs=1e-9)
+
+
+def test_next_change_is_one_display_step() -> None:
+    """The temperature moves one display step exactly when predicted."""
+    params = _params(target_temperature=18.0)
+    start = _state(24.0, 40.0)
+    minutes = next_change_minutes(HVACMode.COOL, start, params, 0.5, humidity_step=100.0)
+
+    assert minutes == pytest.approx(1.0)
+    assert advance(HVACMode.COOL, start, params, minutes).temperature == pytest.approx(23.5)
+
+
+def test_settled_unit_has_no_next_change() -> None:
+    """A unit that will not change again until an input does is not woken."""
+    state = _state(22.0)
+    assert next_change_minutes(HVACMode.FAN_ONLY, state, _params(), 0.1) is None
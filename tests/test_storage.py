@@ -0,0 +1,53 @@
+"""Tests for the saved simulation state of Virtual AC units."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN, HVACMode
+from homeassistant.core import HomeAssistant
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.virtual_ac.const import DATA_ENTITY_INDEX, DATA_STORE, DOMAIN
+
+from .common import async_setup_units
+
+
+async def test_state_survives_reload(hass: HomeAssistant, freezer) -> None:
+    """A reloaded unit resumes from its snapshot and catches up over the gap."""
+    (entry,) = await async_setup_units(hass, ["Unit"])
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        "set_hvac_mode",
+        {"entity_id": "climate.unit", "hvac_mode": HVACMode.COOL},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        "set_temperature",
+        {"entity_id": "climate.unit", "temperature": 18},
+        blocking=True,
+    )
+    climate = hass.data[DOMAIN][DATA_ENTITY_INDEX].get(entry.entry_id)
+    temperature = climate.current_temperature
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    snapshot = hass.data[DOMAIN][DATA_STORE].get(entry.entry_id)
+    assert snapshot["hvac_mode"] == HVACMode.COOL
+    assert snapshot["target_temperature"] == 18
+
+    # Two minutes pass while the unit is not loaded
+    freezer.tick(timedelta(minutes=2))
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    climate = hass.data[DOMAIN][DATA_ENTITY_INDEX].get(entry.entry_id)
+    assert climate.hvac_mode == HVACMode.COOL
+    assert climate.target_temperature == 18
+
+    # The first tick covers the time the unit was not loaded
+    freezer.tick(timedelta(seconds=climate.update_interval))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert climate.current_temperature < temperature - 0.5